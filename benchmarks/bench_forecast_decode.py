@@ -0,0 +1,61 @@
+"""Benchmark WeatherDataForecastREST decoding on the betterforecast REST fixtures.
+
+Usage:
+    python -m benchmarks.bench_forecast_decode [--seconds 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from weatherflow4py.models.decoder import compile_decoder
+from weatherflow4py.models.rest.forecast import WeatherDataForecastREST
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "tests" / "fixtures" / "rest" / "betterforecast"
+
+
+def load_forecasts() -> dict[str, dict]:
+    return {
+        path.name: json.loads(path.read_text())
+        for path in sorted(FIXTURES.glob("*.json"))
+    }
+
+
+def mean_seconds(decode: Callable[[dict], Any], data: dict, seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while (now := time.perf_counter()) < deadline:
+        decode(data)
+        count += 1
+    return (now - start) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    compiled_decoder = compile_decoder(WeatherDataForecastREST)
+    print(
+        f"{'fixture':<30}{'hourly':>8}{'from_dict ms':>14}{'compiled ms':>13}{'speedup':>10}"
+    )
+    for name, data in load_forecasts().items():
+        assert compiled_decoder(data) == WeatherDataForecastREST.from_dict(data)
+        baseline = mean_seconds(WeatherDataForecastREST.from_dict, data, args.seconds)
+        compiled = mean_seconds(compiled_decoder, data, args.seconds)
+        hourly = len(data.get("forecast", {}).get("hourly", ()))
+        print(
+            f"{name:<30}{hourly:>8}{baseline * 1e3:>14.2f}{compiled * 1e3:>13.3f}"
+            f"{baseline / compiled:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Report retained bytes per observation row: dataclass rows vs ``ObsArray``.
+
+Usage:
+    python -m benchmarks.bench_obs_memory [--rows 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from weatherflow4py.models.ws.custom_types import ObservationType
+from weatherflow4py.models.ws.obs import ObservationFactory
+
+SAMPLE_ROWS: dict[ObservationType, list[Any]] = {
+    ObservationType.OBS_ST: [
+        1709130791, 0.1, 0.25, 1.09, 249, 3, 793.3, -9.4, 93, 7987, 0.28, 67, 0.0,
+        0, 0, 0, 2.62, 1, 0.0, 0.0, 0.0, 0,
+    ],
+    ObservationType.OBS_SKY: [
+        1709130791, 7987, 0.28, 0.0, 0.1, 0.25, 1.09, 249, 3.41, 1, 67.0, 0.0,
+        0, 3, 0.0, 0.0, 0,
+    ],
+    ObservationType.OBS_AIR: [1709130791, 793.3, -9.4, 93, 0, 0.0, 3.46, 1],
+}  # fmt: skip
+
+
+def _payload(obs_type: ObservationType, rows: int) -> bytes:
+    """A JSON array of distinct rows, so decoded floats are separate objects."""
+    sample = SAMPLE_ROWS[obs_type]
+    rows_data = [
+        [sample[0] + i * 60]
+        + [v + i % 7 * 0.01 if isinstance(v, float) else v for v in sample[1:]]
+        for i in range(rows)
+    ]
+    return json.dumps(rows_data).encode()
+
+
+def retained_bytes(payload: bytes, build: Callable[[list[Any]], Any]) -> int:
+    """Bytes still allocated after decoding ``payload`` and keeping only ``build``'s result."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = build(json.loads(payload))
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'type':<10}{'dataclass B/row':>18}{'ObsArray B/row':>18}{'ratio':>8}")
+    for obs_type in SAMPLE_ROWS:
+        payload = _payload(obs_type, args.rows)
+        before = retained_bytes(
+            payload,
+            lambda rows, obs_type=obs_type: ObservationFactory.create_observation(
+                obs_type, rows
+            ),
+        )
+        after = retained_bytes(
+            payload,
+            lambda rows, obs_type=obs_type: (
+                ObservationFactory.create_compact_observation(obs_type, rows)
+            ),
+        )
+        print(
+            f"{obs_type.value:<10}{before / args.rows:>18,.0f}"
+            f"{after / args.rows:>18,.0f}{before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Run the decode, REST parsing and websocket latency benchmarks and emit JSON.
+
+Usage:
+    python -m benchmarks.bench_suite [--seconds 0.5] [--latency-frames 2000]
+        [--output results.json] [--compare previous.json]
+
+Measures:
+ - ``ws_decode``: ``WebsocketResponseBuilder.build_response`` messages/s per type, with
+   and without compiled decoders (fixtures from ``tests/fixtures/ws``)
+ - ``rest``: mean parse time and tracemalloc peak/retained bytes for
+   ``WeatherDataForecastREST``, ``ObservationStationREST`` and ``StationsResponseREST``
+   ``from_json`` on each REST fixture, and for the compiled forecast decoder
+ - ``latency``: frame-to-callback latency through ``listen()`` against a local
+   ``WeatherFlowSimulator``, from the frame's ``sent_at`` stamp to the callback
+
+``--compare`` prints every throughput or timing metric that moved by more than
+``--threshold`` against an earlier result file and exits non-zero on a regression.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import time
+import tomllib
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from benchmarks.bench_ws_decode import load_messages, messages_per_second
+from weatherflow4py.codec import get_codec
+from weatherflow4py.models.decoder import compile_decoder
+from weatherflow4py.models.rest.forecast import WeatherDataForecastREST
+from weatherflow4py.models.rest.observation import ObservationStationREST
+from weatherflow4py.models.rest.stations import StationsResponseREST
+from weatherflow4py.models.ws.websocket_response import RapidWindWS
+from weatherflow4py.simulator import WeatherFlowSimulator
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+ROOT = Path(__file__).resolve().parent.parent
+REST_FIXTURES = ROOT / "tests" / "fixtures" / "rest"
+REST_CASES: dict[str, tuple[Callable[[str], Any], str]] = {
+    "WeatherDataForecastREST": (
+        WeatherDataForecastREST.from_json,
+        "betterforecast/*.json",
+    ),
+    "WeatherDataForecastREST (compiled)": (
+        lambda payload: compile_decoder(WeatherDataForecastREST)(json.loads(payload)),
+        "betterforecast/*.json",
+    ),
+    "ObservationStationREST": (
+        ObservationStationREST.from_json,
+        "observations/station_id/*.json",
+    ),
+    "StationsResponseREST": (StationsResponseREST.from_json, "stations/*.json"),
+}
+
+
+def _version() -> str:
+    try:
+        return importlib.metadata.version("weatherflow4py")
+    except importlib.metadata.PackageNotFoundError:
+        with open(ROOT / "pyproject.toml", "rb") as file:
+            return tomllib.load(file)["project"]["version"]
+
+
+def bench_ws_decode(seconds: float) -> dict[str, dict[str, float]]:
+    results = {}
+    for message_type, messages in load_messages().items():
+        results[message_type] = {
+            "from_dict_msgs_per_sec": messages_per_second(messages, False, seconds),
+            "compiled_msgs_per_sec": messages_per_second(messages, True, seconds),
+        }
+    return results
+
+
+def _rest_fixtures() -> Iterator[tuple[str, Callable[[str], Any], Path]]:
+    for model, (parse, pattern) in REST_CASES.items():
+        for path in sorted(REST_FIXTURES.glob(pattern)):
+            yield model, parse, path
+
+
+def bench_rest_parse(
+    parse: Callable[[str], Any], payload: str, seconds: float
+) -> dict[str, float]:
+    """Mean time per ``parse(payload)`` and the memory one parse allocates."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = parse(payload)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    count = 0
+    start = time.perf_counter()
+    while (now := time.perf_counter()) - start < seconds:
+        parse(payload)
+        count += 1
+    return {
+        "mean_us": (now - start) / count * 1e6,
+        "peak_bytes": peak - baseline,
+        "retained_bytes": current - baseline,
+    }
+
+
+def bench_rest(seconds: float) -> dict[str, dict[str, dict[str, Any]]]:
+    """Parse metrics per model and fixture; a fixture that fails records ``error``."""
+    results: dict[str, dict[str, dict[str, Any]]] = {}
+    for model, parse, path in _rest_fixtures():
+        payload = path.read_text()
+        name = str(path.relative_to(REST_FIXTURES))
+        try:
+            parse(payload)
+        except Exception as err:
+            print(f"{model} cannot parse {name}: {err!r}", file=sys.stderr)
+            results.setdefault(model, {})[name] = {"error": repr(err)}
+            continue
+        results.setdefault(model, {})[name] = bench_rest_parse(parse, payload, seconds)
+    return results
+
+
+async def bench_latency(frames: int, devices: int, compiled: bool) -> dict[str, float]:
+    """Latency from the simulator's ``sent_at`` to the ``rapid_wind`` callback."""
+    samples: list[float] = []
+    done = asyncio.Event()
+
+    def on_wind(message: RapidWindWS) -> None:
+        samples.append(time.time() - message.unknown_fields["sent_at"])
+        if len(samples) >= frames:
+            done.set()
+
+    async with WeatherFlowSimulator(
+        devices=devices,
+        obs_interval=None,
+        rapid_wind_interval=devices / 2000,  # ~2000 frames/s in total
+        stamp_frames=True,
+    ) as simulator:
+        api = WeatherFlowWebsocketAPI(
+            "bench", uri=simulator.uri, compiled_decoders=compiled
+        )
+        api.register_wind_callback(on_wind)
+        await api.connect()
+        await api.subscribe_many(simulator.device_ids)
+        try:
+            await asyncio.wait_for(done.wait(), timeout=60)
+        finally:
+            await api.close()
+
+    samples.sort()
+    milliseconds = [sample * 1e3 for sample in samples]
+    return {
+        "frames": len(samples),
+        "p50_ms": statistics.median(milliseconds),
+        "p95_ms": milliseconds[int(len(milliseconds) * 0.95) - 1],
+        "p99_ms": milliseconds[int(len(milliseconds) * 0.99) - 1],
+        "max_ms": milliseconds[-1],
+    }
+
+
+def _metrics(results: dict, prefix: str = "") -> Iterator[tuple[str, float]]:
+    for key, value in results.items():
+        if isinstance(value, dict):
+            yield from _metrics(value, f"{prefix}{key}/")
+        elif isinstance(value, int | float) and not isinstance(value, bool):
+            yield f"{prefix}{key}", value
+
+
+def compare(previous: dict, current: dict, threshold: float) -> list[str]:
+    """Describe metrics that got worse by more than ``threshold`` (a fraction)."""
+    before = dict(_metrics(previous.get("results", {})))
+    regressions = []
+    for name, value in _metrics(current["results"]):
+        old = before.get(name)
+        if not old or name.endswith("frames"):
+            continue
+        # Throughput should not drop; times and latencies should not grow.
+        change = (old - value) / old if "per_sec" in name else (value - old) / old
+        if change > threshold:
+            regressions.append(f"{name}: {old:,.2f} -> {value:,.2f} ({change:+.0%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=0.5)
+    parser.add_argument("--latency-frames", type=int, default=2000)
+    parser.add_argument("--latency-devices", type=int, default=100)
+    parser.add_argument("--output", type=Path, help="write JSON here, not stdout")
+    parser.add_argument("--compare", type=Path, help="earlier JSON to check against")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = {
+        "ws_decode": bench_ws_decode(args.seconds),
+        "rest": bench_rest(args.seconds),
+        "latency": {
+            mode: asyncio.run(
+                bench_latency(args.latency_frames, args.latency_devices, compiled)
+            )
+            for mode, compiled in (("from_dict", False), ("compiled", True))
+        },
+    }
+    report = {
+        "version": _version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "codec": get_codec().name,
+        "timestamp": time.time(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(
+            json.loads(args.compare.read_text()), report, args.threshold
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
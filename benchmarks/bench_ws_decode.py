@@ -0,0 +1,62 @@
+"""Benchmark WebsocketResponseBuilder decoding on the tests/fixtures/ws payloads.
+
+Usage:
+    python -m benchmarks.bench_ws_decode [--seconds 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from weatherflow4py.models.ws.websocket_response import WebsocketResponseBuilder
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "ws"
+
+
+def load_messages() -> dict[str, list[dict]]:
+    """Group every decodable fixture message by its ``type``."""
+    grouped: dict[str, list[dict]] = {}
+    for path in sorted(FIXTURES.glob("*.json")):
+        data = json.loads(path.read_text())
+        for message in data if isinstance(data, list) else [data]:
+            try:
+                if WebsocketResponseBuilder.build_response(message) is None:
+                    continue
+            except ValueError:
+                continue
+            grouped.setdefault(message["type"], []).append(message)
+    return grouped
+
+
+def messages_per_second(messages: list[dict], compiled: bool, seconds: float) -> float:
+    build = WebsocketResponseBuilder.build_response
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while (now := time.perf_counter()) < deadline:
+        for message in messages:
+            build(message, compiled=compiled)
+        count += len(messages)
+    return count / (now - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{'type':<20}{'from_dict msg/s':>18}{'compiled msg/s':>18}{'speedup':>10}")
+    for message_type, messages in load_messages().items():
+        baseline = messages_per_second(messages, False, args.seconds)
+        compiled = messages_per_second(messages, True, args.seconds)
+        print(
+            f"{message_type:<20}{baseline:>18,.0f}{compiled:>18,.0f}"
+            f"{compiled / baseline:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,234 @@
+import asyncio
 import json
 import os
+from typing import Any, Self
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from websockets.connection import State as WebSocketState
+from websockets.exceptions import ConnectionClosedOK
 from weatherflow4py.api import WeatherFlowRestAPI
+from weatherflow4py.hub import WebsocketHub
+from weatherflow4py.ratelimit import TokenBucket
+from yarl import URL
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
 
+@pytest.fixture(autouse=True)
+def _fresh_rate_limits():
+    """Give every test its own per-token REST budget."""
+    TokenBucket.buckets.clear()
+    yield
+    TokenBucket.buckets.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_hubs():
+    """Start every test without shared websocket connections."""
+    WebsocketHub.hubs.clear()
+    yield
+    WebsocketHub.hubs.clear()
+
+
 def load_fixture(file_name):
     with open(os.path.join(dir_path, file_name)) as json_file:
         return json.load(json_file)
 
 
+def make_mock_websocket(messages: list[str] | None = None) -> MagicMock:
+    """Create a mock websocket that yields messages when iterated."""
+    mock_ws = AsyncMock()
+    mock_ws.state = WebSocketState.OPEN
+
+    if messages is not None:
+
+        async def _aiter():
+            for msg in messages:
+                yield msg
+
+        mock_ws.__aiter__ = lambda self: _aiter()
+        mock_ws.recv.side_effect = [*messages, ConnectionClosedOK(None, None)]
+
+    return mock_ws
+
+
+OBS_ST_MESSAGE = json.dumps(
+    {
+        "type": "obs_st",
+        "device_id": 12345,
+        "source": "enhanced",
+        "serial_number": "ST-00081234",
+        "hub_sn": "HB-00061234",
+        "firmware_revision": "165",
+        "summary": {
+            "pressure_trend": "steady",
+            "strike_count_1h": 0,
+            "strike_count_3h": 0,
+            "precip_total_1h": 0.0,
+            "strike_last_dist": 0,
+            "strike_last_epoch": None,
+            "precip_accum_local_yesterday": 0.0,
+            "precip_accum_local_yesterday_final": 0,
+            "precip_analysis_type_yesterday": 0,
+            "feels_like": 20.0,
+            "heat_index": 20.0,
+            "wind_chill": 20.0,
+        },
+        "obs": [
+            [
+                1709057252,
+                0.77,
+                2.07,
+                3.98,
+                58,
+                3,
+                1013.25,
+                20.5,
+                65,
+                10000,
+                3.5,
+                500,
+                0.0,
+                0,
+                5,
+                2,
+                2.85,
+                1,
+                0.0,
+                0.0,
+                0.0,
+                0,
+            ]
+        ],
+    }
+)
+
+RAPID_WIND_MESSAGE = json.dumps(
+    {
+        "type": "rapid_wind",
+        "device_id": 12345,
+        "ob": [1709057252, 2.5, 180],
+        "hub_sn": "HB-00061234",
+        "serial_number": "ST-00081234",
+    }
+)
+
+
+def make_wind_frame(device_id: int, epoch: int) -> str:
+    """A ``rapid_wind`` frame from ``device_id`` observed at ``epoch``."""
+    message = json.loads(RAPID_WIND_MESSAGE)
+    message["device_id"] = device_id
+    message["ob"][0] = epoch
+    return json.dumps(message)
+
+
+class FakeResponse:
+    def __init__(self, url: str, payload: dict[str, Any], status: int = 200) -> None:
+        self.url = URL(url)
+        self.payload = payload
+        self.status = status
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        if self.status < 400:
+            return
+        request_info = RequestInfo(
+            url=self.url,
+            method="GET",
+            headers=CIMultiDictProxy(CIMultiDict()),
+            real_url=self.url,
+        )
+        raise ClientResponseError(
+            request_info=request_info,
+            history=(),
+            status=self.status,
+            message="Unauthorized",
+        )
+
+    async def text(self) -> str:
+        return json.dumps(self.payload)
+
+    async def read(self) -> bytes:
+        return json.dumps(self.payload).encode()
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.responses: dict[
+            tuple[str, tuple[tuple[str, str], ...]], tuple[dict[str, Any], int]
+        ] = {}
+
+    def add(self, url: str, payload: dict[str, Any], status: int = 200) -> None:
+        parsed_url = URL(url)
+        self.responses[self._key(parsed_url)] = (payload, status)
+
+    def get(self, url: URL, params: dict[str, Any]) -> FakeResponse:
+        request_url = url.with_query(params)
+        payload, status = self.responses[self._key(request_url)]
+        return FakeResponse(str(request_url), payload, status)
+
+    @staticmethod
+    def _key(url: URL) -> tuple[str, tuple[tuple[str, str], ...]]:
+        base_url = str(url.with_query({}))
+        query = tuple(sorted(url.query.items()))
+        return base_url, query
+
+
+class FakeSocket:
+    """Acknowledges every request and serves frames pushed onto ``frames``."""
+
+    def __init__(self) -> None:
+        self.frames: asyncio.Queue = asyncio.Queue()
+        self.sent: list[dict] = []
+        self.state = WebSocketState.OPEN
+
+    async def send(self, raw: str) -> None:
+        request = json.loads(raw)
+        self.sent.append(request)
+        self.frames.put_nowait(json.dumps({"type": "ack", "id": request["id"]}))
+
+    async def recv(self, decode: bool = False):
+        frame = await self.frames.get()
+        if isinstance(frame, Exception):
+            raise frame
+        return frame.encode()
+
+    async def close(self) -> None:
+        self.state = WebSocketState.CLOSED
+        self.frames.put_nowait(ConnectionClosedOK(None, None))
+
+
+async def wait_until(predicate, timeout: float = 1.0) -> None:
+    """Poll ``predicate`` until it holds, failing after ``timeout`` seconds."""
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+
 @pytest.fixture
 def websocket_messages():
     return load_fixture("fixtures/ws/websocket_messages.json")
 
 
+@pytest.fixture
+def obs_st_rows(websocket_messages) -> list[list]:
+    """Every ``obs_st`` row in the websocket message fixture."""
+    return [
+        row
+        for message in websocket_messages
+        if message["type"] == "obs_st"
+        for row in message["obs"]
+    ]
+
+
 @pytest.fixture
 def websocket_winds():
     return load_fixture("fixtures/ws/ws_winds.json")
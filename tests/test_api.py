@@ -1,9 +1,11 @@
-import json
+import asyncio
+import copy
 from typing import Any, Self
+from unittest.mock import patch
 
+import aiohttp
 import pytest
-from aiohttp import ClientResponseError, RequestInfo
-from multidict import CIMultiDict, CIMultiDictProxy
+from aiohttp import ClientResponseError
 from yarl import URL
 
 from weatherflow4py.api import WeatherFlowRestAPI
@@ -14,59 +16,7 @@ from weatherflow4py.models.rest.forecast import WeatherDataForecastREST
 from weatherflow4py.models.rest.stations import StationsResponseREST
 from weatherflow4py.models.rest.unified import WeatherFlowDataREST
 
-
-class FakeResponse:
-    def __init__(self, url: str, payload: dict[str, Any], status: int = 200) -> None:
-        self.url = URL(url)
-        self.payload = payload
-        self.status = status
-
-    async def __aenter__(self) -> Self:
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        return None
-
-    def raise_for_status(self) -> None:
-        if self.status < 400:
-            return
-        request_info = RequestInfo(
-            url=self.url,
-            method="GET",
-            headers=CIMultiDictProxy(CIMultiDict()),
-            real_url=self.url,
-        )
-        raise ClientResponseError(
-            request_info=request_info,
-            history=(),
-            status=self.status,
-            message="Unauthorized",
-        )
-
-    async def text(self) -> str:
-        return json.dumps(self.payload)
-
-
-class FakeSession:
-    def __init__(self) -> None:
-        self.responses: dict[
-            tuple[str, tuple[tuple[str, str], ...]], tuple[dict[str, Any], int]
-        ] = {}
-
-    def add(self, url: str, payload: dict[str, Any], status: int = 200) -> None:
-        parsed_url = URL(url)
-        self.responses[self._key(parsed_url)] = (payload, status)
-
-    def get(self, url: URL, params: dict[str, Any]) -> FakeResponse:
-        request_url = url.with_query(params)
-        payload, status = self.responses[self._key(request_url)]
-        return FakeResponse(str(request_url), payload, status)
-
-    @staticmethod
-    def _key(url: URL) -> tuple[str, tuple[tuple[str, str], ...]]:
-        base_url = str(url.with_query({}))
-        query = tuple(sorted(url.query.items()))
-        return base_url, query
+from .conftest import FakeResponse, FakeSession
 
 
 @pytest.mark.asyncio
@@ -118,6 +68,9 @@ async def test_api_calls(
 
         assert data[24432].station.station_id == 24432
 
+    compiled = WeatherFlowRestAPI("mock_token", session=session, compiled_decoders=True)
+    assert await compiled.get_all_data(get_device_observations=True) == data
+
 
 @pytest.mark.asyncio
 async def test_api_calls_unauthorized(unauthorized_json):
@@ -138,3 +91,301 @@ async def test_api_calls_unauthorized(unauthorized_json):
 async def test_bad_token():
     with pytest.raises(TokenError):
         WeatherFlowRestAPI(None)  # type: ignore
+
+
+class SlowSession(FakeSession):
+    """Delays every response and records how many requests overlap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+    def get(self, url: URL, params: dict[str, Any]) -> FakeResponse:
+        response = super().get(url, params)
+        session = self
+
+        class Slow(FakeResponse):
+            async def __aenter__(self) -> Self:
+                session.requests += 1
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                await asyncio.sleep(0.01)
+                session.in_flight -= 1
+                return self
+
+        return Slow(str(response.url), response.payload, response.status)
+
+
+def _three_stations(session, stations_json, forecast, observation, device_obs):
+    stations = copy.deepcopy(stations_json)
+    stations["stations"] = [
+        {**stations_json["stations"][0], "station_id": station_id}
+        for station_id in (1, 2, 3)
+    ]
+    base = "https://swd.weatherflow.com/swd/rest"
+    session.add(f"{base}/stations?token=mock_token", stations)
+    session.add(f"{base}/observations/device/123456?token=mock_token", device_obs)
+    for station_id in (1, 2, 3):
+        session.add(
+            f"{base}/better_forecast?station_id={station_id}&token=mock_token",
+            forecast,
+        )
+    for station_id in (1, 3):  # station 2 has no observation endpoint
+        session.add(
+            f"{base}/observations/station/{station_id}?token=mock_token", observation
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_runs_concurrently_and_reports_failed_stations(
+    rest_betterforecast_1,
+    rest_stations_json,
+    rest_station_observation2,
+    rest_device_observation_1,
+):
+    session = SlowSession()
+    _three_stations(
+        session,
+        rest_stations_json,
+        rest_betterforecast_1,
+        rest_station_observation2,
+        rest_device_observation_1,
+    )
+
+    async with WeatherFlowRestAPI("mock_token", session=session) as api:
+        data = await api.get_all_data(get_device_observations=True, max_concurrency=4)
+
+    assert sorted(data) == [1, 3]
+    assert data[3].device_observations is not None
+    assert list(data.errors) == [2]
+    assert isinstance(data.errors[2], KeyError)
+    assert session.max_in_flight == 4
+    # The three stations share a device, so its observation requests may be coalesced.
+    assert 1 + 3 + 2 + 1 <= session.requests <= 1 + 3 * 3 - 1
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_respects_max_concurrency(
+    rest_betterforecast_1,
+    rest_stations_json,
+    rest_station_observation2,
+    rest_device_observation_1,
+):
+    session = SlowSession()
+    _three_stations(
+        session,
+        rest_stations_json,
+        rest_betterforecast_1,
+        rest_station_observation2,
+        rest_device_observation_1,
+    )
+    async with WeatherFlowRestAPI("mock_token", session=session) as api:
+        data = await api.get_all_data(max_concurrency=1)
+        with pytest.raises(ValueError):
+            await api.get_all_data(max_concurrency=0)
+
+    assert sorted(data) == [1, 3]
+    assert data[1].device_observations is None
+    assert session.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_station_without_outdoor_device(
+    rest_betterforecast_1,
+    rest_stations_json,
+    rest_station_observation2,
+    rest_device_observation_1,
+):
+    session = SlowSession()
+    _three_stations(
+        session,
+        rest_stations_json,
+        rest_betterforecast_1,
+        rest_station_observation2,
+        rest_device_observation_1,
+    )
+    stations = session.responses[
+        session._key(
+            URL("https://swd.weatherflow.com/swd/rest/stations?token=mock_token")
+        )
+    ][0]
+    stations["stations"][0]["devices"] = [
+        device
+        for device in stations["stations"][0]["devices"]
+        if device["device_type"] != "ST"
+    ]
+    async with WeatherFlowRestAPI("mock_token", session=session) as api:
+        created = []
+        for name in ("async_get_forecast", "async_get_observation"):
+
+            def tracked(method=getattr(api, name), **kwargs):
+                created.append(coro := method(**kwargs))
+                return coro
+
+            setattr(api, name, tracked)
+        data = await api.get_all_data(get_device_observations=True)
+
+    assert sorted(data) == [3]
+    assert isinstance(data.errors[1], IndexError)
+    # Every request coroutine that was created also ran; none is left unawaited.
+    assert len(created) == 4
+    assert all(coro.cr_frame is None for coro in created)
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_raises_when_every_station_fails(
+    rest_betterforecast_1, rest_stations_json
+):
+    session = FakeSession()
+    base = "https://swd.weatherflow.com/swd/rest"
+    session.add(f"{base}/stations?token=mock_token", rest_stations_json)
+    session.add(
+        f"{base}/better_forecast?station_id=24432&token=mock_token",
+        rest_betterforecast_1,
+    )
+    async with WeatherFlowRestAPI("mock_token", session=session) as api:
+        with pytest.raises(KeyError):  # no observation endpoint
+            await api.get_all_data()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_fetch(rest_station_observation2):
+    session = SlowSession()
+    session.add(
+        "https://swd.weatherflow.com/swd/rest/observations/station/1?token=t",
+        rest_station_observation2,
+    )
+    api = WeatherFlowRestAPI("t", session=session, burst=1)
+    results = await asyncio.gather(*(api.async_get_observation(1) for _ in range(5)))
+
+    assert session.requests == 1
+    assert all(result is results[0] for result in results)
+    assert api.coalesced == 4
+    assert api.rate_limiter.stats.requests == 1  # duplicates take no budget
+    assert not api._in_flight
+
+    await api.async_get_observation(1)  # a later call fetches again
+    assert session.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_shared_across_instances(
+    rest_station_observation2,
+):
+    session = SlowSession()
+    session.add(
+        "https://swd.weatherflow.com/swd/rest/observations/station/1?token=t",
+        rest_station_observation2,
+    )
+    first = WeatherFlowRestAPI("t", session=session)
+    second = WeatherFlowRestAPI("t", session=session)
+    other_token = WeatherFlowRestAPI("u", session=session)
+    one, two = await asyncio.gather(
+        first.async_get_observation(1), second.async_get_observation(1)
+    )
+
+    assert session.requests == 1
+    assert one is two
+    assert second.coalesced == 1
+    # A different token never shares a request (and has no response registered).
+    _, error = await asyncio.gather(
+        first.async_get_observation(1),
+        other_token.async_get_observation(1),
+        return_exceptions=True,
+    )
+    assert isinstance(error, KeyError)
+    assert session.requests == 2
+
+
+class ClosableSession(SlowSession):
+    """A ``SlowSession`` whose responses fail once it has been closed."""
+
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def get(self, url: URL, params: dict[str, Any]) -> FakeResponse:
+        response = super().get(url, params)
+        read = response.read
+
+        async def read_unless_closed() -> bytes:
+            if self.closed:
+                raise aiohttp.ClientConnectionError("Session is closed")
+            return await read()
+
+        response.read = read_unless_closed
+        return response
+
+
+@pytest.mark.asyncio
+async def test_closing_the_first_instance_lets_shared_requests_finish(
+    rest_station_observation2,
+):
+    session = ClosableSession()
+    session.add(
+        "https://swd.weatherflow.com/swd/rest/observations/station/1?token=t",
+        rest_station_observation2,
+    )
+    with patch("weatherflow4py.api.aiohttp.ClientSession", return_value=session):
+        first = WeatherFlowRestAPI("t")  # owns the session it creates
+        second = WeatherFlowRestAPI("t", session=SlowSession())
+        one = asyncio.ensure_future(first.async_get_observation(1))
+        await asyncio.sleep(0)
+        two = asyncio.ensure_future(second.async_get_observation(1))
+        await asyncio.sleep(0)
+
+        await first.close()
+
+    assert session.closed
+    assert second.coalesced == 1
+    assert await two is await one
+    assert session.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_with_different_decoders_are_not_shared(
+    rest_station_observation2,
+):
+    session = SlowSession()
+    session.add(
+        "https://swd.weatherflow.com/swd/rest/observations/station/1?token=t",
+        rest_station_observation2,
+    )
+    plain = WeatherFlowRestAPI("t", session=session)
+    compiled = WeatherFlowRestAPI("t", session=session, compiled_decoders=True)
+    one, two = await asyncio.gather(
+        plain.async_get_observation(1), compiled.async_get_observation(1)
+    )
+
+    assert one == two
+    assert session.requests == 2
+    assert compiled.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_share_errors_and_survive_cancellation(
+    rest_station_observation2,
+):
+    session = SlowSession()
+    api = WeatherFlowRestAPI("t", session=session)
+    failures = await asyncio.gather(
+        api.async_get_observation(2),
+        api.async_get_observation(2),
+        return_exceptions=True,
+    )
+    assert all(isinstance(failure, KeyError) for failure in failures)
+
+    session.add(
+        "https://swd.weatherflow.com/swd/rest/observations/station/1?token=t",
+        rest_station_observation2,
+    )
+    first = asyncio.create_task(api.async_get_observation(1))
+    second = asyncio.create_task(api.async_get_observation(1))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert (await second).station_id == 24432
+    assert first.cancelled()
+    assert session.requests == 1
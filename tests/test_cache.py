@@ -0,0 +1,147 @@
+"""Tests for the REST response cache."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from yarl import URL
+
+from weatherflow4py.api import WeatherFlowRestAPI
+from weatherflow4py.cache import CacheKey, ResponseCache
+
+from .conftest import FakeResponse, FakeSession
+
+BASE = "https://swd.weatherflow.com/swd/rest"
+
+
+class CountingSession(FakeSession):
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: list[str] = []
+
+    def get(self, url: URL, params: dict[str, Any]) -> FakeResponse:
+        self.requests.append(str(url))
+        return super().get(url, params)
+
+
+@pytest.fixture
+def session(rest_stations_json, rest_betterforecast_1, rest_station_observation2):
+    session = CountingSession()
+    session.add(f"{BASE}/stations?token=t", rest_stations_json)
+    for station_id in (1, 2):
+        session.add(
+            f"{BASE}/better_forecast?station_id={station_id}&token=t",
+            rest_betterforecast_1,
+        )
+    session.add(f"{BASE}/observations/station/1?token=t", rest_station_observation2)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_cached_endpoints_hit_the_network_once(session):
+    api = WeatherFlowRestAPI("t", session=session, cache=ResponseCache())
+    first = await api.async_get_stations()
+    assert await api.async_get_stations() is first
+    await api.async_get_forecast(1)
+    await api.async_get_forecast(1)
+    await api.async_get_forecast(2)
+    await api.async_get_observation(1)
+    await api.async_get_observation(1)  # not cached by default
+
+    assert len(session.requests) == 5
+    assert api.cache.stats.hits == 2
+    assert api.cache.stats.misses == 3
+    assert len(api.cache) == 3
+    assert api.cache.nbytes > 0
+
+
+@pytest.mark.asyncio
+async def test_stale_value_is_served_while_refreshing(session):
+    cache = ResponseCache(ttls={"stations": 0.01}, max_stale=60)
+    api = WeatherFlowRestAPI("t", session=session, cache=cache)
+    first = await api.async_get_stations()
+    await asyncio.sleep(0.02)
+
+    assert await api.async_get_stations() is first
+    assert await api.async_get_stations() is first  # one refresh in flight
+    await asyncio.sleep(0.01)
+    refreshed = await api.async_get_stations()
+    assert refreshed is not first
+    assert refreshed == first
+    assert len(session.requests) == 2
+    assert cache.stats.stale_hits == 2
+    assert cache.stats.refreshes == 1
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_beyond_max_stale_fetches_again(session):
+    cache = ResponseCache(ttls={"stations": 0.01}, max_stale=0)
+    api = WeatherFlowRestAPI("t", session=session, cache=cache)
+    first = await api.async_get_stations()
+    await asyncio.sleep(0.02)
+    assert await api.async_get_stations() is not first
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_the_stale_value(session):
+    cache = ResponseCache(ttls={"better_forecast": 0.01})
+    api = WeatherFlowRestAPI("t", session=session, cache=cache)
+    first = await api.async_get_forecast(1)
+    session.responses.clear()
+    await asyncio.sleep(0.02)
+    assert await api.async_get_forecast(1) is first
+    await asyncio.sleep(0.01)
+    assert cache.stats.refreshes == 0
+    assert await api.async_get_forecast(1) is first
+
+
+@pytest.mark.asyncio
+async def test_invalidate_per_key(session):
+    cache = ResponseCache()
+    api = WeatherFlowRestAPI("t", session=session, cache=cache)
+    await api.async_get_forecast(1)
+    await api.async_get_forecast(2)
+    assert cache.invalidate("better_forecast", {"station_id": 1}) == 1
+    await api.async_get_forecast(1)
+    await api.async_get_forecast(2)
+    assert len(session.requests) == 3
+    assert cache.invalidate("better_forecast") == 2
+    assert len(cache) == 0
+
+
+def test_entries_and_bytes_are_bounded():
+    def key(n):
+        return CacheKey("t", f"stations/{n}", (), None)
+
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.put(key(1), "a", 10)
+    cache.put(key(2), "b", 10)
+    cache.put(key(3), "c", 10)
+    assert key(1) not in cache and len(cache) == 2
+    cache.put(key(4), "d", 95)
+    assert list(cache._entries) == [key(4)]
+    assert cache.nbytes == 95
+    assert cache.stats.evictions == 3
+    cache.put(key(4), "too big", 101)  # larger than max_bytes: not stored at all
+    assert len(cache) == 0 and cache.nbytes == 0
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
+
+
+@pytest.mark.asyncio
+async def test_close_leaves_a_shared_cache_open(session):
+    shared = ResponseCache()
+    shared.close = AsyncMock()
+    await WeatherFlowRestAPI("t", session=session, cache=shared).close()
+    shared.close.assert_not_awaited()
+
+    api = WeatherFlowRestAPI("t", session=session, cache=True)
+    assert isinstance(api.cache, ResponseCache)
+    api.cache.close = AsyncMock()
+    await api.close()
+    api.cache.close.assert_awaited_once()
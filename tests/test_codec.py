@@ -0,0 +1,108 @@
+"""Tests for the shared JSON codec layer (codec.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from weatherflow4py import codec as codec_module
+from weatherflow4py.api import WeatherFlowRestAPI
+from weatherflow4py.codec import JsonCodec, get_codec, load_codec, set_codec
+from weatherflow4py.models.ws.types import LightingStrikeType
+from weatherflow4py.models.ws.websocket_request import (
+    GeoStrikeListenStartMessage,
+    ListenStartMessage,
+)
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import RAPID_WIND_MESSAGE, make_mock_websocket
+
+
+def _available(name: str) -> JsonCodec:
+    if name != "json":
+        pytest.importorskip(name)
+    return load_codec(name)
+
+
+@pytest.fixture(autouse=True)
+def _reset_default_codec():
+    yield
+    codec_module._default_codec = None
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_round_trip_from_bytes(name):
+    codec = _available(name)
+    payload = {"type": "rapid_wind", "device_id": 1, "ob": [1709141455, 1.07, 129]}
+
+    encoded = codec.dumps(payload)
+
+    assert isinstance(encoded, str)
+    assert codec.loads(encoded.encode()) == payload
+    assert codec.loads(encoded) == payload
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_encodes_str_enum(name):
+    codec = _available(name)
+    message = GeoStrikeListenStartMessage(1, 2, 3, 4, LightingStrikeType.ALL)
+    assert codec.loads(codec.dumps(message.to_dict()))["strike_type"] == "all"
+
+
+def test_load_codec_unknown_name():
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        load_codec("yaml")
+
+
+def test_load_codec_auto_detect_falls_back_to_stdlib(monkeypatch):
+    def _missing() -> JsonCodec:
+        raise ImportError
+
+    monkeypatch.setattr(
+        codec_module,
+        "CODECS",
+        {"orjson": _missing, "msgspec": _missing, "json": codec_module._stdlib_codec},
+    )
+    assert load_codec().name == "json"
+
+
+def test_set_codec_changes_default():
+    assert set_codec("json").name == "json"
+    assert get_codec().name == "json"
+    assert WeatherFlowWebsocketAPI("t").codec.name == "json"
+    assert WeatherFlowRestAPI("t").codec.name == "json"
+    assert (
+        ListenStartMessage("1", id="2098388936").json
+        == '{"type": "listen_start", "device_id": "1", "id": "2098388936"}'
+    )
+
+
+def test_set_codec_none_auto_detects():
+    assert set_codec(None) is get_codec()
+
+
+@pytest.mark.asyncio
+async def test_listen_decodes_bytes_frames():
+    api = WeatherFlowWebsocketAPI("t", codec=load_codec("json"))
+    received = []
+    api.register_wind_callback(received.append)
+    api.websocket = make_mock_websocket([RAPID_WIND_MESSAGE.encode()])
+
+    await api.listen()
+
+    assert received[0].device_id == 12345
+
+
+@pytest.mark.asyncio
+async def test_send_message_uses_instance_codec():
+    calls = []
+    codec = JsonCodec(
+        "test", load_codec("json").loads, lambda obj: calls.append(obj) or "{}"
+    )
+    api = WeatherFlowWebsocketAPI("t", codec=codec)
+    api.websocket = make_mock_websocket()
+
+    message = ListenStartMessage("1")
+    await api.send_message(message)
+
+    assert calls == [message.to_dict()]
+    api.websocket.send.assert_called_once_with("{}")
@@ -0,0 +1,101 @@
+"""Tests for the array-backed compact observation rows."""
+
+from __future__ import annotations
+
+import pytest
+
+from weatherflow4py.models.ws.custom_types import (
+    ObservationType,
+    PrecipitationAnalysisType,
+    PrecipitationType,
+)
+from weatherflow4py.models.ws.obs import (
+    CompactObsAir,
+    CompactObsSky,
+    CompactObsSt,
+    LazyObsSt,
+    ObsArray,
+    ObservationFactory,
+    obs_st,
+)
+
+ST_ROW = [
+    1709130791, 0.0, 0.25, 1.09, 249, 3, 793.3, -9.4, 93, 7987, 0.28, 67, 0.0,
+    1, 26, 2, 2.62, 1, 0.0, 0.0, 0.0, 2,
+]  # fmt: skip
+SKY_ROW = [1, 2, 3.0, 4.0, 5.0, 6.0, 7.0, 8, 9.0, 10, 11.0, 12.0, 1, 3, 1.0, 2.0, 0]
+AIR_ROW = [1, 1000.0, 20.0, 50, 0, 0.0, 3.4, 1]
+
+
+def test_compact_matches_dataclass_rows(obs_st_rows):
+    rows = obs_st_rows
+    compact = ObservationFactory.create_compact_observation(
+        ObservationType.OBS_ST, rows
+    )
+    full = ObservationFactory.create_observation(ObservationType.OBS_ST, rows)
+
+    assert len(compact) == len(rows)
+    assert compact == full
+    assert full == list(compact)
+    for view, row in zip(compact, full):
+        assert view == row
+        assert row == view
+        assert view.materialize() == row
+
+
+def test_compact_accessor_types():
+    row = ObsArray(ObservationType.OBS_ST, [ST_ROW])[0]
+    assert isinstance(row, CompactObsSt)
+    assert row.epoch == 1709130791
+    assert isinstance(row.epoch, int)
+    assert row.air_temperature == -9.4
+    assert row.precipitation_type is PrecipitationType.RAIN
+    assert row.precipitation_analysis_type is (
+        PrecipitationAnalysisType.RAIN_CHECK_WITH_USER_DISPLAY_OFF
+    )
+
+
+def test_compact_rows_are_slotted():
+    row = ObsArray(ObservationType.OBS_ST, [ST_ROW])[0]
+    assert not hasattr(row, "__dict__")
+
+
+def test_compact_null_readings_round_trip():
+    raw = list(ST_ROW)
+    raw[7] = None
+    row = ObsArray(ObservationType.OBS_ST, [raw])[0]
+    assert row.air_temperature is None
+    assert row == obs_st.from_list(raw)
+
+
+def test_obs_array_accepts_models_and_views():
+    array = ObsArray(ObservationType.OBS_ST)
+    array.append(obs_st.from_list(ST_ROW))
+    array.append(LazyObsSt(ST_ROW))
+    array.append(ObsArray(ObservationType.OBS_ST, [ST_ROW])[0])
+    assert len(array) == 3
+    assert array.nbytes == 3 * 22 * 8
+    assert all(row == obs_st.from_list(ST_ROW) for row in array)
+
+
+def test_obs_array_indexing():
+    array = ObsArray(ObservationType.OBS_AIR, [AIR_ROW, [2, *AIR_ROW[1:]]])
+    assert isinstance(array[0], CompactObsAir)
+    assert array[-1].epoch == 2
+    assert [row.epoch for row in array[0:2]] == [1, 2]
+    with pytest.raises(IndexError):
+        array[2]
+
+
+def test_obs_array_rejects_wrong_width():
+    with pytest.raises(ValueError, match="Expected 17 values"):
+        ObsArray(ObservationType.OBS_SKY, [AIR_ROW])
+
+
+def test_obs_sky_row():
+    row = ObsArray("obs_sky", [SKY_ROW])[0]
+    assert isinstance(row, CompactObsSky)
+    assert row.wind_avg == 6.0
+    assert row.precipitation_type == 1  # obs_sky keeps the raw value
+    assert row == row.materialize()
+    assert row.__eq__("nope") is NotImplemented
@@ -0,0 +1,163 @@
+"""Tests for the compiled model decoders (models/decoder.py)."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import FrozenInstanceError, dataclass, field
+
+import pytest
+from dataclasses_json import config, dataclass_json
+
+from weatherflow4py.models.decoder import compile_decoder, decoder_for
+from weatherflow4py.models.rest.device import Summary
+from weatherflow4py.models.rest.forecast import (
+    ForecastDaily,
+    PrecipType,
+    WeatherDataForecastREST,
+)
+from weatherflow4py.models.ws.custom_types import PrecipitationAnalysisType
+from weatherflow4py.models.ws.obs import obs_st
+from weatherflow4py.models.ws.websocket_response import (
+    ObservationTempestWS,
+    RapidWindWS,
+    WebsocketResponseBuilder,
+)
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import OBS_ST_MESSAGE, load_fixture, make_mock_websocket
+
+FORECAST_FIXTURES = [
+    f"fixtures/rest/betterforecast/{name}.json"
+    for name in (
+        "forecast",
+        "forecast2",
+        "forecast3",
+        "forecast4",
+        "forecast5",
+        "forecast6",
+        "forecast_missing_fields",
+    )
+]
+WS_FIXTURES = [
+    "fixtures/ws/websocket_messages.json",
+    "fixtures/ws/ws_connection_open.json",
+    "fixtures/ws/ws_status.json",
+    "fixtures/ws/ws_strike.json",
+    "fixtures/ws/ws_winds.json",
+]
+
+
+def _ws_messages() -> list[dict]:
+    messages = []
+    for name in WS_FIXTURES:
+        data = load_fixture(name)
+        messages.extend(data if isinstance(data, list) else [data])
+    return messages
+
+
+def _build(message: dict, compiled: bool):
+    try:
+        return WebsocketResponseBuilder.build_response(message, compiled=compiled)
+    except ValueError as err:
+        return type(err)
+
+
+@pytest.mark.parametrize("message", _ws_messages(), ids=lambda m: m["type"])
+def test_compiled_matches_from_dict(message):
+    assert _build(message, compiled=True) == _build(message, compiled=False)
+
+
+def test_compiled_obs_st_types():
+    obs = WebsocketResponseBuilder.build_response(
+        json.loads(OBS_ST_MESSAGE), compiled=True
+    )
+    assert isinstance(obs, ObservationTempestWS)
+    assert isinstance(obs.first, obs_st)
+    assert isinstance(obs.summary, Summary)
+    assert obs.summary.precip_analysis_type_yesterday is PrecipitationAnalysisType.NONE
+    assert obs.unknown_fields == {}
+
+
+def test_compiled_collects_unknown_fields(websocket_strike):
+    strike = WebsocketResponseBuilder.build_response(websocket_strike, compiled=True)
+    assert strike.unknown_fields == {
+        "hub_sn": "HB-00061234",
+        "serial_number": "ST-00081234",
+        "source": "enhanced",
+    }
+
+
+def test_compiled_decoder_is_cached():
+    assert compile_decoder(RapidWindWS) is compile_decoder(RapidWindWS)
+
+
+def test_compiled_missing_key_raises_key_error():
+    with pytest.raises(KeyError):
+        compile_decoder(RapidWindWS)({"type": "rapid_wind", "ob": [1, 2, 3]})
+
+
+def test_compiled_bad_enum_raises_value_error():
+    summary = load_fixture("fixtures/ws/ws_status.json")["summary"]
+    summary["precip_analysis_type_yesterday"] = 42
+    with pytest.raises(ValueError):
+        compile_decoder(Summary)(summary)
+
+
+def test_compile_rejects_non_dataclass():
+    with pytest.raises(TypeError):
+        compile_decoder(dict)
+
+
+@pytest.mark.parametrize("name", FORECAST_FIXTURES)
+def test_compiled_forecast_matches_from_dict(name):
+    compiled = compile_decoder(WeatherDataForecastREST)(load_fixture(name))
+    expected = WeatherDataForecastREST.from_dict(load_fixture(name))
+    assert compiled == expected
+    for hourly, expected_hourly in zip(
+        compiled.forecast.hourly, expected.forecast.hourly
+    ):
+        assert type(hourly.precip_type) is type(expected_hourly.precip_type)
+        assert type(hourly.icon) is type(expected_hourly.icon)
+
+
+def test_compiled_forecast_is_frozen():
+    forecast = compile_decoder(WeatherDataForecastREST)(
+        load_fixture(FORECAST_FIXTURES[0])
+    )
+    with pytest.raises(FrozenInstanceError):
+        forecast.station_id = 1
+
+
+def test_compiled_field_decoder_override():
+    daily = load_fixture(FORECAST_FIXTURES[0])["forecast"]["daily"][0]
+    decode = compile_decoder(ForecastDaily)
+    assert decode({**daily, "precip_type": "rain"}).precip_type is PrecipType.RAIN
+    assert decode({**daily, "precip_type": None}).precip_type is None
+    missing = {key: value for key, value in daily.items() if key != "precip_type"}
+    assert decode(missing).precip_type is PrecipType.NONE
+    assert decode(missing) == ForecastDaily.from_dict(missing)
+
+
+def test_compile_rejects_renamed_fields():
+    @dataclass_json
+    @dataclass
+    class WithOverride:
+        value: int = field(metadata=config(field_name="Value"))
+
+    with pytest.raises(TypeError):
+        compile_decoder(WithOverride)
+    assert decoder_for(WithOverride)({"Value": 1}) == WithOverride(1)
+
+
+@pytest.mark.asyncio
+async def test_listen_with_compiled_decoders():
+    api = WeatherFlowWebsocketAPI("t", compiled_decoders=True)
+    received = []
+    api.register_observation_callback(received.append)
+    api.websocket = make_mock_websocket([OBS_ST_MESSAGE])
+
+    await api.listen()
+
+    assert received == [
+        WebsocketResponseBuilder.build_response(json.loads(OBS_ST_MESSAGE))
+    ]
@@ -0,0 +1,284 @@
+"""Tests for the bounded callback dispatcher (dispatch.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from weatherflow4py.dispatch import (
+    BackpressurePolicy,
+    CallbackDispatcher,
+    DispatchQueue,
+    ExecutorCallback,
+    ThrottledCallback,
+)
+from weatherflow4py.history import DeviceHistory
+from weatherflow4py.models.ws.websocket_response import RapidWindWS
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import make_mock_websocket, make_wind_frame
+
+
+def test_queue_rejects_zero_size():
+    with pytest.raises(ValueError):
+        DispatchQueue(0, BackpressurePolicy.BLOCK)
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_discards_incoming():
+    queue = DispatchQueue(2, BackpressurePolicy.DROP_NEWEST)
+    assert await queue.put(1)
+    assert await queue.put(2)
+    assert not await queue.put(3)
+    assert [await queue.get(), await queue.get()] == [1, 2]
+    assert queue.stats.dropped == 1
+    assert queue.stats.max_depth == 2
+    assert queue.stats.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_evicts_head():
+    queue = DispatchQueue(2, BackpressurePolicy.DROP_OLDEST)
+    for item in (1, 2, 3):
+        assert await queue.put(item)
+    assert [await queue.get(), await queue.get()] == [2, 3]
+    assert queue.stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_latest_keeps_one_pending_per_key():
+    queue = DispatchQueue(10, BackpressurePolicy.COALESCE_LATEST)
+    await queue.put("a1", key="a")
+    await queue.put("b1", key="b")
+    await queue.put("a2", key="a")
+    assert len(queue) == 2
+    # The replacement keeps the original position in the queue.
+    assert [await queue.get(), await queue.get()] == ["a2", "b1"]
+    assert queue.stats.coalesced == 1
+    assert queue.stats.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_consumer():
+    queue = DispatchQueue(1, BackpressurePolicy.BLOCK)
+    await queue.put(1)
+    blocked = asyncio.create_task(queue.put(2))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert await queue.get() == 1
+    assert await blocked
+    assert await queue.get() == 2
+    assert queue.stats.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_survives_callback_errors():
+    received = []
+
+    def callback(payload):
+        if payload == "boom":
+            raise RuntimeError(payload)
+        received.append(payload)
+
+    dispatcher = CallbackDispatcher(lambda _: callback, maxsize=4)
+    await dispatcher.submit("rapid_wind", "boom")
+    await dispatcher.submit("rapid_wind", "ok")
+    await dispatcher.join()
+    assert received == ["ok"]
+    assert dispatcher.stats()["rapid_wind"].delivered == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_join_waits_without_polling():
+    release = asyncio.Event()
+    received = []
+
+    async def slow(payload):
+        await release.wait()
+        received.append(payload)
+
+    dispatcher = CallbackDispatcher(lambda _: slow)
+    await dispatcher.submit("rapid_wind", 1)
+    await dispatcher.submit("rapid_wind", 2)
+    with patch("asyncio.sleep", side_effect=AssertionError("join polled")):
+        join = asyncio.create_task(dispatcher.join())
+        done, _ = await asyncio.wait({join}, timeout=0.02)
+        assert not done
+        release.set()
+        await asyncio.wait_for(join, timeout=1)
+    assert received == [1, 2]
+
+    await dispatcher.submit("rapid_wind", 3)
+    await dispatcher.close()
+    await asyncio.wait_for(dispatcher.join(), timeout=1)  # closed: nothing to wait for
+    await dispatcher.close()
+    assert dispatcher.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_does_not_stall_reader():
+    """A blocked consumer with DROP_OLDEST lets listen() drain the socket."""
+    release = asyncio.Event()
+    received: list[RapidWindWS] = []
+
+    async def wind_cb(msg):
+        await release.wait()
+        received.append(msg)
+
+    api = WeatherFlowWebsocketAPI(
+        "t", dispatch_queue_size=2, backpressure=BackpressurePolicy.DROP_OLDEST
+    )
+    api.register_wind_callback(wind_cb)
+    api.websocket = make_mock_websocket(
+        [make_wind_frame(1, epoch) for epoch in range(6)]
+    )
+
+    await asyncio.wait_for(api.listen(), timeout=1)
+    stats = api.dispatch_stats()["rapid_wind"]
+    assert stats.enqueued == 6
+    assert stats.max_depth == 2
+    assert stats.dropped > 0
+
+    release.set()
+    await api.dispatcher.join()
+    assert received[-1].ob.epoch == 5
+    assert len(received) == stats.enqueued - stats.dropped
+    await api.dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_latest_per_device_through_listen():
+    release = asyncio.Event()
+    received: list[RapidWindWS] = []
+
+    async def wind_cb(msg):
+        await release.wait()
+        received.append(msg)
+
+    api = WeatherFlowWebsocketAPI(
+        "t", dispatch_queue_size=10, backpressure=BackpressurePolicy.COALESCE_LATEST
+    )
+    api.register_wind_callback(wind_cb)
+    frames = [make_wind_frame(device, epoch) for epoch in range(3) for device in (1, 2)]
+    api.websocket = make_mock_websocket(frames)
+
+    await api.listen()
+    release.set()
+    await api.dispatcher.join()
+    # The first frame is picked up by the worker; the rest collapse to the newest per device.
+    latest = {msg.device_id: msg.ob.epoch for msg in received}
+    assert latest == {1: 2, 2: 2}
+    assert api.dispatch_stats()["rapid_wind"].coalesced > 0
+    await api.dispatcher.close()
+
+
+def test_dispatch_stats_empty_without_queue():
+    assert WeatherFlowWebsocketAPI("t").dispatch_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_executor_callback_keeps_per_device_order():
+    seen: list[tuple[int, int]] = []
+    threads = set()
+
+    def blocking_cb(msg):
+        # Later epochs sleep less, so unordered execution would reverse them.
+        time.sleep((3 - msg.ob.epoch) * 0.01)
+        threads.add(threading.get_ident())
+        seen.append((msg.device_id, msg.ob.epoch))
+
+    api = WeatherFlowWebsocketAPI("t")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        api.register_wind_callback(blocking_cb, executor=executor)
+        wrapper = api.callbacks["rapid_wind"]
+        assert isinstance(wrapper, ExecutorCallback)
+        frames = [
+            make_wind_frame(device, epoch) for epoch in range(3) for device in (1, 2)
+        ]
+        api.websocket = make_mock_websocket(frames)
+
+        await api.listen()
+        # The reader returned before the blocking callbacks finished.
+        assert wrapper.pending > 0
+        await wrapper.join()
+
+    assert threading.get_ident() not in threads
+    for device in (1, 2):
+        assert [epoch for dev, epoch in seen if dev == device] == [0, 1, 2]
+    assert wrapper.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_callback_logs_errors_and_continues(caplog):
+    seen = []
+
+    def callback(payload):
+        if payload["n"] == 0:
+            raise RuntimeError("boom")
+        seen.append(payload["n"])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        wrapper = ExecutorCallback(callback, executor)
+        wrapper({"device_id": 1, "n": 0})
+        wrapper({"device_id": 1, "n": 1})
+        await wrapper.join()
+
+    assert seen == [1]
+    assert "boom" in caplog.text
+
+
+def test_executor_callback_rejects_coroutines():
+    async def callback(_):
+        return None
+
+    with ThreadPoolExecutor(max_workers=1) as executor, pytest.raises(TypeError):
+        ExecutorCallback(callback, executor)
+
+
+@pytest.mark.asyncio
+async def test_throttled_callback_delivers_newest_per_device():
+    received: list[tuple[int, int]] = []
+    api = WeatherFlowWebsocketAPI("t", history=DeviceHistory())
+    api.register_wind_callback(
+        lambda msg: received.append((msg.device_id, msg.ob.epoch)), min_interval=0.05
+    )
+    throttled = api.callbacks["rapid_wind"]
+    assert isinstance(throttled, ThrottledCallback)
+
+    frames = [make_wind_frame(device, epoch) for epoch in range(5) for device in (1, 2)]
+    api.websocket = make_mock_websocket(frames)
+    await api.listen()
+
+    # The first sample per device goes out immediately, the rest collapse to the newest.
+    assert received == [(1, 0), (2, 0)]
+    assert throttled.pending == 2
+    assert throttled.coalesced == 6
+    await asyncio.sleep(0.08)
+    assert sorted(received[2:]) == [(1, 4), (2, 4)]
+    assert throttled.delivered == 4 and throttled.pending == 0
+    # Every sample still reached the history.
+    assert len(api.history.get(1, "rapid_wind")) == 5
+
+
+@pytest.mark.asyncio
+async def test_throttled_async_callback_and_cancel():
+    received = []
+
+    async def callback(payload):
+        received.append(payload["n"])
+
+    throttled = ThrottledCallback(callback, min_interval=10)
+    throttled({"device_id": 1, "n": 1})
+    throttled({"device_id": 1, "n": 2})
+    await asyncio.sleep(0)
+    assert received == [1]
+    throttled.cancel()
+    assert throttled.pending == 0
+
+    with pytest.raises(ValueError):
+        ThrottledCallback(callback, min_interval=0)
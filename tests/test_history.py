@@ -0,0 +1,90 @@
+"""Tests for the ring-buffer history (history.py)."""
+
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from weatherflow4py.history import OBS_ST_COLUMNS, DeviceHistory, RingBuffer
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import OBS_ST_MESSAGE, make_mock_websocket, make_wind_frame
+
+
+def test_ring_buffer_validates_layout():
+    with pytest.raises(ValueError):
+        RingBuffer(("epoch",), 0)
+    with pytest.raises(ValueError):
+        RingBuffer(("speed", "epoch"), 4)
+    with pytest.raises(ValueError):
+        RingBuffer(("epoch", "speed"), 4).append([1])
+
+
+def test_ring_buffer_wraps_with_fixed_memory():
+    buffer = RingBuffer(("epoch", "speed"), capacity=4)
+    nbytes = buffer.nbytes
+    assert nbytes == 4 * 2 * 8
+
+    for epoch in range(10):
+        buffer.append([epoch, epoch / 10])
+
+    assert len(buffer) == 4
+    assert buffer.nbytes == nbytes
+    assert list(buffer.snapshot()["epoch"]) == [6, 7, 8, 9]
+    assert buffer.latest() == {"epoch": 9, "speed": 0.9}
+
+
+def test_ring_buffer_time_range_across_wrap():
+    buffer = RingBuffer(("epoch", "speed"), capacity=5)
+    buffer.extend([epoch * 3, epoch] for epoch in range(8))  # epochs 9..21 stored
+
+    assert list(buffer.between(10, 18)["epoch"]) == [12, 15, 18]
+    assert list(buffer.between(0, 9)["speed"]) == [3]
+    assert len(buffer.between(100, 200)["epoch"]) == 0
+    assert list(buffer.between(0, 100)["epoch"]) == [9, 12, 15, 18, 21]
+
+
+def test_ring_buffer_skips_out_of_order_and_converts_nulls():
+    buffer = RingBuffer(("epoch", "value"), capacity=3)
+    assert buffer.append([10, None])
+    assert not buffer.append([5, 1])
+    assert buffer.out_of_order == 1
+    assert math.isnan(buffer.latest()["value"])
+
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.latest() is None
+
+
+def test_device_history_records_raw_frames():
+    history = DeviceHistory(rapid_wind_capacity=3, obs_st_capacity=2, max_devices=3)
+    for epoch in range(5):
+        assert history.record(json.loads(make_wind_frame(1, epoch)))
+    assert history.record(json.loads(OBS_ST_MESSAGE))
+    assert not history.record({"type": "evt_precip", "device_id": 1})
+    assert history.record(json.loads(make_wind_frame(2, 0)))
+    assert not history.record(json.loads(make_wind_frame(3, 0)))  # over max_devices
+
+    wind = history.get(1, "rapid_wind")
+    assert list(wind.snapshot()["epoch"]) == [2, 3, 4]
+    assert list(history.between(1, "rapid_wind", 3, 10)["wind_speed"]) == [2.5, 2.5]
+    obs = history.get(12345, "obs_st").latest()
+    assert tuple(obs) == OBS_ST_COLUMNS
+    assert obs["air_temperature"] == 20.5
+    assert history.between(99, "obs_st", 0, 1)["epoch"].tolist() == []
+    assert sorted(history.devices()) == [1, 2, 12345]
+    assert history.nbytes == 2 * 3 * 3 * 8 + 2 * 22 * 8
+
+
+@pytest.mark.asyncio
+async def test_listen_feeds_history():
+    api = WeatherFlowWebsocketAPI("t", history=DeviceHistory())
+    api.websocket = make_mock_websocket(
+        [make_wind_frame(7, 1), make_wind_frame(7, 2), OBS_ST_MESSAGE]
+    )
+
+    await api.listen()
+
+    assert list(api.history.get(7, "rapid_wind").snapshot()["epoch"]) == [1, 2]
+    assert len(api.history.get(12345, "obs_st")) == 1
@@ -0,0 +1,185 @@
+"""Tests for the shared connection hub (hub.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from weatherflow4py.hub import WebsocketHub
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import FakeSocket, make_wind_frame, wait_until
+
+
+@pytest.mark.asyncio
+async def test_hub_shares_one_reader_and_routes_by_device():
+    socket = FakeSocket()
+    api1 = WeatherFlowWebsocketAPI("t")
+    api2 = WeatherFlowWebsocketAPI("t")
+    received: dict[str, list[int]] = {"api1": [], "api2": []}
+    api1.register_wind_callback(lambda msg: received["api1"].append(msg.device_id))
+    api2.register_wind_callback(lambda msg: received["api2"].append(msg.device_id))
+
+    with patch(
+        "weatherflow4py.ws.websockets.connect", new_callable=AsyncMock
+    ) as connect:
+        connect.return_value = socket
+        await api1.connect()
+        await api2.connect()
+
+    connect.assert_called_once()
+    assert api1.listen_task is api2.listen_task
+    hub = api1.hub
+    assert hub is api2.hub and hub.members == [api1, api2]
+
+    assert (await api1.subscribe_many([1])).ok
+    assert len(socket.sent) == 2
+    # Device 1 is already subscribed on the connection; only device 2 goes out.
+    result = await api2.subscribe_many([1, 2])
+    assert result.acknowledged == [1, 2]
+    assert {(r["type"], r["device_id"]) for r in socket.sent[2:]} == {
+        ("listen_start", 2),
+        ("listen_rapid_start", 2),
+    }
+
+    socket.frames.put_nowait(make_wind_frame(1, 0))
+    socket.frames.put_nowait(make_wind_frame(2, 0))
+    socket.frames.put_nowait(make_wind_frame(3, 0))
+    await wait_until(lambda: len(received["api2"]) == 2)
+    assert received == {"api1": [1], "api2": [1, 2]}
+
+    # api1 leaving does not unsubscribe device 1, which api2 still uses.
+    sent_before = len(socket.sent)
+    await api1.close()
+    assert len(socket.sent) == sent_before
+    assert api1.hub is None
+    assert hub.members == [api2]
+    assert socket.state.name == "OPEN"
+
+    await api2.close()
+    stops = {(r["type"], r["device_id"]) for r in socket.sent[sent_before:]}
+    assert stops == {
+        ("listen_stop", 1),
+        ("listen_rapid_stop", 1),
+        ("listen_stop", 2),
+        ("listen_rapid_stop", 2),
+    }
+    assert socket.state.name == "CLOSED"
+    assert WebsocketHub.hubs == {}
+    assert hub.reader_task.done()
+
+
+@pytest.mark.asyncio
+async def test_hub_routes_acks_to_the_waiting_instance():
+    hub = WebsocketHub("wss://example")
+    api1 = WeatherFlowWebsocketAPI("t")
+    api2 = WeatherFlowWebsocketAPI("t")
+    hub.attach(api1)
+    hub.attach(api2)
+    loop = asyncio.get_running_loop()
+    api2.pending_acks["42"] = loop.create_future()
+
+    assert hub.recipients({"type": "ack", "id": "42"}) == [api2]
+    assert hub.recipients({"type": "ack", "id": "7"}) == [api1, api2]
+    assert hub.recipients({"type": "connection_opened"}) == [api1, api2]
+
+    await hub.route({"type": "ack", "id": "42"})
+    assert api2.pending_acks["42"].result().id == "42"
+
+
+@pytest.mark.asyncio
+async def test_hub_reconnect_resubscribes_and_repoints_members():
+    sockets = [FakeSocket(), FakeSocket()]
+    api1 = WeatherFlowWebsocketAPI("t")
+    api2 = WeatherFlowWebsocketAPI("t")
+    received: dict[str, list[int]] = {"api1": [], "api2": []}
+    api1.register_wind_callback(lambda msg: received["api1"].append(msg.device_id))
+    api2.register_wind_callback(lambda msg: received["api2"].append(msg.device_id))
+
+    with patch(
+        "weatherflow4py.ws.websockets.connect", new_callable=AsyncMock
+    ) as connect:
+        connect.side_effect = sockets
+        await api1.connect()
+        assert (await api1.subscribe_many([1])).ok
+        await sockets[0].close()
+        await wait_until(lambda: api1.hub.reader_task.done())
+
+        await api2.connect()
+
+    assert api1.websocket is api2.websocket is sockets[1]
+    assert api1.listen_task is api2.listen_task is api1.hub.reader_task
+    # api1's subscription is replayed on the new socket before api2 joins it.
+    assert {(r["type"], r["device_id"]) for r in sockets[1].sent} == {
+        ("listen_start", 1),
+        ("listen_rapid_start", 1),
+    }
+    assert (await api2.subscribe_many([1])).ok
+    assert len(sockets[1].sent) == 2
+
+    sockets[1].frames.put_nowait(make_wind_frame(1, 0))
+    await wait_until(lambda: received["api1"] and received["api2"])
+    assert received == {"api1": [1], "api2": [1]}
+    await api1.close()
+    await api2.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_reader_skips_malformed_frames():
+    socket = FakeSocket()
+    api = WeatherFlowWebsocketAPI("t")
+    received = []
+    api.register_wind_callback(received.append)
+    with patch(
+        "weatherflow4py.ws.websockets.connect", new_callable=AsyncMock
+    ) as connect:
+        connect.return_value = socket
+        await api.connect()
+
+    socket.frames.put_nowait("not json{")
+    socket.frames.put_nowait(make_wind_frame(1, 0))
+    await wait_until(lambda: received)
+    assert not api.hub.reader_task.done()
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_routes_string_and_bare_device_ids():
+    socket = FakeSocket()
+    by_string = WeatherFlowWebsocketAPI("t", device_ids=["1"])
+    bare = WeatherFlowWebsocketAPI("t", device_ids="2")
+    received: dict[str, list[int]] = {"by_string": [], "bare": []}
+    by_string.register_wind_callback(
+        lambda msg: received["by_string"].append(msg.device_id)
+    )
+    bare.register_wind_callback(lambda msg: received["bare"].append(msg.device_id))
+
+    with patch(
+        "weatherflow4py.ws.websockets.connect", new_callable=AsyncMock
+    ) as connect:
+        connect.return_value = socket
+        await by_string.connect()
+        await bare.connect()
+
+    socket.frames.put_nowait(make_wind_frame(1, 0))
+    socket.frames.put_nowait(make_wind_frame(2, 0))
+    await wait_until(lambda: received["by_string"] and received["bare"])
+    assert received == {"by_string": [1], "bare": [2]}
+    assert not by_string.hub.reader_task.done()
+    await by_string.close()
+    await bare.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_route_survives_recipient_errors(monkeypatch):
+    hub = WebsocketHub("wss://example")
+    api = WeatherFlowWebsocketAPI("t")
+    hub.attach(api)
+
+    def broken(data):
+        raise TypeError("bad routing state")
+
+    monkeypatch.setattr(hub, "recipients", broken)
+    await hub.route({"type": "rapid_wind", "device_id": 1})  # logged, not raised
@@ -0,0 +1,138 @@
+"""Tests for lazily decoded observation frames."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from weatherflow4py.models.rest.device import Summary
+from weatherflow4py.models.ws.custom_types import (
+    ObservationType,
+    PrecipitationAnalysisType,
+    PrecipitationType,
+)
+from weatherflow4py.models.ws.obs import LazyObsAir, LazyObsSky, LazyObsSt, obs_st
+from weatherflow4py.models.ws.websocket_response import (
+    LazyObservationTempestWS,
+    ObservationTempestWS,
+    WebsocketResponseBuilder,
+)
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import OBS_ST_MESSAGE, make_mock_websocket
+
+OBS_ST = json.loads(OBS_ST_MESSAGE)
+
+
+def test_lazy_observation_matches_full_model(websocket_messages):
+    for message in websocket_messages:
+        if message["type"] != "obs_st":
+            continue
+        full = WebsocketResponseBuilder.build_response(message)
+        lazy = WebsocketResponseBuilder.build_response(message, lazy=True)
+        assert lazy == full
+        assert full == lazy
+        if full is not None:
+            assert isinstance(lazy, LazyObservationTempestWS)
+            assert lazy.materialize() == full
+            assert lazy.to_dict() == full.to_dict()
+
+
+def test_lazy_observation_is_an_observation_tempest_ws():
+    lazy = WebsocketResponseBuilder.build_response(OBS_ST, lazy=True)
+    assert isinstance(lazy, ObservationTempestWS)
+    assert lazy.type is ObservationType.OBS_ST
+    assert lazy.device_id == 12345
+    assert lazy.hub_sn == "HB-00061234"
+
+
+def test_lazy_observation_fields():
+    lazy = WebsocketResponseBuilder.build_response(OBS_ST, lazy=True)
+    assert lazy.epoch == 1709057252
+    assert lazy.air_temperature == 20.5
+    assert lazy.wind_avg == 2.07
+    assert lazy.precipitation_type is PrecipitationType.NONE
+    assert lazy.precipitation_analysis_type is PrecipitationAnalysisType.NONE
+    assert isinstance(lazy.summary, Summary)
+    assert lazy.summary.feels_like == 20.0
+    assert lazy.unknown_fields == {}
+
+
+def test_lazy_observation_defers_decoding():
+    lazy = WebsocketResponseBuilder.build_response(OBS_ST, lazy=True)
+    assert "summary" not in vars(lazy)
+    assert "obs" not in vars(lazy)
+
+    assert lazy.air_temperature == 20.5
+
+    assert "summary" not in vars(lazy)
+    assert lazy.first._values == {}
+
+
+def test_lazy_observation_caches_converted_fields():
+    row = LazyObsSt(OBS_ST["obs"][0])
+    assert row.precipitation_type is row.precipitation_type
+    assert row._values == {"precipitation_type": PrecipitationType.NONE}
+
+
+def test_lazy_row_equality_and_materialize():
+    raw = OBS_ST["obs"][0]
+    row = LazyObsSt(raw)
+    assert row.materialize() == obs_st.from_list(raw)
+    assert row == obs_st.from_list(raw)
+    assert row == LazyObsSt(list(raw))
+    assert row.__eq__("nope") is NotImplemented
+
+
+def test_lazy_row_with_null_enums_matches_eager_row():
+    raw = list(OBS_ST["obs"][0])
+    raw[13] = raw[-1] = None  # precipitation_type, precipitation_analysis_type
+    row = LazyObsSt(raw)
+    eager = obs_st.from_list(raw)
+    assert row.precipitation_type is eager.precipitation_type is None
+    assert row.precipitation_analysis_type is eager.precipitation_analysis_type is None
+    assert row == eager
+
+
+def test_lazy_row_unknown_attribute():
+    row = LazyObsSt(OBS_ST["obs"][0])
+    with pytest.raises(AttributeError):
+        _ = row.station_pressure
+
+
+def test_lazy_sky_and_air_rows():
+    sky = LazyObsSky(
+        [1, 2, 3.0, 4.0, 5.0, 6.0, 7.0, 8, 9.0, 10, 11.0, 12.0, 1, 3, 1.0, 2.0, 0]
+    )
+    assert sky.wind_avg == 6.0
+    assert sky.precipitation_type == 1
+    air = LazyObsAir([1, 1000.0, 20.0, 50, 0, 0.0, 3.4, 1])
+    assert air.station_pressure == 1000.0
+    assert air == air.materialize()
+
+
+def test_lazy_observation_missing_keys_return_none(websocket_satus_invalid):
+    assert (
+        WebsocketResponseBuilder.build_response(websocket_satus_invalid, lazy=True)
+        is None
+    )
+
+
+def test_lazy_observation_unknown_fields():
+    message = {**OBS_ST, "status": {"status_code": 0}}
+    lazy = WebsocketResponseBuilder.build_response(message, lazy=True)
+    assert lazy.unknown_fields == {"status": {"status_code": 0}}
+
+
+@pytest.mark.asyncio
+async def test_listen_with_lazy_observations():
+    api = WeatherFlowWebsocketAPI("t", lazy_observations=True)
+    received = []
+    api.register_observation_callback(received.append)
+    api.websocket = make_mock_websocket([OBS_ST_MESSAGE])
+
+    await api.listen()
+
+    assert isinstance(received[0], LazyObservationTempestWS)
+    assert api.last_observation_time() is not None
@@ -0,0 +1,98 @@
+"""Tests for columnar observation decoding (ObsColumns)."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from weatherflow4py.api import WeatherFlowRestAPI
+from weatherflow4py.models.ws.custom_types import ObservationType, PrecipitationType
+from weatherflow4py.models.ws.obs import ObsColumns, ObservationFactory, obs_st
+
+from .conftest import FakeSession
+
+
+def test_columns_match_rows(obs_st_rows):
+    rows = obs_st_rows
+    columns = ObservationFactory.create_columnar_observation(
+        ObservationType.OBS_ST, rows
+    )
+
+    assert len(columns) == len(rows)
+    assert list(columns.epoch) == [row[0] for row in rows]
+    assert list(columns["wind_avg"]) == [row[2] for row in rows]
+    assert columns.columns.keys() == set(columns.names)
+    for index, row in enumerate(rows):
+        assert columns.row(index) == obs_st.from_list(row)
+
+
+def test_columns_store_nulls_as_nan(obs_st_rows):
+    rows = obs_st_rows
+    rows[1][7] = None
+    columns = ObsColumns(ObservationType.OBS_ST, rows)
+
+    assert math.isnan(columns.air_temperature[1])
+    assert columns.row(1).air_temperature is None
+
+
+def test_column_rows_have_the_dataclass_types(obs_st_rows):
+    rows = obs_st_rows
+    rows[0][13] = None  # precipitation_type
+    columns = ObsColumns(ObservationType.OBS_ST, rows)
+
+    first = columns.row(0)
+    assert isinstance(first.epoch, int) and first.epoch == rows[0][0]
+    assert isinstance(first.wind_direction, int)
+    assert first.precipitation_type is None
+    assert columns.row(1).precipitation_type is PrecipitationType(rows[1][13])
+    assert columns.row(1) == obs_st.from_list(rows[1])
+
+
+def test_columns_reject_ragged_rows():
+    with pytest.raises(ValueError):
+        ObsColumns(ObservationType.OBS_AIR, [[1, 2, 3, 4, 5, 6, 7, 8], [1, 2]])
+
+
+def test_columns_reject_wrong_width():
+    with pytest.raises(ValueError, match="Expected 8 values"):
+        ObsColumns(ObservationType.OBS_AIR, [[1, 2, 3]])
+
+
+def test_columns_empty():
+    columns = ObsColumns.from_dict({"type": "obs_air", "obs": None})
+    assert len(columns) == 0
+    assert list(columns.battery) == []
+
+
+def test_columns_unknown_attribute():
+    with pytest.raises(AttributeError):
+        _ = ObsColumns(ObservationType.OBS_AIR).wind_avg
+
+
+def test_columns_numpy_views(obs_st_rows):
+    np = pytest.importorskip("numpy")
+    columns = ObsColumns(ObservationType.OBS_ST, obs_st_rows)
+
+    views = columns.numpy()
+
+    assert views["air_temperature"].dtype == np.float64
+    assert views["air_temperature"].tolist() == list(columns.air_temperature)
+    columns.air_temperature[0] = 99.0
+    assert views["air_temperature"][0] == 99.0
+
+
+@pytest.mark.asyncio
+async def test_api_device_observation_columns(rest_device_observation_1):
+    session = FakeSession()
+    session.add(
+        "https://swd.weatherflow.com/swd/rest/observations/device/211522?token=mock_token",
+        rest_device_observation_1,
+    )
+
+    async with WeatherFlowRestAPI("mock_token", session=session) as api:
+        columns = await api.async_get_device_observation_columns(211522)
+
+    assert isinstance(columns, ObsColumns)
+    assert len(columns) == len(rest_device_observation_1["obs"])
+    assert columns.row(0) == obs_st.from_list(rest_device_observation_1["obs"][0])
@@ -0,0 +1,112 @@
+"""Tests for the shared REST token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from weatherflow4py.api import WeatherFlowRestAPI
+from weatherflow4py.ratelimit import TokenBucket
+
+from .conftest import FakeSession
+
+
+def test_token_bucket_validates_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_buckets_are_shared_per_token():
+    first = WeatherFlowRestAPI("token-a")
+    second = WeatherFlowRestAPI("token-a", requests_per_minute=10)
+    other = WeatherFlowRestAPI("token-b")
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is not other.rate_limiter
+    assert first.rate_limiter.rate == pytest.approx(100 / 60)
+    assert WeatherFlowRestAPI("token-c", requests_per_minute=None).rate_limiter is None
+
+
+@pytest.mark.asyncio
+async def test_burst_then_rate():
+    bucket = TokenBucket(rate=50, burst=2)
+    waits = [await bucket.acquire() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert all(0.01 <= wait < 0.5 for wait in waits[2:])
+    assert bucket.stats.requests == 4
+    assert bucket.stats.throttled == 2
+    assert bucket.stats.max_wait == max(waits)
+    assert bucket.stats.total_wait == pytest.approx(sum(waits))
+
+
+@pytest.mark.asyncio
+async def test_waiters_take_turns_across_endpoints():
+    bucket = TokenBucket(rate=200, burst=1)
+    await bucket.acquire()
+    order = []
+
+    async def request(key, label):
+        await bucket.acquire(key)
+        order.append(label)
+
+    tasks = [
+        asyncio.create_task(request(key, label))
+        for key, label in [
+            ("forecast", "f1"),
+            ("forecast", "f2"),
+            ("forecast", "f3"),
+            ("observation", "o1"),
+        ]
+    ]
+    await asyncio.gather(*tasks)
+    assert order == ["f1", "o1", "f2", "f3"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place():
+    bucket = TokenBucket(rate=20, burst=1)
+    await bucket.acquire()
+    cancelled = asyncio.create_task(bucket.acquire("a"))
+    waiting = asyncio.create_task(bucket.acquire("a"))
+    await asyncio.sleep(0)
+    assert bucket.waiting == 2
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    assert bucket.waiting == 1
+    assert 0 < await waiting < 0.5
+
+
+@pytest.mark.asyncio
+async def test_make_request_waits_for_the_shared_budget(rest_station_observation2):
+    session = FakeSession()
+    session.add(
+        "https://swd.weatherflow.com/swd/rest/observations/station/1?token=t",
+        rest_station_observation2,
+    )
+    # One token per 100 ms: much longer than a request takes, so both later
+    # requests have to wait, for however long the previous one left over.
+    first = WeatherFlowRestAPI("t", session=session, requests_per_minute=600, burst=1)
+    second = WeatherFlowRestAPI("t", session=session)
+    await first.async_get_observation(1)
+    await second.async_get_observation(1)
+    await first.async_get_observation(1)
+    stats = first.rate_limiter.stats
+    assert stats.requests == 3
+    assert stats.throttled == 2
+    assert stats.total_wait > 0
+    assert first.rate_limiter.family_stats["observations/station"] == stats
+
+
+@pytest.mark.asyncio
+async def test_waits_are_recorded_per_endpoint():
+    bucket = TokenBucket(rate=50, burst=1)
+    await bucket.acquire("forecast")
+    forecast, observation = await asyncio.gather(
+        bucket.acquire("forecast"), bucket.acquire("observation")
+    )
+    assert bucket.family_stats["forecast"].requests == 2
+    assert bucket.family_stats["forecast"].total_wait == pytest.approx(forecast)
+    assert bucket.family_stats["observation"].max_wait == pytest.approx(observation)
+    assert bucket.stats.total_wait == pytest.approx(forecast + observation)
@@ -0,0 +1,182 @@
+"""Tests for the supervised reconnect mode of WeatherFlowWebsocketAPI."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from websockets.connection import State as WebSocketState
+from websockets.exceptions import ConnectionClosedError
+
+from weatherflow4py.models.ws.types import ConnectionState
+from weatherflow4py.ws import ReconnectPolicy, WeatherFlowWebsocketAPI
+
+from .conftest import RAPID_WIND_MESSAGE, FakeSocket, wait_until
+
+
+def test_reconnect_policy_backoff_is_bounded_and_jittered():
+    policy = ReconnectPolicy(initial_delay=1, max_delay=10, factor=2, jitter=0.5)
+    for attempt, ceiling in [(0, 1), (1, 2), (3, 8), (10, 10)]:
+        delays = {policy.delay(attempt) for _ in range(20)}
+        assert all(ceiling * 0.5 <= delay <= ceiling for delay in delays)
+        assert len(delays) > 1
+    assert ReconnectPolicy(jitter=0).delay(2) == 4.0
+
+
+@pytest.mark.asyncio
+async def test_supervised_reconnect_replays_subscriptions():
+    sockets = [FakeSocket(), FakeSocket()]
+    attempts = [OSError("refused"), *sockets]
+
+    async def fake_connect(uri, **kwargs):
+        outcome = attempts.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    api = WeatherFlowWebsocketAPI("t", device_ids=[2])
+    api.subscriptions[1] = True
+    states: list[ConnectionState] = []
+    api.register_connection_state_callback(states.append)
+
+    with patch("weatherflow4py.ws.websockets.connect", side_effect=fake_connect):
+        await api.run_supervised(reconnect=ReconnectPolicy(initial_delay=0.001))
+        await wait_until(lambda: len(sockets[0].sent) == 3)
+        assert {(r["type"], r["device_id"]) for r in sockets[0].sent} == {
+            ("listen_rapid_start", 1),
+            ("listen_start", 1),
+            ("listen_start", 2),
+        }
+
+        sockets[0].frames.put_nowait(RAPID_WIND_MESSAGE)
+        await wait_until(lambda: api.connection_stats.last_recovery_time is not None)
+
+        api.connection_stats.last_recovery_time = None
+        sockets[0].frames.put_nowait(ConnectionClosedError(None, None))
+        await wait_until(lambda: len(sockets[1].sent) == 3)
+        assert api.websocket is sockets[1]
+        sockets[1].frames.put_nowait(RAPID_WIND_MESSAGE)
+        await wait_until(lambda: api.connection_stats.last_recovery_time is not None)
+
+        await api.close()
+
+    assert states == [
+        ConnectionState.CONNECTING,
+        ConnectionState.RECONNECTING,
+        ConnectionState.CONNECTED,
+        ConnectionState.DISCONNECTED,
+        ConnectionState.RECONNECTING,
+        ConnectionState.CONNECTED,
+        ConnectionState.CLOSED,
+    ]
+    assert api.connection_stats.connects == 2
+    assert api.connection_stats.disconnects == 1
+    assert api.connection_stats.failed_attempts == 1
+    assert api.supervisor_task.done()
+    # close() unsubscribed the replayed devices on the live socket.
+    assert {r["type"] for r in sockets[1].sent[3:]} == {
+        "listen_stop",
+        "listen_rapid_stop",
+    }
+
+
+@pytest.mark.asyncio
+async def test_supervisor_gives_up_after_max_attempts():
+    api = WeatherFlowWebsocketAPI("t")
+    states: list[ConnectionState] = []
+
+    async def state_cb(state):
+        states.append(state)
+
+    api.register_connection_state_callback(state_cb)
+    with patch("weatherflow4py.ws.websockets.connect", side_effect=OSError("down")):
+        task = await api.run_supervised(
+            reconnect=ReconnectPolicy(initial_delay=0.001, max_attempts=2)
+        )
+        with pytest.raises(OSError):
+            await task
+
+    assert states[-1] is ConnectionState.CLOSED
+    assert api.connection_stats.failed_attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_supervisor_survives_bad_frames_callbacks_and_listener_errors():
+    first, second = FakeSocket(), FakeSocket()
+    sockets = [first, second]
+    api = WeatherFlowWebsocketAPI("t")
+    received = []
+
+    def on_wind(message):
+        received.append(message)
+        if len(received) == 1:
+            raise RuntimeError("callback bug")
+
+    async def fake_connect(uri, **kwargs):
+        return sockets.pop(0)
+
+    api.register_wind_callback(on_wind)
+    with patch("weatherflow4py.ws.websockets.connect", side_effect=fake_connect):
+        await api.run_supervised(reconnect=ReconnectPolicy(initial_delay=0.001))
+        await wait_until(lambda: api.state is ConnectionState.CONNECTED)
+
+        first.frames.put_nowait("not json{")
+        first.frames.put_nowait(RAPID_WIND_MESSAGE)
+        first.frames.put_nowait(RAPID_WIND_MESSAGE)
+        await wait_until(lambda: len(received) == 2)
+        assert api.websocket is first
+
+        # Any other listener failure is handled like a dropped connection.
+        first.frames.put_nowait(RuntimeError("unexpected"))
+        await wait_until(lambda: api.websocket is second)
+        await wait_until(lambda: api.state is ConnectionState.CONNECTED)
+        assert first.state is WebSocketState.CLOSED
+        assert api.connection_stats.disconnects == 1
+        assert not api.supervisor_task.done()
+
+        await api.close()
+
+
+@pytest.mark.asyncio
+async def test_close_during_backoff_returns_at_once():
+    api = WeatherFlowWebsocketAPI("t", device_ids=[1])
+    states: list[ConnectionState] = []
+    api.register_connection_state_callback(states.append)
+
+    with patch("weatherflow4py.ws.websockets.connect", side_effect=OSError("down")):
+        task = await api.run_supervised(reconnect=ReconnectPolicy(initial_delay=30))
+        await wait_until(lambda: api.state is ConnectionState.RECONNECTING)
+        started = time.monotonic()
+        await api.close(timeout=5)
+
+    assert time.monotonic() - started < 0.5
+    assert task.done() and not task.cancelled()
+    assert states[-1] is ConnectionState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_close_while_connecting_does_not_start_listening():
+    socket = FakeSocket()
+    connecting = asyncio.Event()
+    proceed = asyncio.Event()
+
+    async def slow_connect(uri, **kwargs):
+        connecting.set()
+        await proceed.wait()
+        return socket
+
+    api = WeatherFlowWebsocketAPI("t")
+    with patch("weatherflow4py.ws.websockets.connect", side_effect=slow_connect):
+        task = await api.run_supervised()
+        await connecting.wait()
+        closing = asyncio.create_task(api.close(timeout=1))
+        await asyncio.sleep(0)
+        proceed.set()
+        await closing
+
+    assert task.done()
+    assert api.listen_task is None
+    assert socket.state is WebSocketState.CLOSED
+    assert api.state is ConnectionState.CLOSED
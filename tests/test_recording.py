@@ -0,0 +1,101 @@
+"""Tests for frame recording and replay (recording.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from weatherflow4py.recording import (
+    MAGIC,
+    FrameRecorder,
+    FrameReplayer,
+    read_frames,
+)
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import OBS_ST_MESSAGE, make_mock_websocket, make_wind_frame
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip_and_append(tmp_path, compress):
+    path = tmp_path / "frames.rec"
+    with FrameRecorder(path, compress=compress) as recorder:
+        recorder.record(b'{"a": 1}', received_at=10.0)
+        recorder.record('{"b": 2}', received_at=10.5)
+    with FrameRecorder(path, compress=compress) as recorder:
+        recorder.record(b"{}", received_at=11.0)
+
+    assert list(read_frames(path)) == [
+        (10.0, b'{"a": 1}'),
+        (10.5, b'{"b": 2}'),
+        (11.0, b"{}"),
+    ]
+    if not compress:
+        assert path.read_bytes().startswith(MAGIC)
+
+
+def test_read_frames_rejects_bad_files(tmp_path):
+    bad = tmp_path / "bad.rec"
+    bad.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        list(read_frames(bad))
+
+    truncated = tmp_path / "truncated.rec"
+    with FrameRecorder(truncated) as recorder:
+        recorder.record(b"0123456789")
+    truncated.write_bytes(truncated.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        list(read_frames(truncated))
+
+
+@pytest.mark.asyncio
+async def test_listen_records_and_replay_dispatches(tmp_path):
+    path = tmp_path / "stream.rec"
+    frames = [make_wind_frame(1, epoch) for epoch in range(3)] + [OBS_ST_MESSAGE]
+    with FrameRecorder(path) as recorder:
+        api = WeatherFlowWebsocketAPI("t", recorder=recorder)
+        api.websocket = make_mock_websocket(frames)
+        await api.listen()
+    assert [frame for _, frame in read_frames(path)] == [f.encode() for f in frames]
+
+    received = []
+    replay_api = WeatherFlowWebsocketAPI("t", compiled_decoders=True)
+    replay_api.register_wind_callback(lambda msg: received.append(msg.ob.epoch))
+    stats = await FrameReplayer(path, replay_api, speed=None).run()
+
+    assert stats.frames == 4
+    assert stats.frames_per_second > 0
+    assert received == [0, 1, 2]
+    assert replay_api.last_observation_for(12345) is not None
+
+
+@pytest.mark.asyncio
+async def test_replay_skips_and_counts_malformed_frames(tmp_path):
+    path = tmp_path / "corrupt.rec"
+    with FrameRecorder(path) as recorder:
+        recorder.record(make_wind_frame(1, 0))
+        recorder.record(b'{"type": "rapid_wind", "ob": [')
+        recorder.record(make_wind_frame(1, 1))
+
+    received = []
+    api = WeatherFlowWebsocketAPI("t")
+    api.register_wind_callback(lambda msg: received.append(msg.ob.epoch))
+    stats = await FrameReplayer(path, api, speed=None).run()
+
+    assert stats.frames == 2
+    assert stats.malformed == 1
+    assert received == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_replay_respects_speed(tmp_path):
+    path = tmp_path / "timed.rec"
+    with FrameRecorder(path) as recorder:
+        recorder.record(make_wind_frame(1, 0), received_at=100.0)
+        recorder.record(make_wind_frame(1, 1), received_at=101.0)
+
+    api = WeatherFlowWebsocketAPI("t")
+    stats = await FrameReplayer(path, api, speed=20).run()
+    assert 0.05 - 0.01 <= stats.elapsed < 0.5
+
+    with pytest.raises(ValueError):
+        FrameReplayer(path, api, speed=0)
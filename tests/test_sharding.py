@@ -0,0 +1,83 @@
+"""Tests for ShardedWebsocketClient (sharding.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from weatherflow4py.models.ws.types import EventType
+from weatherflow4py.sharding import ShardedWebsocketClient
+
+from .conftest import FakeSocket, make_wind_frame, wait_until
+
+
+@pytest.fixture
+def sockets():
+    created: list[FakeSocket] = []
+
+    async def fake_connect(uri, **kwargs):
+        created.append(FakeSocket())
+        return created[-1]
+
+    with patch("weatherflow4py.ws.websockets.connect", side_effect=fake_connect):
+        yield created
+
+
+def test_rejects_zero_devices_per_connection():
+    with pytest.raises(ValueError):
+        ShardedWebsocketClient("t", devices_per_connection=0)
+
+
+@pytest.mark.asyncio
+async def test_devices_are_spread_and_streams_merged(sockets):
+    client = ShardedWebsocketClient("t", devices_per_connection=2)
+    received = []
+    client.register_callback(EventType.RAPID_WIND, lambda msg: received.append(msg))
+
+    result = await client.add_devices([1, 2, 3, 4, 5])
+
+    assert result.ok and sorted(result.acknowledged) == [1, 2, 3, 4, 5]
+    assert len(sockets) == 3
+    assert sorted(client.stats()) == [1, 2, 2]
+    for socket in sockets:
+        devices = {r["device_id"] for r in socket.sent}
+        assert devices == set(client._devices(client.shards[sockets.index(socket)]))
+
+    stream = client.stream()
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+    for device in (1, 3, 5):
+        client.shard_of(device).websocket.frames.put_nowait(make_wind_frame(device, 0))
+    await wait_until(lambda: len(received) == 3)
+    assert sorted(msg.device_id for msg in received) == [1, 3, 5]
+    event_type, message = await first
+    assert event_type == "rapid_wind"
+    await stream.aclose()
+
+    await client.close()
+    assert all(socket.state.name == "CLOSED" for socket in sockets)
+
+
+@pytest.mark.asyncio
+async def test_removing_devices_folds_shards(sockets):
+    client = ShardedWebsocketClient("t", devices_per_connection=2)
+    await client.add_devices([1, 2, 3, 4], rapid_wind=False)
+    assert client.stats() == [2, 2]
+
+    result = await client.remove_devices([1, 3])
+
+    assert sorted(result.acknowledged) == [1, 3]
+    assert client.stats() == [2]
+    assert len(client.shards) == 1
+    assert sum(socket.state.name == "CLOSED" for socket in sockets) == 1
+    survivor = client.shards[0].websocket
+    # The device that moved was re-subscribed on the surviving connection only.
+    moved = [r for r in survivor.sent if r["type"] == "listen_start"]
+    assert len(moved) == 2
+    assert not any(r["type"] == "listen_rapid_start" for r in survivor.sent)
+
+    await client.add_devices([9])
+    assert sorted(client.stats()) == [1, 2]
+    await client.close()
@@ -0,0 +1,111 @@
+"""Tests for the local websocket simulator, driven through WeatherFlowWebsocketAPI."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from weatherflow4py.models.ws.websocket_request import GeoStrikeListenStartMessage
+from weatherflow4py.models.ws.websocket_response import (
+    AcknowledgementWS,
+    LightningStrikeEventWS,
+    ObservationTempestWS,
+    RainStartEventWS,
+    RapidWindWS,
+)
+from weatherflow4py.simulator import WeatherFlowSimulator
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import wait_until
+
+
+def test_uri_override_keeps_the_token():
+    assert (
+        WeatherFlowWebsocketAPI("t").uri == "wss://ws.weatherflow.com/swd/data?token=t"
+    )
+    assert WeatherFlowWebsocketAPI("t", uri="ws://h:1/x").uri == "ws://h:1/x?token=t"
+    assert (
+        WeatherFlowWebsocketAPI("t", uri="ws://h/x?a=1").uri == "ws://h/x?a=1&token=t"
+    )
+
+
+def test_simulator_validates_arguments():
+    with pytest.raises(ValueError):
+        WeatherFlowSimulator(devices=0)
+    with pytest.raises(ValueError):
+        WeatherFlowSimulator(rapid_wind_interval=0)
+    with pytest.raises(RuntimeError):
+        WeatherFlowSimulator().uri
+
+
+@pytest.mark.asyncio
+async def test_simulated_traffic_decodes_into_models():
+    async with WeatherFlowSimulator(
+        devices=3,
+        obs_interval=0.02,
+        rapid_wind_interval=0.01,
+        strike_interval=0.02,
+        precip_interval=0.02,
+        stamp_frames=True,
+        seed=1,
+    ) as simulator:
+        api = WeatherFlowWebsocketAPI("t", uri=simulator.uri, compiled_decoders=True)
+        received: dict[type, list] = {}
+
+        def collect(message):
+            received.setdefault(type(message), []).append(message)
+
+        api.register_observation_callback(collect)
+        api.register_wind_callback(collect)
+        api.register_lightning_callback(collect)
+        api.register_precipitation_callback(collect)
+        await api.connect()
+        result = await api.subscribe_many(simulator.device_ids[:2])
+        assert result.ok
+
+        wanted = (ObservationTempestWS, RapidWindWS, LightningStrikeEventWS)
+        await wait_until(lambda: all(len(received.get(t, ())) >= 2 for t in wanted))
+        await wait_until(lambda: RainStartEventWS in received)
+        await api.close()
+
+    devices = {m.device_id for messages in received.values() for m in messages}
+    assert devices <= set(simulator.device_ids[:2])
+    wind = received[RapidWindWS][0]
+    assert "sent_at" in wind.unknown_fields
+    assert 0 <= wind.ob.wind_direction_degrees < 360
+    assert simulator.stats.connections == 1
+    assert simulator.stats.frames_by_type["ack"] == simulator.stats.requests
+
+
+@pytest.mark.asyncio
+async def test_simulator_stops_streaming_after_listen_stop():
+    async with WeatherFlowSimulator(
+        devices=1, obs_interval=None, rapid_wind_interval=0.005
+    ) as simulator:
+        api = WeatherFlowWebsocketAPI("t", uri=simulator.uri)
+        await api.connect()
+        await api.subscribe_many(simulator.device_ids)
+        await wait_until(
+            lambda: simulator.stats.frames_by_type.get("rapid_wind", 0) >= 3
+        )
+
+        assert (await api.unsubscribe_many()).ok
+        sent = simulator.stats.frames_by_type["rapid_wind"]
+        await asyncio.sleep(0.05)
+        assert simulator.stats.frames_by_type["rapid_wind"] <= sent + 1
+        await api.close()
+
+
+@pytest.mark.asyncio
+async def test_simulator_acknowledges_unknown_devices_and_geo_strikes():
+    async with WeatherFlowSimulator(devices=1) as simulator:
+        api = WeatherFlowWebsocketAPI("t", uri=simulator.uri)
+        await api.connect()
+        assert (await api.subscribe_many([42])).ok
+        ack = await api.send_message_and_wait(
+            GeoStrikeListenStartMessage(10, 20, 30, 40), timeout=1.0
+        )
+        assert isinstance(ack, AcknowledgementWS)
+        await api.close()
+    assert "obs_st" not in simulator.stats.frames_by_type
@@ -0,0 +1,70 @@
+"""Tests for the latest-value store (store.py)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from weatherflow4py.store import LatestValueStore, StoreEntry
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import OBS_ST_MESSAGE, make_mock_websocket, make_wind_frame
+
+
+def test_store_keeps_latest_per_device_and_type():
+    store = LatestValueStore()
+    store.update(1, "obs_st", "a", received_at=100)
+    store.update(1, "obs_st", "b", received_at=110)
+    store.update(1, "rapid_wind", "w", received_at=120)
+    store.update(2, "obs_st", "c", received_at=50)
+
+    assert store.get(1, "obs_st") == "b"
+    assert store.get(2, "rapid_wind", "missing") == "missing"
+    assert store.entry(1, "rapid_wind") == StoreEntry("w", 120)
+    assert len(store) == 3
+    assert (2, "obs_st") in store
+    assert store.devices() == [1, 2]
+
+    assert store.age(1, now=130) == 10
+    assert store.age(1, "obs_st", now=130) == 20
+    assert store.age(3, now=130) is None
+    assert store.stale(60, now=130) == [2]
+
+
+def test_snapshot_is_consistent_and_cached():
+    store = LatestValueStore()
+    store.update(1, "obs_st", "a")
+    snapshot = store.snapshot()
+    assert store.snapshot() is snapshot
+
+    store.update(1, "obs_st", "b")
+    assert snapshot[1, "obs_st"].message == "a"
+    assert store.snapshot()[1, "obs_st"].message == "b"
+    with pytest.raises(TypeError):
+        snapshot[2, "obs_st"] = None  # type: ignore[index]
+
+    store.clear()
+    assert store.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_listen_records_each_device_separately():
+    other = json.loads(OBS_ST_MESSAGE)
+    other["device_id"] = 999
+    other["obs"][0][0] = 1
+    api = WeatherFlowWebsocketAPI("t")
+    api.websocket = make_mock_websocket(
+        [OBS_ST_MESSAGE, json.dumps(other), make_wind_frame(999, 5)]
+    )
+
+    await api.listen()
+
+    assert api.last_observation.device_id == 999
+    assert api.last_observation_for(12345).device_id == 12345
+    assert api.last_observation_for(999).epoch == 1
+    assert api.last_wind(999).ob.epoch == 5
+    assert api.last_wind(12345) is None
+    assert api.last_observation_time(12345) < api.last_observation_time(999)
+    assert api.last_observation_time(42) is None
+    assert set(api.store.devices()) == {12345, 999}
@@ -0,0 +1,147 @@
+"""Tests for the LAN (UDP) listener, fed by a local UDP sender."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from weatherflow4py.models.ws.custom_types import PrecipitationAnalysisType
+from weatherflow4py.models.ws.types import ConnectionState, EventType
+from weatherflow4py.models.ws.websocket_response import (
+    LazyObservationTempestWS,
+    LightningStrikeEventWS,
+    ObservationTempestWS,
+    RainStartEventWS,
+    RapidWindWS,
+)
+from weatherflow4py.udp import WeatherFlowUDPListener
+from weatherflow4py.ws import WeatherFlowReceiver, WeatherFlowWebsocketAPI
+
+from .conftest import wait_until
+
+# Packets as documented in the WeatherFlow UDP reference.
+UDP_OBS_ST = {
+    "serial_number": "ST-00000512",
+    "type": "obs_st",
+    "hub_sn": "HB-00013030",
+    "obs": [
+        [1588948614, 0.18, 0.22, 0.27, 144, 6, 1017.57, 22.37, 50.26, 328, 0.03, 3,
+         0.0, 0, 0, 0, 2.410, 1]
+    ],
+    "firmware_revision": 129,
+}  # fmt: skip
+UDP_RAPID_WIND = {
+    "serial_number": "ST-00000512",
+    "type": "rapid_wind",
+    "hub_sn": "HB-00013030",
+    "ob": [1588948614, 2.3, 128],
+}
+UDP_STRIKE = {
+    "serial_number": "ST-00000512",
+    "type": "evt_strike",
+    "hub_sn": "HB-00013030",
+    "evt": [1493322445, 27, 3848],
+}
+UDP_PRECIP = {
+    "serial_number": "ST-00000512",
+    "type": "evt_precip",
+    "hub_sn": "HB-00013030",
+    "evt": [1493322445],
+}
+UDP_HUB_STATUS = {
+    "serial_number": "HB-00013030",
+    "type": "hub_status",
+    "firmware_revision": "35",
+    "uptime": 1670133,
+}
+
+
+async def _send(port: int, *packets: dict | bytes) -> None:
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=("127.0.0.1", port)
+    )
+    for packet in packets:
+        transport.sendto(
+            packet if isinstance(packet, bytes) else json.dumps(packet).encode()
+        )
+    transport.close()
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+@pytest.mark.asyncio
+async def test_udp_packets_reach_the_websocket_callbacks(compiled):
+    listener = WeatherFlowUDPListener(
+        host="127.0.0.1",
+        port=0,
+        serial_numbers={"ST-00000512": 12345},
+        compiled_decoders=compiled,
+    )
+    received = []
+    listener.register_observation_callback(received.append)
+    listener.register_wind_callback(received.append)
+    listener.register_lightning_callback(received.append)
+    listener.register_precipitation_callback(received.append)
+    await listener.connect()
+    assert listener.state is ConnectionState.CONNECTED
+
+    await _send(
+        listener.port,
+        UDP_OBS_ST,
+        UDP_RAPID_WIND,
+        b"not json",
+        UDP_HUB_STATUS,
+        UDP_STRIKE,
+        UDP_PRECIP,
+    )
+    await wait_until(lambda: len(received) == 4)
+    await listener.close()
+    assert listener.state is ConnectionState.CLOSED
+
+    observation, wind, strike, rain = received
+    assert isinstance(observation, ObservationTempestWS)
+    assert observation.device_id == 12345
+    assert observation.summary is None
+    assert observation.firmware_revision == "129"
+    assert observation.obs[0].air_temperature == 22.37
+    assert observation.obs[0].local_day_rain_accumulation is None
+    assert (
+        observation.obs[0].precipitation_analysis_type is PrecipitationAnalysisType.NONE
+    )
+    assert isinstance(wind, RapidWindWS) and wind.ob.wind_direction_degrees == 128
+    assert isinstance(strike, LightningStrikeEventWS) and strike.evt.distance_km == 27
+    assert isinstance(rain, RainStartEventWS)
+    assert listener.ignored == 1
+    assert listener.last_wind(12345) == wind
+
+
+@pytest.mark.asyncio
+async def test_lazy_udp_observation_and_serial_fallback():
+    listener = WeatherFlowUDPListener(lazy_observations=True)
+    await listener.handle_frame(json.loads(json.dumps(UDP_OBS_ST)))
+    observation = listener.messages[EventType.OBSERVATION.value]
+    assert isinstance(observation, LazyObservationTempestWS)
+    assert observation.device_id == 512
+    assert observation.summary is None
+    assert observation.obs[0].wind_avg == 0.22
+    assert observation == observation.materialize()
+
+
+def test_udp_listener_is_receive_only():
+    listener = WeatherFlowUDPListener()
+    assert isinstance(listener, WeatherFlowReceiver)
+    assert not isinstance(listener, WeatherFlowWebsocketAPI)
+    for name in ("send_message", "subscribe_many", "run_supervised"):
+        assert not hasattr(listener, name)
+
+
+@pytest.mark.asyncio
+async def test_udp_listener_drops_packets_beyond_the_queue_bound():
+    listener = WeatherFlowUDPListener(max_queued_datagrams=2)
+    for _ in range(5):
+        listener._enqueue(json.dumps(UDP_RAPID_WIND).encode())
+    assert listener.datagrams.qsize() == 2
+    assert listener.dropped == 3
+    await listener.close()  # not connected: nothing to do
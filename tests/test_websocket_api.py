@@ -16,98 +16,25 @@ from weatherflow4py.models.ws.websocket_request import (
 from weatherflow4py.models.ws.websocket_response import (
     ObservationTempestWS,
     RapidWindWS,
+    WebsocketResponseBuilder,
 )
+from weatherflow4py.hub import WebsocketHub
 from weatherflow4py.ws import WeatherFlowWebsocketAPI
 from websockets.asyncio.client import ClientConnection
 from websockets.connection import State as WebSocketState
 
+from .conftest import OBS_ST_MESSAGE, RAPID_WIND_MESSAGE, make_mock_websocket
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-OBS_ST_MESSAGE = json.dumps(
-    {
-        "type": "obs_st",
-        "device_id": 12345,
-        "source": "enhanced",
-        "serial_number": "ST-00081234",
-        "hub_sn": "HB-00061234",
-        "firmware_revision": "165",
-        "summary": {
-            "pressure_trend": "steady",
-            "strike_count_1h": 0,
-            "strike_count_3h": 0,
-            "precip_total_1h": 0.0,
-            "strike_last_dist": 0,
-            "strike_last_epoch": None,
-            "precip_accum_local_yesterday": 0.0,
-            "precip_accum_local_yesterday_final": 0,
-            "precip_analysis_type_yesterday": 0,
-            "feels_like": 20.0,
-            "heat_index": 20.0,
-            "wind_chill": 20.0,
-        },
-        "obs": [
-            [
-                1709057252,
-                0.77,
-                2.07,
-                3.98,
-                58,
-                3,
-                1013.25,
-                20.5,
-                65,
-                10000,
-                3.5,
-                500,
-                0.0,
-                0,
-                5,
-                2,
-                2.85,
-                1,
-                0.0,
-                0.0,
-                0.0,
-                0,
-            ]
-        ],
-    }
-)
-
-RAPID_WIND_MESSAGE = json.dumps(
-    {
-        "type": "rapid_wind",
-        "device_id": 12345,
-        "ob": [1709057252, 2.5, 180],
-        "hub_sn": "HB-00061234",
-        "serial_number": "ST-00081234",
-    }
-)
-
 ACK_MESSAGE = json.dumps({"type": "ack", "id": "test-id-123"})
 
 INVALID_MESSAGE = json.dumps({"type": "unknown_type_xyz"})
 
 
-def _make_mock_websocket(messages: list[str] | None = None) -> MagicMock:
-    """Create a mock websocket that yields messages when iterated."""
-    mock_ws = AsyncMock()
-    mock_ws.state = WebSocketState.OPEN
-
-    if messages is not None:
-
-        async def _aiter():
-            for msg in messages:
-                yield msg
-
-        mock_ws.__aiter__ = lambda self: _aiter()
-
-    return mock_ws
-
-
 # ---------------------------------------------------------------------------
 # Basic init / registration tests (synchronous, no connection needed)
 # ---------------------------------------------------------------------------
@@ -290,7 +217,7 @@ async def test_listen_dispatches_sync_callback():
 
     api.register_observation_callback(obs_cb)
 
-    mock_ws = _make_mock_websocket([OBS_ST_MESSAGE])
+    mock_ws = make_mock_websocket([OBS_ST_MESSAGE])
     api.websocket = mock_ws
 
     await api.listen()
@@ -311,7 +238,7 @@ async def test_listen_dispatches_async_callback():
 
     api.register_wind_callback(wind_cb)
 
-    mock_ws = _make_mock_websocket([RAPID_WIND_MESSAGE])
+    mock_ws = make_mock_websocket([RAPID_WIND_MESSAGE])
     api.websocket = mock_ws
 
     await api.listen()
@@ -324,7 +251,7 @@ async def test_listen_dispatches_async_callback():
 async def test_listen_no_callback_for_message_type():
     """listen() should silently handle messages with no registered callback."""
     api = WeatherFlowWebsocketAPI("t")
-    mock_ws = _make_mock_websocket([OBS_ST_MESSAGE])
+    mock_ws = make_mock_websocket([OBS_ST_MESSAGE])
     api.websocket = mock_ws
 
     # No callback registered – should not raise
@@ -344,7 +271,7 @@ async def test_listen_invalid_message_dispatches_invalid_callback():
 
     api.register_invalid_data_callback(invalid_cb)
 
-    mock_ws = _make_mock_websocket([INVALID_MESSAGE])
+    mock_ws = make_mock_websocket([INVALID_MESSAGE])
     api.websocket = mock_ws
 
     await api.listen()
@@ -365,7 +292,7 @@ async def test_listen_invalid_message_async_invalid_callback():
 
     api.register_invalid_data_callback(invalid_cb)
 
-    mock_ws = _make_mock_websocket([INVALID_MESSAGE])
+    mock_ws = make_mock_websocket([INVALID_MESSAGE])
     api.websocket = mock_ws
 
     await api.listen()
@@ -379,7 +306,7 @@ async def test_listen_invalid_message_no_invalid_callback(caplog):
     import logging
 
     api = WeatherFlowWebsocketAPI("t")
-    mock_ws = _make_mock_websocket([INVALID_MESSAGE])
+    mock_ws = make_mock_websocket([INVALID_MESSAGE])
     api.websocket = mock_ws
 
     with caplog.at_level(logging.WARNING):
@@ -392,7 +319,7 @@ async def test_listen_invalid_message_no_invalid_callback(caplog):
 async def test_listen_sets_is_listening_false_on_exit():
     """listen() should reset is_listening to False even on normal exit."""
     api = WeatherFlowWebsocketAPI("t")
-    mock_ws = _make_mock_websocket([])  # no messages, exits immediately
+    mock_ws = make_mock_websocket([])  # no messages, exits immediately
     api.websocket = mock_ws
 
     await api.listen()
@@ -409,10 +336,10 @@ async def test_listen_sets_is_listening_false_on_exit():
 async def test_connect_establishes_websocket():
     """connect() should set self.websocket and create a listen task."""
     api = WeatherFlowWebsocketAPI("t")
-    # Reset shared websocket so test is isolated
-    WeatherFlowWebsocketAPI._shared_websocket = None
+    # Reset shared connections so test is isolated
+    WebsocketHub.hubs.clear()
 
-    mock_ws = _make_mock_websocket([])
+    mock_ws = make_mock_websocket([])
 
     with patch(
         "weatherflow4py.ws.websockets.connect", new_callable=AsyncMock
@@ -431,18 +358,18 @@ async def test_connect_establishes_websocket():
             pass
 
     # Reset for other tests
-    WeatherFlowWebsocketAPI._shared_websocket = None
+    WebsocketHub.hubs.clear()
 
 
 @pytest.mark.asyncio
 async def test_connect_reuses_shared_websocket():
-    """A second connect() call reuses the class-level _shared_websocket."""
-    WeatherFlowWebsocketAPI._shared_websocket = None
+    """A second connect() call reuses the hub's shared websocket."""
+    WebsocketHub.hubs.clear()
 
     api1 = WeatherFlowWebsocketAPI("t")
     api2 = WeatherFlowWebsocketAPI("t")
 
-    mock_ws = _make_mock_websocket([])
+    mock_ws = make_mock_websocket([])
 
     with patch(
         "weatherflow4py.ws.websockets.connect", new_callable=AsyncMock
@@ -470,7 +397,7 @@ async def test_connect_reuses_shared_websocket():
     mock_connect.assert_called_once()
     assert api1.websocket is api2.websocket
 
-    WeatherFlowWebsocketAPI._shared_websocket = None
+    WebsocketHub.hubs.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -610,3 +537,125 @@ async def test_close_cancels_listen_task_and_closes_websocket():
 
     mock_ws.close.assert_called_once()
     assert api.websocket is None
+
+
+@pytest.mark.asyncio
+async def test_send_message_and_wait_correlates_concurrent_acks():
+    """Concurrent requests each receive the ACK carrying their own id."""
+    api = WeatherFlowWebsocketAPI("t")
+    mock_ws = AsyncMock()
+    api.websocket = mock_ws
+    sent_ids: list[str] = []
+
+    async def send(raw):
+        sent_ids.append(json.loads(raw)["id"])
+
+    mock_ws.send.side_effect = send
+    requests = [ListenStartMessage(device_id=device) for device in range(50)]
+    waiters = asyncio.gather(
+        *(api.send_message_and_wait(request, timeout=1) for request in requests)
+    )
+    while len(sent_ids) < len(requests):
+        await asyncio.sleep(0)
+    assert len(api.pending_acks) == len(requests)
+
+    # The server acknowledges in reverse order; every waiter still gets its own ACK.
+    api.websocket = make_mock_websocket(
+        [
+            json.dumps({"type": "ack", "id": request_id})
+            for request_id in reversed(sent_ids)
+        ]
+    )
+    await api.listen()
+    acks = await waiters
+
+    assert [ack.id for ack in acks] == [request.id for request in requests]
+    assert api.pending_acks == {}
+
+
+@pytest.mark.asyncio
+async def test_send_message_and_wait_rejects_duplicate_in_flight_id():
+    api = WeatherFlowWebsocketAPI("t")
+    api.websocket = AsyncMock()
+    first = asyncio.create_task(
+        api.send_message_and_wait(ListenStartMessage(device_id=1, id="x"), timeout=1)
+    )
+    await asyncio.sleep(0)
+    with pytest.raises(ValueError):
+        await api.send_message_and_wait(ListenStartMessage(device_id=2, id="x"))
+    first.cancel()
+
+
+def _acking_websocket(api: WeatherFlowWebsocketAPI, skip: set | None = None):
+    """A mock socket whose send() acknowledges requests unless their device is in ``skip``."""
+    mock_ws = AsyncMock()
+    sent: list[dict] = []
+
+    async def send(raw):
+        request = json.loads(raw)
+        sent.append(request)
+        if request.get("device_id") not in (skip or set()):
+            api._resolve_ack(
+                WebsocketResponseBuilder.build_response(
+                    {"type": "ack", "id": request["id"]}
+                )
+            )
+
+    mock_ws.send.side_effect = send
+    return mock_ws, sent
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_pipelines_and_reports_failures():
+    api = WeatherFlowWebsocketAPI("t")
+    api.websocket, sent = _acking_websocket(api, skip={3})
+
+    result = await api.subscribe_many([1, 2, 3, 2], timeout=0.05)
+
+    assert [request["type"] for request in sent[:2]] == [
+        "listen_start",
+        "listen_rapid_start",
+    ]
+    assert len(sent) == 6
+    assert result.acknowledged == [1, 2]
+    assert set(result.failed) == {3}
+    assert "no ACK" in result.failed[3]
+    assert not result.ok
+    assert api.device_ids == [1, 2]
+    assert api.pending_acks == {}
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_without_rapid_wind_and_send_errors():
+    api = WeatherFlowWebsocketAPI("t")
+    api.websocket, sent = _acking_websocket(api)
+    result = await api.subscribe_many([1], rapid_wind=False)
+    assert result.ok
+    assert [request["type"] for request in sent] == ["listen_start"]
+
+    api.websocket.send.side_effect = ConnectionError("gone")
+    result = await api.subscribe_many([5])
+    assert "ConnectionError" in result.failed[5]
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_many_defaults_to_all_devices():
+    api = WeatherFlowWebsocketAPI("t", device_ids=[1, 2])
+    api.websocket, sent = _acking_websocket(api, skip={2})
+
+    result = await api.unsubscribe_many(timeout=0.05)
+
+    assert {request["type"] for request in sent} == {
+        "listen_stop",
+        "listen_rapid_stop",
+    }
+    assert result.acknowledged == [1]
+    assert api.device_ids == [2]
+
+
+@pytest.mark.asyncio
+async def test_stop_all_listeners_waits_for_acks_concurrently():
+    api = WeatherFlowWebsocketAPI("t", device_ids=list(range(100)))
+    api.websocket, sent = _acking_websocket(api)
+    await asyncio.wait_for(api.stop_all_listeners(), timeout=1)
+    assert len(sent) == 200
@@ -0,0 +1,89 @@
+"""Tests for the rolling wind statistics engine (wind.py)."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from weatherflow4py.wind import RollingWindow, WindEngine
+from weatherflow4py.ws import WeatherFlowWebsocketAPI
+
+from .conftest import make_mock_websocket, make_wind_frame
+
+
+def test_window_validation():
+    with pytest.raises(ValueError):
+        RollingWindow(0)
+    with pytest.raises(ValueError):
+        RollingWindow(10).stats()
+    with pytest.raises(ValueError):
+        WindEngine(windows=())
+
+
+def test_rolling_window_matches_brute_force():
+    rng = random.Random(3)
+    window = RollingWindow(120)
+    samples = []
+    for step in range(500):
+        epoch = step * 3
+        speed = rng.uniform(0, 20)
+        samples.append((epoch, speed))
+        stats = window.add(epoch, speed, rng.uniform(0, 360))
+
+        in_window = [s for e, s in samples if e > epoch - 120]
+        assert stats.samples == len(in_window) == len(window)
+        assert stats.average == pytest.approx(sum(in_window) / len(in_window))
+        assert stats.gust == max(in_window)
+        assert stats.lull == min(in_window)
+        assert stats.epoch == epoch
+
+
+def test_direction_is_a_vector_mean():
+    window = RollingWindow(60)
+    window.add(0, 5, 350)
+    stats = window.add(3, 5, 10)
+    assert min(stats.direction, 360 - stats.direction) == pytest.approx(0, abs=1e-9)
+
+    window = RollingWindow(60)
+    window.add(0, 5, 90)
+    assert window.add(3, 5, 270).direction is None
+    assert RollingWindow(60).add(0, 0, 45).direction is None
+
+
+@pytest.mark.asyncio
+async def test_engine_tracks_devices_and_calls_back():
+    engine = WindEngine(windows=(6, 60))
+    everything, only_two = [], []
+    engine.register_callback(lambda device, stats: everything.append(device))
+
+    async def async_cb(device, stats):
+        only_two.append(stats[6].samples)
+
+    engine.register_callback(async_cb, device_id=2)
+    engine.register_callback(lambda device, stats: 1 / 0)  # logged, not raised
+
+    for epoch in range(0, 12, 3):
+        await engine.feed(json.loads(make_wind_frame(1, epoch)))
+        await engine.feed(json.loads(make_wind_frame(2, epoch)))
+    assert await engine.feed({"type": "obs_st"}) is None
+
+    assert everything == [1, 2] * 4
+    assert only_two == [1, 2, 2, 2]
+    assert engine.stats(1)[60].samples == 4
+    assert engine.stats(3) is None
+
+
+@pytest.mark.asyncio
+async def test_listen_feeds_wind_engine():
+    engine = WindEngine()
+    api = WeatherFlowWebsocketAPI("t", wind_stats=engine)
+    api.websocket = make_mock_websocket([make_wind_frame(5, 0), make_wind_frame(5, 3)])
+
+    await api.listen()
+
+    stats = engine.stats(5)[120]
+    assert stats.samples == 2
+    assert stats.average == 2.5
+    assert stats.direction == pytest.approx(180)
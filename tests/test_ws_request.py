@@ -70,3 +70,13 @@ def test_listen_rapid_stop_message_to_dict():
     assert message_dict["type"] == "listen_rapid_stop"
     assert message_dict["device_id"] == "1110"
     assert "id" in message_dict
+
+
+def test_request_ids_are_unique():
+    ids = {ListenStartMessage(device_id="1").id for _ in range(100)}
+    ids.add(RapidWindListenStartMessage(device_id="1").id)
+    assert len(ids) == 101
+
+
+def test_request_id_can_be_pinned():
+    assert ListenStopMessage(device_id="1", id="abc").to_dict()["id"] == "abc"
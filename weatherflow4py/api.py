@@ -1,11 +1,23 @@
+import asyncio
+import logging
+from typing import Any, ClassVar
+
 import aiohttp
 
+from weatherflow4py.cache import CacheKey, ResponseCache
+from weatherflow4py.codec import JsonCodec, get_codec
 from weatherflow4py.exceptions import TokenError
+from weatherflow4py.models.decoder import decoder_for
 from weatherflow4py.models.rest.device import DeviceObservationTempestREST
 from weatherflow4py.models.rest.forecast import WeatherDataForecastREST
 from weatherflow4py.models.rest.observation import ObservationStationREST
-from weatherflow4py.models.rest.stations import StationsResponseREST
-from weatherflow4py.models.rest.unified import WeatherFlowDataREST
+from weatherflow4py.models.rest.stations import Stations, StationsResponseREST
+from weatherflow4py.models.rest.unified import (
+    WeatherFlowDataREST,
+    WeatherFlowDataResults,
+)
+from weatherflow4py.models.ws.obs import ObsColumns
+from weatherflow4py.ratelimit import TokenBucket
 from .const import REST_LOGGER
 
 from yarl import URL
@@ -18,7 +30,39 @@ class WeatherFlowRestAPI:
 
     BASE_URL = "https://swd.weatherflow.com/swd/rest"
 
-    def __init__(self, api_token: str, session: aiohttp.ClientSession | None = None):
+    # Requests in flight in this process, shared by every instance (keys include the
+    # token and decoding settings) so separate components asking for the same data
+    # make one request.
+    _in_flight: ClassVar[
+        dict[tuple[CacheKey, bool, str], asyncio.Future[tuple[Any, int]]]
+    ] = {}
+
+    def __init__(
+        self,
+        api_token: str,
+        session: aiohttp.ClientSession | None = None,
+        codec: JsonCodec | None = None,
+        requests_per_minute: float | None = 100,
+        burst: int = 10,
+        cache: ResponseCache | bool | None = None,
+        compiled_decoders: bool = False,
+    ):
+        """
+        Args:
+            api_token (str): The WeatherFlow API token.
+            session (aiohttp.ClientSession | None): Session to use; one is created if omitted.
+            codec (JsonCodec | None): JSON backend for responses; defaults to ``get_codec()``.
+            requests_per_minute (float | None): Request budget shared by every instance
+                using ``api_token`` (see ``TokenBucket``); None disables rate limiting.
+            burst (int): Requests that may be sent back to back before the rate applies.
+            cache (ResponseCache | bool | None): Serve decoded responses from this TTL
+                cache (stations and forecasts by default) and refresh stale ones in the
+                background. May be shared between instances, so ``close()`` leaves it
+                open; True creates a default cache that ``close()`` closes.
+            compiled_decoders (bool): Decode responses with generated per-model decoders
+                instead of dataclasses_json ``from_dict`` (same models, much faster for
+                forecasts).
+        """
         if not api_token:
             raise TokenError
 
@@ -26,6 +70,19 @@ class WeatherFlowRestAPI:
         self.api_token = api_token
         self._session = session
         self._owned_session = None
+        self.codec = codec or get_codec()
+        self.rate_limiter: TokenBucket | None = None
+        if requests_per_minute is not None:
+            self.rate_limiter = TokenBucket.for_token(
+                api_token, requests_per_minute, burst
+            )
+        self._owned_cache: ResponseCache | None = None
+        if cache is True:
+            cache = self._owned_cache = ResponseCache()
+        self.cache = cache if isinstance(cache, ResponseCache) else None
+        self.compiled_decoders = compiled_decoders
+        self.coalesced = 0  # requests answered by another caller's in-flight request
+        self._started: set[asyncio.Future] = set()  # shared requests this instance runs
 
     @property
     def session(self):
@@ -44,23 +101,92 @@ class WeatherFlowRestAPI:
         # Do not close the session here
         pass
 
+    @staticmethod
+    def _family(endpoint: str) -> str:
+        """The endpoint without station or device ids, e.g. ``observations/station``."""
+        return "/".join(part for part in endpoint.split("/") if not part.isdigit())
+
     async def _make_request(
         self, endpoint: str, params: dict | None = None, response_model=None
     ):
+        key = CacheKey(
+            self.api_token,
+            endpoint,
+            tuple(sorted((params or {}).items())),
+            response_model,
+        )
+        if self.cache is None:
+            return (await self._coalesced(key, endpoint, params, response_model))[0]
+        return await self.cache.get(
+            key,
+            self._family(endpoint),
+            lambda: self._coalesced(key, endpoint, params, response_model),
+        )
+
+    async def _coalesced(
+        self, key: CacheKey, endpoint: str, params: dict | None, response_model
+    ) -> tuple[Any, int]:
+        """``_fetch``, shared by every caller asking for ``key`` while it is in flight.
+
+        Duplicates, from this or any other instance using the same token, codec and
+        decoders, wait for the first request, so they take no rate-limit budget and
+        receive the same decoded model. The request runs on the first caller's
+        instance (its session and rate limiter); ``close()`` lets it finish before
+        closing that session. A caller being cancelled does not cancel the request for
+        the others.
+        """
+        flight = (key, self.compiled_decoders, self.codec.name)
+        task = self._in_flight.get(flight)
+        if task is not None and task.get_loop() is not asyncio.get_running_loop():
+            task = None  # left over from another (closed) event loop
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(endpoint, params, response_model))
+            self._in_flight[flight] = task
+            self._started.add(task)
+            task.add_done_callback(lambda done: self._request_done(flight, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self, flight: tuple[CacheKey, bool, str], task: asyncio.Future
+    ) -> None:
+        self._started.discard(task)
+        if self._in_flight.get(flight) is task:
+            del self._in_flight[flight]
+        if not task.cancelled():
+            task.exception()  # retrieved even if every caller was cancelled
+
+    async def _fetch(
+        self, endpoint: str, params: dict | None, response_model
+    ) -> tuple[Any, int]:
+        """Request and decode ``endpoint``; returns the model and the response size."""
         url = URL(f"{self.BASE_URL}/{endpoint}")
         full_params = {"token": self.api_token, **(params or {})}
         full_url = url.with_query(full_params)
 
+        if self.rate_limiter is not None:
+            # Endpoints differing only by station or device id share one turn.
+            if waited := await self.rate_limiter.acquire(self._family(endpoint)):
+                REST_LOGGER.debug(f"Rate limited {endpoint} for {waited:.3f}s")
+
         REST_LOGGER.debug(f"Making request to {full_url}")
 
         async with self.session.get(url, params=full_params) as response:
             response.raise_for_status()
-            data = await response.text()
+            data = await response.read()
 
-            REST_LOGGER.debug(f"Received response: {data}")
+            if REST_LOGGER.isEnabledFor(logging.DEBUG):
+                REST_LOGGER.debug(f"Received response: {data.decode(errors='replace')}")
 
         try:
-            return response_model.from_json(data) if response_model else None
+            if response_model is None:
+                model = None
+            elif self.compiled_decoders:
+                model = decoder_for(response_model)(self.codec.loads(data))
+            else:
+                model = response_model.from_dict(self.codec.loads(data))
+            return model, len(data)
         except Exception as e:
             error_msg = f"Unable to convert data || {data} || to || {response_model} -- {str(e)}"
             print(error_msg)
@@ -128,6 +254,21 @@ class WeatherFlowRestAPI:
 
         return obs_data
 
+    async def async_get_device_observation_columns(self, device_id: int) -> ObsColumns:
+        """
+        Gets the device_id observation rows as columns, without building per-row objects.
+
+        Args:
+            device_id (int): The ID of the device_id.
+
+        Raises:
+            ClientResponseError: If there is a client response error.
+        """
+        return await self._make_request(
+            f"observations/device/{device_id}",
+            response_model=ObsColumns,
+        )
+
     async def async_get_observation(self, station_id: int) -> ObservationStationREST:
         """
         Gets the observation data for a given station_id.
@@ -144,49 +285,113 @@ class WeatherFlowRestAPI:
         )
 
     async def get_all_data(
-        self, get_device_observations: bool = False
-    ) -> dict[int, WeatherFlowDataREST]:
+        self, get_device_observations: bool = False, max_concurrency: int = 10
+    ) -> WeatherFlowDataResults:
         """
         Builds a full data set of stations and forecasts. If get_device_observations is True,
         it also fetches device_id observations for each station_id. Otherwise, device_observations
         will be set to None for each station_id.
 
+        The forecast, observation and device observation requests of every station run
+        concurrently, with at most ``max_concurrency`` requests in flight at once. A
+        station whose requests fail is left out and reported in ``errors`` instead of
+        aborting the refresh, unless every station failed.
+
         Args:
             get_device_observations (bool): Whether to fetch device_id observations for each station_id.
+            max_concurrency (int): Maximum number of requests in flight at once.
 
         Returns:
-            dict[int, WeatherFlowDataREST]: A dictionary mapping station_id IDs to their corresponding data.
+            WeatherFlowDataResults: A dictionary mapping station_id IDs to their corresponding data,
+                with failed stations in its ``errors`` attribute.
 
         Raises:
-            ClientResponseError: If there is a client response error during data retrieval.
+            ClientResponseError: If the list of stations cannot be retrieved.
+            Exception: The first station's error if every station failed.
         """
-        ret: dict[int, WeatherFlowDataREST] = {}
-        station_response = await self.async_get_stations()
-        for station in station_response.stations:
-            device_id = station.outdoor_devices[0].device_id
-
-            device_observations = None
-            if get_device_observations:
-                device_observations = await self.async_get_device_observations(
-                    device_id=device_id
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def limited(coro):
+            async with semaphore:
+                return await coro
+
+        async def station_data(station: Stations) -> WeatherFlowDataREST:
+            # Look the device up before creating any request coroutine, so a station
+            # without an outdoor device fails without leaving them unawaited.
+            device_id = (
+                station.outdoor_devices[0].device_id
+                if get_device_observations
+                else None
+            )
+            requests = [
+                limited(self.async_get_forecast(station_id=station.station_id)),
+                limited(self.async_get_observation(station_id=station.station_id)),
+            ]
+            if device_id is not None:
+                requests.append(
+                    limited(self.async_get_device_observations(device_id=device_id))
                 )
-
-            ret[station.station_id] = WeatherFlowDataREST(
-                weather=await self.async_get_forecast(station_id=station.station_id),
-                observation=await self.async_get_observation(
-                    station_id=station.station_id
-                ),
+            weather, observation, *device_observations = await asyncio.gather(*requests)
+            return WeatherFlowDataREST(
+                weather=weather,
+                observation=observation,
                 station=station,
-                device_observations=device_observations,
+                device_observations=(
+                    device_observations[0] if device_observations else None
+                ),
             )
 
+        ret = WeatherFlowDataResults()
+        station_response = await limited(self.async_get_stations())
+        stations = station_response.stations
+        results = await asyncio.gather(
+            *(station_data(station) for station in stations), return_exceptions=True
+        )
+        for station, result in zip(stations, results, strict=True):
+            if isinstance(result, Exception):
+                REST_LOGGER.warning(
+                    f"Unable to refresh station {station.station_id}: {result!r}"
+                )
+                ret.errors[station.station_id] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                ret[station.station_id] = result
+
+        if ret.errors and not ret:
+            # Nothing could be refreshed: fail like a single request would.
+            raise next(iter(ret.errors.values()))
         return ret
 
     @classmethod
-    async def create(cls, api_token: str, session: aiohttp.ClientSession | None = None):
-        return cls(api_token, session)
+    async def create(
+        cls,
+        api_token: str,
+        session: aiohttp.ClientSession | None = None,
+        codec: JsonCodec | None = None,
+        requests_per_minute: float | None = 100,
+        burst: int = 10,
+        cache: ResponseCache | bool | None = None,
+        compiled_decoders: bool = False,
+    ):
+        return cls(
+            api_token,
+            session,
+            codec,
+            requests_per_minute,
+            burst,
+            cache,
+            compiled_decoders,
+        )
 
     async def close(self):
+        if self._started:
+            # Callers on other instances may be waiting for these requests.
+            await asyncio.wait(self._started)
+        if self._owned_cache is not None:
+            await self._owned_cache.close()
         if self._owned_session:
             await self._owned_session.close()
             self._owned_session = None
@@ -0,0 +1,182 @@
+"""TTL cache for decoded REST responses with stale-while-revalidate.
+
+``ResponseCache`` keeps decoded models per ``(token, endpoint, params, model)``. Each
+endpoint family (the endpoint without station or device ids) has its own time to live;
+families without one are never cached. Within the TTL the cached model is returned
+directly. For ``max_stale`` seconds after that it is still returned, while one
+background request refreshes it; older entries are fetched again before returning.
+
+The cache is bounded both by entry count and by the size of the raw responses it was
+built from, evicting least recently used entries first. Cached models are shared
+between callers and must not be modified.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from .const import REST_LOGGER
+
+DEFAULT_TTLS: dict[str, float] = {
+    "stations": 3600.0,
+    "better_forecast": 1800.0,
+}
+
+
+class CacheKey(NamedTuple):
+    token: str
+    endpoint: str
+    params: tuple[tuple[str, Any], ...]
+    model: Any
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    size: int
+    fetched_at: float
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    evictions: int = 0
+
+
+class ResponseCache:
+    """Decoded REST responses with per-endpoint TTLs and a size bound."""
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        max_stale: float = 600.0,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+    ):
+        """
+        Args:
+            ttls (Mapping[str, float] | None): Seconds to live per endpoint family, such
+                as ``"stations"`` or ``"observations/station"``; defaults to
+                ``DEFAULT_TTLS``.
+            max_stale (float): Seconds past the TTL during which the old value is served
+                while it is refreshed in the background; 0 disables.
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (int): Maximum total size of the raw responses behind them.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.nbytes = 0
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._refreshing: dict[CacheKey, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def ttl(self, family: str) -> float | None:
+        return self.ttls.get(family)
+
+    async def get(
+        self,
+        key: CacheKey,
+        family: str,
+        fetch: Callable[[], Awaitable[tuple[Any, int]]],
+    ) -> Any:
+        """The cached value for ``key``, calling ``fetch() -> (value, size)`` if needed."""
+        if (ttl := self.ttl(family)) is None:
+            value, _ = await fetch()
+            return value
+
+        if (entry := self._entries.get(key)) is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < ttl:
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < ttl + self.max_stale:
+                self.stats.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._refresh(key, fetch)
+                return entry.value
+
+        self.stats.misses += 1
+        value, size = await fetch()
+        self.put(key, value, size)
+        return value
+
+    def put(self, key: CacheKey, value: Any, size: int) -> None:
+        self._remove(key)
+        if size > self.max_bytes:
+            return  # would evict everything else and still not fit
+        self._entries[key] = _Entry(value, size, time.monotonic())
+        self.nbytes += size
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _refresh(
+        self, key: CacheKey, fetch: Callable[[], Awaitable[tuple[Any, int]]]
+    ) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                value, size = await fetch()
+            except Exception as e:
+                REST_LOGGER.warning(
+                    f"Background refresh of {key.endpoint} failed: {e!r}"
+                )
+            else:
+                self.stats.refreshes += 1
+                self.put(key, value, size)
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    def _remove(self, key: CacheKey) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self.nbytes -= entry.size
+
+    def invalidate(self, endpoint: str, params: Mapping[str, Any] | None = None) -> int:
+        """Drop cached responses for ``endpoint`` (only those with ``params`` if given).
+
+        Returns the number of entries removed.
+        """
+        wanted = None if params is None else tuple(sorted(params.items()))
+        keys = [
+            key
+            for key in self._entries
+            if key.endpoint == endpoint and (wanted is None or key.params == wanted)
+        ]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+    async def close(self) -> None:
+        """Cancel background refreshes still in flight."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refreshing.clear()
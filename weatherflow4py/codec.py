@@ -0,0 +1,97 @@
+"""JSON codec shared by the REST and websocket clients.
+
+The fastest available backend is picked on first use: ``orjson``, then ``msgspec``,
+then the standard library. Every backend decodes ``bytes`` directly, so response
+bodies and websocket frames never have to be turned into a ``str`` first.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .const import BASE_LOGGER
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A JSON backend: ``loads`` takes bytes or str, ``dumps`` returns str."""
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], str]
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    return JsonCodec("orjson", orjson.loads, dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def dumps(obj: Any) -> str:
+        return encoder.encode(obj).decode()
+
+    return JsonCodec("msgspec", decoder.decode, dumps)
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("json", json.loads, json.dumps)
+
+
+CODECS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+_default_codec: JsonCodec | None = None
+
+
+def load_codec(name: str | None = None) -> JsonCodec:
+    """Build the named codec, or the first importable one when ``name`` is None.
+
+    Raises:
+        ValueError: If ``name`` is not a known backend.
+        ImportError: If the named backend is not installed.
+    """
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(f"Unknown JSON codec: {name}")
+        return CODECS[name]()
+
+    for factory in CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+def get_codec() -> JsonCodec:
+    """Return the process-wide default codec, auto-detecting it on first use."""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = load_codec()
+        BASE_LOGGER.debug(f"Using JSON codec: {_default_codec.name}")
+    return _default_codec
+
+
+def set_codec(codec: JsonCodec | str | None) -> JsonCodec:
+    """Set the process-wide default codec by instance or name (None auto-detects).
+
+    Clients created afterwards pick it up; existing clients keep their codec.
+    """
+    global _default_codec
+    _default_codec = codec if isinstance(codec, JsonCodec) else load_codec(codec)
+    return _default_codec
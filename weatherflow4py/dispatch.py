@@ -0,0 +1,312 @@
+"""Bounded callback dispatch for the websocket client.
+
+``CallbackDispatcher`` decouples the socket reader from user callbacks: the reader
+submits each decoded message to a bounded ``DispatchQueue`` per event type and a worker
+task per queue delivers it. When a queue is full the ``BackpressurePolicy`` decides
+whether the reader waits or a message is dropped, and ``stats()`` reports queue depth
+and drop counts so queues can be sized under real load.
+
+``ExecutorCallback`` moves a blocking sync callback onto an executor while keeping the
+messages of each device in arrival order, and ``ThrottledCallback`` delivers at most
+one message per device per interval, always the newest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from .const import WS_LOGGER
+
+
+class BackpressurePolicy(Enum):
+    """What ``DispatchQueue.put`` does when the queue is full."""
+
+    BLOCK = "block"  # wait for the consumer (the reader stops reading)
+    DROP_OLDEST = "drop_oldest"  # evict the oldest queued message
+    DROP_NEWEST = "drop_newest"  # discard the incoming message
+    COALESCE_LATEST = "coalesce_latest"  # one pending message per device, newest wins
+
+
+@dataclass
+class DispatchStats:
+    """Counters for a single ``DispatchQueue``."""
+
+    depth: int = 0
+    max_depth: int = 0
+    enqueued: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+
+class DispatchQueue:
+    """A bounded FIFO with a configurable overflow policy.
+
+    With ``COALESCE_LATEST`` a message whose key is already queued replaces the pending
+    one in place (counted as ``coalesced``); a full queue of distinct keys then evicts
+    the oldest entry.
+    """
+
+    def __init__(self, maxsize: int, policy: BackpressurePolicy):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.stats = DispatchStats()
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sequence = itertools.count()
+        self._changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, item: Any, key: Hashable = None) -> bool:
+        """Queue ``item``; returns False when the policy discarded it."""
+        async with self._changed:
+            if self.policy is BackpressurePolicy.COALESCE_LATEST and key is not None:
+                if key in self._items:
+                    self._items[key] = item
+                    self.stats.coalesced += 1
+                    return True
+            else:
+                key = next(self._sequence)
+
+            if len(self._items) >= self.maxsize:
+                if self.policy is BackpressurePolicy.BLOCK:
+                    await self._changed.wait_for(
+                        lambda: len(self._items) < self.maxsize
+                    )
+                elif self.policy is BackpressurePolicy.DROP_NEWEST:
+                    self.stats.dropped += 1
+                    return False
+                else:
+                    self._items.popitem(last=False)
+                    self.stats.dropped += 1
+
+            self._items[key] = item
+            self.stats.enqueued += 1
+            self.stats.depth = len(self._items)
+            self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+            self._changed.notify_all()
+            return True
+
+    async def get(self) -> Any:
+        """Remove and return the oldest queued item, waiting if the queue is empty."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: len(self._items) > 0)
+            _, item = self._items.popitem(last=False)
+            self.stats.depth = len(self._items)
+            self._changed.notify_all()
+            return item
+
+
+async def invoke_callback(callback: Callable[[Any], Any], payload: Any) -> None:
+    """Call ``callback`` with ``payload``, awaiting it when it is a coroutine function."""
+    if asyncio.iscoroutinefunction(callback):
+        await callback(payload)
+    else:
+        callback(payload)
+
+
+def device_key(payload: Any) -> Hashable:
+    """The ``device_id`` of a decoded message or raw frame dict (None if it has none)."""
+    if isinstance(payload, dict):
+        return payload.get("device_id")
+    return getattr(payload, "device_id", None)
+
+
+class ExecutorCallback:
+    """Run a sync callback on ``executor`` without blocking the event loop.
+
+    Calling the wrapper only schedules the work and returns. Payloads for the same
+    device run one after another in arrival order; different devices run concurrently.
+    With a ``ProcessPoolExecutor`` the callback and payloads must be picklable.
+    """
+
+    def __init__(self, callback: Callable[[Any], Any], executor: Executor):
+        if asyncio.iscoroutinefunction(callback):
+            raise TypeError("Only synchronous callbacks can run on an executor")
+        self.callback = callback
+        self.executor = executor
+        self._tails: dict[Hashable, asyncio.Task] = {}
+
+    def __call__(self, payload: Any) -> None:
+        key = device_key(payload)
+        task = asyncio.get_running_loop().create_task(
+            self._run(self._tails.get(key), payload)
+        )
+        self._tails[key] = task
+        task.add_done_callback(lambda done: self._release(key, done))
+
+    @property
+    def pending(self) -> int:
+        """Number of devices with callbacks still queued or running."""
+        return len(self._tails)
+
+    async def join(self) -> None:
+        """Wait for every scheduled call to finish."""
+        while self._tails:
+            await asyncio.wait(list(self._tails.values()))
+
+    async def _run(self, previous: asyncio.Task | None, payload: Any) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.callback, payload
+            )
+        except Exception:
+            WS_LOGGER.exception(f"Callback {self.callback!r} raised")
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tails.get(key) is task:
+            del self._tails[key]
+
+
+class ThrottledCallback:
+    """Deliver at most one message per device every ``min_interval`` seconds.
+
+    A message arriving after the interval has passed is delivered at once. Messages
+    arriving sooner replace each other, and the newest is delivered when the interval
+    ends, so consumers see every device's latest state without every sample.
+    Whatever feeds the store, history or wind statistics still sees every frame;
+    only this callback is thinned out.
+    """
+
+    def __init__(self, callback: Callable[[Any], Any], min_interval: float):
+        if min_interval <= 0:
+            raise ValueError("min_interval must be positive")
+        self.callback = callback
+        self.min_interval = min_interval
+        self.delivered = 0
+        self.coalesced = 0
+        self._last: dict[Hashable, float] = {}
+        self._pending: dict[Hashable, Any] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def __call__(self, payload: Any) -> None:
+        loop = asyncio.get_running_loop()
+        key = device_key(payload)
+        due = self._last.get(key, float("-inf")) + self.min_interval
+        if key not in self._timers and loop.time() >= due:
+            self._deliver(key, payload)
+            return
+        if key in self._pending:
+            self.coalesced += 1
+        self._pending[key] = payload
+        if key not in self._timers:
+            self._timers[key] = loop.call_at(due, self._flush, key)
+
+    @property
+    def pending(self) -> int:
+        """Devices with a newer message waiting for their interval to end."""
+        return len(self._pending)
+
+    def _flush(self, key: Hashable) -> None:
+        del self._timers[key]
+        if key in self._pending:
+            self._deliver(key, self._pending.pop(key))
+
+    def _deliver(self, key: Hashable, payload: Any) -> None:
+        self._last[key] = asyncio.get_running_loop().time()
+        self.delivered += 1
+        if asyncio.iscoroutinefunction(self.callback):
+            task = asyncio.get_running_loop().create_task(self._run(payload))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return
+        try:
+            self.callback(payload)
+        except Exception:
+            WS_LOGGER.exception(f"Callback {self.callback!r} raised")
+
+    async def _run(self, payload: Any) -> None:
+        try:
+            await self.callback(payload)
+        except Exception:
+            WS_LOGGER.exception(f"Callback {self.callback!r} raised")
+
+    def cancel(self) -> None:
+        """Drop pending messages and stop their timers."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
+
+
+class CallbackDispatcher:
+    """One bounded queue and worker task per event type.
+
+    The callback is looked up with ``resolve(event_type)`` at delivery time, so callbacks
+    registered after start-up are honoured. Exceptions raised by a callback are logged
+    and do not stop the worker.
+    """
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Callable[[Any], Any] | None],
+        maxsize: int = 100,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+    ):
+        self.resolve = resolve
+        self.maxsize = maxsize
+        self.policy = policy
+        self.queues: dict[str, DispatchQueue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._busy: set[str] = set()
+        self._delivered = asyncio.Condition()
+
+    async def submit(self, event_type: str, payload: Any, key: Hashable = None) -> bool:
+        """Queue ``payload`` for ``event_type``; ``key`` is used by COALESCE_LATEST."""
+        if (queue := self.queues.get(event_type)) is None:
+            queue = self.queues[event_type] = DispatchQueue(self.maxsize, self.policy)
+            self._workers[event_type] = asyncio.create_task(
+                self._work(event_type, queue), name=f"WebSocketDispatch-{event_type}"
+            )
+        return await queue.put(payload, key)
+
+    async def _work(self, event_type: str, queue: DispatchQueue) -> None:
+        while True:
+            payload = await queue.get()
+            queue.stats.delivered += 1
+            self._busy.add(event_type)
+            try:
+                if (callback := self.resolve(event_type)) is not None:
+                    await invoke_callback(callback, payload)
+            except Exception:
+                WS_LOGGER.exception(f"Callback for {event_type} raised")
+            finally:
+                self._busy.discard(event_type)
+                async with self._delivered:
+                    self._delivered.notify_all()
+
+    def _idle(self) -> bool:
+        return not self._busy and not any(len(queue) for queue in self.queues.values())
+
+    async def join(self) -> None:
+        """Wait until every queued message has been delivered."""
+        async with self._delivered:
+            await self._delivered.wait_for(self._idle)
+
+    def stats(self) -> dict[str, DispatchStats]:
+        """Per event type counters (queue depth, drops, ...)."""
+        return {event_type: queue.stats for event_type, queue in self.queues.items()}
+
+    async def close(self) -> None:
+        """Cancel the worker tasks; queued messages are discarded."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self.queues.clear()
+        async with self._delivered:
+            self._delivered.notify_all()  # nothing is left to deliver
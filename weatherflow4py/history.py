@@ -0,0 +1,182 @@
+"""Fixed-memory history of websocket samples per device.
+
+``RingBuffer`` stores samples column-wise in preallocated ``array('d')`` buffers, so its
+memory is fixed at ``capacity * columns * 8`` bytes and appending a sample allocates no
+Python objects. ``DeviceHistory`` keeps one buffer per device and message type and is
+fed the raw parsed frames (``ob`` / ``obs`` lists), so recording never builds a model.
+
+Samples must arrive in time order; one older than the newest stored sample is counted
+in ``out_of_order`` and skipped, which keeps the epoch column sorted for range queries.
+"""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import fields
+from typing import Any
+
+from weatherflow4py.models.ws.obs import _to_double, obs_st
+from weatherflow4py.models.ws.types import EventType
+
+RAPID_WIND_COLUMNS = ("epoch", "wind_speed", "wind_direction")
+OBS_ST_COLUMNS = tuple(f.name for f in fields(obs_st))
+
+
+class RingBuffer:
+    """Fixed-capacity, column-oriented buffer of float64 samples; oldest are overwritten."""
+
+    def __init__(self, columns: Sequence[str], capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not columns or columns[0] != "epoch":
+            raise ValueError("The first column must be 'epoch'")
+        self.names = tuple(columns)
+        self.capacity = capacity
+        self.columns = {name: array("d", bytes(8 * capacity)) for name in self.names}
+        self._epochs = self.columns["epoch"]
+        self._head = 0  # physical index of the oldest sample
+        self._size = 0
+        self.out_of_order = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(column) * column.itemsize for column in self.columns.values())
+
+    def append(self, row: Sequence[Any]) -> bool:
+        """Store one sample (values in column order); False if it was out of order."""
+        if len(row) != len(self.names):
+            raise ValueError(f"Expected {len(self.names)} values, got {len(row)}")
+        if self._size and row[0] < self._epochs[self._physical(self._size - 1)]:
+            self.out_of_order += 1
+            return False
+
+        if self._size < self.capacity:
+            index = (self._head + self._size) % self.capacity
+            self._size += 1
+        else:
+            index = self._head
+            self._head = (self._head + 1) % self.capacity
+        for column, value in zip(self.columns.values(), row, strict=True):
+            try:
+                column[index] = value
+            except TypeError:
+                column[index] = _to_double(value)
+        return True
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def _physical(self, position: int) -> int:
+        return (self._head + position) % self.capacity
+
+    def _slice(self, start: int, stop: int) -> dict[str, array]:
+        """Logical positions ``[start, stop)`` as new arrays, in time order."""
+        first, last = self._physical(start), self._physical(stop)
+        wraps = stop - start > 0 and first >= last
+        result = {}
+        for name, column in self.columns.items():
+            if wraps:
+                result[name] = column[first:] + column[:last]
+            else:
+                result[name] = column[first : first + stop - start]
+        return result
+
+    def latest(self) -> dict[str, float] | None:
+        if not self._size:
+            return None
+        index = self._physical(self._size - 1)
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def snapshot(self) -> dict[str, array]:
+        """Every stored sample, oldest first."""
+        return self._slice(0, self._size)
+
+    def between(self, start: float, end: float) -> dict[str, array]:
+        """Samples with ``start <= epoch <= end``, found by binary search."""
+
+        def epoch_at(position: int) -> float:
+            return self._epochs[self._physical(position)]
+
+        positions = range(self._size)
+        lo = bisect.bisect_left(positions, start, key=epoch_at)
+        hi = bisect.bisect_right(positions, end, key=epoch_at)
+        return self._slice(lo, max(lo, hi))
+
+    def clear(self) -> None:
+        self._head = self._size = 0
+
+
+class DeviceHistory:
+    """One ``RingBuffer`` per device for ``rapid_wind`` and ``obs_st``.
+
+    The default capacities hold 24 hours of rapid wind (one sample every 3 s) and of
+    one-minute observations. ``max_devices`` caps the total memory; frames from further
+    devices are ignored.
+    """
+
+    layouts = {
+        EventType.RAPID_WIND.value: RAPID_WIND_COLUMNS,
+        EventType.OBSERVATION.value: OBS_ST_COLUMNS,
+    }
+
+    def __init__(
+        self,
+        rapid_wind_capacity: int = 28_800,
+        obs_st_capacity: int = 1_440,
+        max_devices: int | None = None,
+    ):
+        self.capacities = {
+            EventType.RAPID_WIND.value: rapid_wind_capacity,
+            EventType.OBSERVATION.value: obs_st_capacity,
+        }
+        self.max_devices = max_devices
+        self.buffers: dict[tuple[Hashable, str], RingBuffer] = {}
+        self._devices: set[Hashable] = set()
+
+    def record(self, data: dict[str, Any]) -> bool:
+        """Append the samples of a parsed frame; False if the frame is not tracked."""
+        message_type = data.get("type")
+        device_id = data.get("device_id")
+        if message_type not in self.layouts or device_id is None:
+            return False
+        if (buffer := self.buffers.get((device_id, message_type))) is None:
+            if device_id not in self._devices:
+                if (
+                    self.max_devices is not None
+                    and len(self._devices) >= self.max_devices
+                ):
+                    return False
+                self._devices.add(device_id)
+            buffer = self.buffers[device_id, message_type] = RingBuffer(
+                self.layouts[message_type], self.capacities[message_type]
+            )
+
+        if message_type == EventType.RAPID_WIND.value:
+            buffer.append(data["ob"])
+        else:
+            buffer.extend(data.get("obs") or ())
+        return True
+
+    def get(self, device_id: Hashable, message_type: str) -> RingBuffer | None:
+        return self.buffers.get((device_id, message_type))
+
+    def between(
+        self, device_id: Hashable, message_type: str, start: float, end: float
+    ) -> dict[str, array]:
+        """Columns of the samples in ``[start, end]`` (empty if the device is unknown)."""
+        if (buffer := self.get(device_id, message_type)) is None:
+            return {name: array("d") for name in self.layouts[message_type]}
+        return buffer.between(start, end)
+
+    def devices(self) -> list[Hashable]:
+        return list(self._devices)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self.buffers.values())
@@ -0,0 +1,230 @@
+"""One websocket connection shared by many ``WeatherFlowWebsocketAPI`` instances.
+
+A ``WebsocketHub`` owns the physical connection for one URI and the only task reading
+from it. Frames are parsed once and handed to the attached instances whose devices
+match the frame's ``device_id``; ACKs go to the instance waiting for that request id.
+``listen_start`` / ``listen_stop`` requests are reference counted per device so two
+instances listening to the same device only subscribe once, and the device is only
+unsubscribed when the last of them stops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from ssl import SSLContext
+from typing import TYPE_CHECKING, ClassVar
+
+import websockets
+import websockets.asyncio.client
+from websockets.connection import State as WebSocketState
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
+
+from weatherflow4py.codec import JsonCodec, get_codec
+from weatherflow4py.models.ws.websocket_request import WebsocketRequest
+
+from .const import WS_LOGGER
+
+if TYPE_CHECKING:
+    from weatherflow4py.ws import SubscriptionResult, WeatherFlowWebsocketAPI
+
+
+class WebsocketHub:
+    """Shared connection, reader task and subscription counts for one URI."""
+
+    hubs: ClassVar[dict[str, WebsocketHub]] = {}
+    _lock: ClassVar[asyncio.Lock | None] = None
+
+    def __init__(self, uri: str, codec: JsonCodec | None = None):
+        self.uri = uri
+        self.codec = codec or get_codec()
+        self.websocket: websockets.asyncio.client.ClientConnection | None = None
+        self.reader_task: asyncio.Task | None = None
+        self.members: list[WeatherFlowWebsocketAPI] = []
+        # (device_id, "listen" | "rapid") -> instances holding that subscription
+        self.holders: dict[tuple[object, str], set[int]] = {}
+        # id(instance) -> its devices as frames carry them (ints); empty gets everything
+        self.routes: dict[int, frozenset] = {}
+
+    @classmethod
+    async def acquire(
+        cls, uri: str, ssl_context: SSLContext | None = None
+    ) -> WebsocketHub:
+        """Return the hub for ``uri`` with an open connection and a running reader."""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if (hub := cls.hubs.get(uri)) is None:
+                hub = cls.hubs[uri] = cls(uri)
+            await hub._ensure_connected(ssl_context)
+            return hub
+
+    async def _ensure_connected(self, ssl_context: SSLContext | None) -> None:
+        """Open the socket and start the reader if either is gone.
+
+        A new socket starts without subscriptions, so the reference counts of the old
+        one are dropped, every attached instance is pointed at the new socket and
+        their subscriptions are sent again.
+        """
+        reconnected = False
+        if self.websocket is None or self.websocket.state is not WebSocketState.OPEN:
+            if ssl_context is None:
+                self.websocket = await websockets.connect(self.uri)
+            else:
+                self.websocket = await websockets.connect(self.uri, ssl=ssl_context)
+            WS_LOGGER.debug(f"WebSocket hub connected: {id(self.websocket)}")
+            self.holders.clear()
+            reconnected = bool(self.members)
+        if self.reader_task is None or self.reader_task.done():
+            self.reader_task = asyncio.create_task(
+                self._read(), name="WebSocketHubReaderTask"
+            )
+        for api in self.members:
+            api.websocket = self.websocket
+            api.listen_task = self.reader_task
+            api.is_listening = True
+        if reconnected:
+            for api in list(self.members):
+                await api._replay_subscriptions()
+
+    def attach(self, api: WeatherFlowWebsocketAPI) -> None:
+        if api not in self.members:
+            self.members.append(api)
+        self.update_routes(api)
+
+    def update_routes(self, api: WeatherFlowWebsocketAPI) -> None:
+        """Recompute the devices routed to ``api`` from its ids and subscriptions."""
+        device_ids = api.device_ids
+        if isinstance(device_ids, str | int):
+            device_ids = [device_ids]
+        routes = set()
+        for device_id in [*device_ids, *api.subscriptions]:
+            try:
+                routes.add(int(device_id))
+            except (TypeError, ValueError):
+                routes.add(device_id)
+        self.routes[id(api)] = frozenset(routes)
+
+    async def detach(self, api: WeatherFlowWebsocketAPI) -> None:
+        """Remove ``api``; the connection is closed when no instance is left."""
+        if api in self.members:
+            self.members.remove(api)
+        self.routes.pop(id(api), None)
+        for key in list(self.holders):
+            self.holders[key].discard(id(api))
+            if not self.holders[key]:
+                del self.holders[key]
+        if not self.members:
+            await self.close()
+
+    async def close(self) -> None:
+        if self.hubs.get(self.uri) is self:
+            del self.hubs[self.uri]
+        if self.reader_task is not None and not self.reader_task.done():
+            self.reader_task.cancel()
+            await asyncio.gather(self.reader_task, return_exceptions=True)
+        if self.websocket is not None:
+            try:
+                await self.websocket.close()
+            except Exception as e:
+                WS_LOGGER.error(f"Exception during WebSocket close operation: {e}")
+            self.websocket = None
+        for api in self.members:
+            api.is_listening = False
+
+    async def _read(self) -> None:
+        assert self.websocket is not None
+        try:
+            while True:
+                message = await self.websocket.recv(decode=False)
+                WS_LOGGER.debug("Received message: %s", message)
+                for recorder in {api.recorder for api in self.members} - {None}:
+                    recorder.record(message)
+                try:
+                    data = self.codec.loads(message)
+                except ValueError:
+                    WS_LOGGER.warning(f"Malformed WebSocket frame: {message!r}")
+                    continue
+                await self.route(data)
+        except ConnectionClosedOK:
+            pass
+        except ConnectionClosed as err:
+            WS_LOGGER.warning(f"WebSocket hub connection lost: {err!r}")
+        except Exception:
+            WS_LOGGER.exception("WebSocket hub reader stopped")
+        finally:
+            for api in self.members:
+                api.is_listening = False
+
+    def recipients(self, data: dict) -> list[WeatherFlowWebsocketAPI]:
+        """Instances a parsed frame belongs to.
+
+        An ACK goes to the instance waiting for its id (all instances if none is);
+        a frame with a ``device_id`` goes to instances listening to that device, or
+        that have no device list at all; anything else is broadcast.
+        """
+        if data.get("type") == "ack":
+            request_id = str(data.get("id"))
+            for api in self.members:
+                if request_id in api.pending_acks:
+                    return [api]
+            return list(self.members)
+        if (device_id := data.get("device_id")) is None:
+            return list(self.members)
+        return [
+            api
+            for api in self.members
+            if not (routes := self.routes.get(id(api))) or device_id in routes
+        ]
+
+    async def route(self, data: dict) -> None:
+        try:
+            recipients = self.recipients(data)
+        except Exception:
+            WS_LOGGER.exception(f"Cannot route WebSocket frame: {data!r}")
+            return
+        for api in recipients:
+            try:
+                await api.handle_frame(data)
+            except Exception:
+                WS_LOGGER.exception("Error handling frame in a hub member")
+
+    async def send_subscriptions(
+        self,
+        api: WeatherFlowWebsocketAPI,
+        requests: list[tuple[object, WebsocketRequest]],
+        start: bool,
+        timeout: float,
+    ) -> SubscriptionResult:
+        """Send only the requests that change the connection's subscriptions.
+
+        A start is sent when no instance holds the subscription yet; a stop when
+        ``api`` is the last holder. The rest succeed without touching the wire.
+        """
+        wire: list[tuple[object, WebsocketRequest]] = []
+        for device_id, request in requests:
+            holders = self.holders.get(self._key(device_id, request), set())
+            if (not holders) if start else holders <= {id(api)}:
+                wire.append((device_id, request))
+
+        result = await api._send_requests(wire, timeout)
+        for device_id, request in requests:
+            if device_id in result.failed:
+                continue
+            key = self._key(device_id, request)
+            if start:
+                self.holders.setdefault(key, set()).add(id(api))
+            elif key in self.holders:
+                self.holders[key].discard(id(api))
+                if not self.holders[key]:
+                    del self.holders[key]
+
+        result.acknowledged = [
+            device_id
+            for device_id in dict.fromkeys(device_id for device_id, _ in requests)
+            if device_id not in result.failed
+        ]
+        return result
+
+    @staticmethod
+    def _key(device_id: object, request: WebsocketRequest) -> tuple[object, str]:
+        return device_id, "rapid" if "rapid" in request.type else "listen"
@@ -0,0 +1,193 @@
+"""Compiled decoders for dataclasses_json models.
+
+``from_dict`` from dataclasses_json resolves type hints, collects field overrides and
+(for ``Undefined.INCLUDE`` models) re-binds the constructor signature on every call.
+``compile_decoder`` does that inspection once per model and generates a specialised
+function that reads the dict and calls the dataclass ``__init__`` directly, so the
+model's own ``__post_init__`` still runs exactly once and the resulting instance is
+equal to the one ``from_dict`` would have produced. Frozen models and per-field
+``config(decoder=...)`` overrides are supported; enums are looked up in precomputed
+value tables.
+"""
+
+from __future__ import annotations
+
+import functools
+import types
+import typing
+from collections.abc import Callable
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
+from typing import Any, TypeVar, get_type_hints
+
+from dataclasses_json import CatchAll, Undefined
+
+T = TypeVar("T")
+
+_PRIMITIVES = (int, float, str, bool)
+
+
+class _Namespace:
+    """Names referenced by the generated source of a single decoder."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    def add(self, prefix: str, value: Any) -> str:
+        name = f"_{prefix}{len(self.values)}"
+        self.values[name] = value
+        return name
+
+
+def _enum_table(enum_cls: type[Enum]) -> dict[Any, Enum]:
+    """Precomputed value -> member table; members map to themselves like ``Enum(member)``."""
+    table: dict[Any, Enum] = {member.value: member for member in enum_cls}
+    table.update({member: member for member in enum_cls})
+    return table
+
+
+def _union_decoder(options: tuple[type, ...]) -> Callable[[Any], Any]:
+    """Mirror dataclasses_json: dicts are tried against each dataclass option in order."""
+    decoders = [compile_decoder(option) for option in options if is_dataclass(option)]
+
+    def decode(value: Any) -> Any:
+        if type(value) is dict:
+            for decoder in decoders:
+                try:
+                    return decoder(value)
+                except (KeyError, ValueError, AttributeError):
+                    continue
+        return value
+
+    return decode
+
+
+def _expr(hint: Any, var: str, ns: _Namespace, depth: int = 0) -> str | None:
+    """Return an expression converting ``var`` to ``hint``, or None when it passes through."""
+    if hint is Any or isinstance(hint, TypeVar):
+        return None
+
+    if hint in _PRIMITIVES:
+        name = ns.add("type", hint)
+        return f"({var} if isinstance({var}, {name}) else {name}({var}))"
+
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        table = ns.add("table", _enum_table(hint))
+        name = ns.add("enum", hint)
+        return f"({table}[{var}] if {var} in {table} else {name}({var}))"
+
+    if isinstance(hint, type) and is_dataclass(hint):
+        name = ns.add("cls", hint)
+        decoder = ns.add("decode", compile_decoder(hint))
+        return f"({var} if isinstance({var}, {name}) else {decoder}({var}))"
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+
+    if origin is typing.Union or origin is types.UnionType:
+        options = tuple(arg for arg in args if arg is not type(None))
+        if len(options) == 1 and len(args) == 2:
+            inner = _expr(options[0], var, ns, depth)
+            return None if inner is None else f"(None if {var} is None else {inner})"
+        if not any(is_dataclass(option) for option in options):
+            return None
+        return f"{ns.add('union', _union_decoder(options))}({var})"
+
+    if origin is list:
+        item = f"item{depth}"
+        inner = _expr(args[0] if args else Any, item, ns, depth + 1)
+        if inner is None:
+            return f"list({var})"
+        return f"[{inner} for {item} in {var}]"
+
+    raise TypeError(f"Cannot compile a decoder for type hint {hint!r}")
+
+
+@functools.cache
+def decoder_for(cls: type[T]) -> Callable[[dict[str, Any]], T]:
+    """``compile_decoder(cls)``, or ``cls.from_dict`` for models it cannot compile."""
+    try:
+        return compile_decoder(cls)
+    except TypeError:
+        return cls.from_dict  # type: ignore[attr-defined]
+
+
+@functools.cache
+def compile_decoder(cls: type[T]) -> Callable[[dict[str, Any]], T]:
+    """Generate (once) and return a decoder building ``cls`` from a parsed JSON dict.
+
+    Raises:
+        TypeError: If ``cls`` uses a dataclasses_json feature the compiler does not support.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls!r} is not a dataclass")
+
+    config = getattr(cls, "dataclass_json_config", None) or {}
+    undefined = config.get("undefined")
+    if isinstance(undefined, str):
+        undefined = Undefined[undefined.upper()]
+    if undefined is Undefined.RAISE or config.get("letter_case") is not None:
+        raise TypeError(f"Cannot compile a decoder for {cls.__qualname__}")
+
+    hints = get_type_hints(cls)
+    ns = _Namespace()
+    init = getattr(cls.__init__, "__wrapped__", cls.__init__)
+    ns.values.update(_cls=cls, _init=init, _new=object.__new__)
+
+    body: list[str] = []
+    kwargs: list[str] = []
+    catch_all: str | None = None
+    if undefined is Undefined.INCLUDE:
+        catch_all = next(f.name for f in fields(cls) if hints[f.name] == CatchAll)
+        known = ns.add("known", frozenset(f.name for f in fields(cls)))
+        body.append(f"unknown = {{k: v for k, v in data.items() if k not in {known}}}")
+
+    for index, field in enumerate(fields(cls)):
+        if not field.init:
+            continue
+        overrides = field.metadata.get("dataclasses_json") or {}
+        if not overrides.keys() <= {"encoder", "decoder"}:
+            raise TypeError(
+                f"Cannot compile a decoder for {cls.__qualname__}.{field.name}"
+            )
+        if field.name == catch_all:
+            kwargs.append(f"{field.name}=unknown")
+            continue
+
+        var = f"v{index}"
+        key = repr(field.name)
+        if field.default is not MISSING:
+            default = ns.add("default", field.default)
+            body.append(f"{var} = data.get({key}, {default})")
+        elif field.default_factory is not MISSING:
+            factory = ns.add("factory", field.default_factory)
+            body.append(f"{var} = data[{key}] if {key} in data else {factory}()")
+        else:
+            body.append(f"{var} = data[{key}]")
+
+        hint = hints[field.name]
+        if overrides.get("decoder") is not None:
+            # Like from_dict: None passes through, and so does a value whose type is
+            # exactly the annotation.
+            decoder = ns.add("override", overrides["decoder"])
+            expr = f"{decoder}({var})"
+            if isinstance(hint, type):
+                expr = f"({var} if type({var}) is {ns.add('type', hint)} else {expr})"
+        else:
+            expr = _expr(hint, var, ns)
+        if expr is not None:
+            body.append(f"if {var} is not None:")
+            body.append(f"    {var} = {expr}")
+        kwargs.append(f"{field.name}={var}")
+
+    body.append("obj = _new(_cls)")
+    body.append(f"_init(obj, {', '.join(kwargs)})")
+    body.append("return obj")
+
+    source = "def decode(data):\n" + "\n".join(f"    {line}" for line in body)
+    namespace = dict(ns.values)
+    exec(compile(source, f"<decoder {cls.__qualname__}>", "exec"), namespace)
+    decode = namespace["decode"]
+    decode.__qualname__ = f"compile_decoder.<{cls.__qualname__}>"
+    decode.__source__ = source
+    return decode
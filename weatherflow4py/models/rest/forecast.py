@@ -113,11 +113,7 @@ class PrecipType(Enum):
 
     @classmethod
     def from_string(cls, value: str) -> "PrecipType":
-        value_map = {
-            "mixed_winter_precip": cls.SLEET,
-            **{member.value: member for member in cls},
-        }
-        return value_map.get(value.lower(), cls.NONE)
+        return _PRECIP_TYPES.get(value.lower(), cls.NONE)
 
     @staticmethod
     def _decoder(value):
@@ -132,6 +128,12 @@ class PrecipType(Enum):
         return value.value
 
 
+_PRECIP_TYPES = {
+    "mixed_winter_precip": PrecipType.SLEET,
+    **{member.value: member for member in PrecipType},
+}
+
+
 class PrecipIcon(Enum):
     CHANCE_RAIN = "chance-rain"
     CHANCE_SNOW = "chance-snow"
@@ -25,3 +25,16 @@ class WeatherFlowDataREST:
     @property
     def primary_device_id(self) -> int:
         return self.station.outdoor_devices[0].device_id
+
+
+class WeatherFlowDataResults(dict[int, WeatherFlowDataREST]):
+    """Data per station id from ``get_all_data``, plus the stations that failed.
+
+    ``errors`` maps the station id of every station that could not be refreshed to the
+    exception raised by its first failing request; those stations are left out of the
+    mapping itself.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: dict[int, Exception] = {}
@@ -1,7 +1,10 @@
 """Base message types for websockets."""
 
-from dataclasses import dataclass
-from typing import Any, cast
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Any, ClassVar, cast, overload
 
 from weatherflow4py.models.ws.custom_types import (
     PrecipitationAnalysisType,
@@ -10,6 +13,24 @@ from weatherflow4py.models.ws.custom_types import (
 )
 
 
+def _optional_enum(enum_class: type[Enum]) -> Callable[[Any], Any]:
+    """Build a converter to ``enum_class`` that keeps a null reading as None.
+
+    Accepts raw values, members and the doubles stored by ``ObsArray``.
+    """
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        return enum_class(int(value) if isinstance(value, float) else value)
+
+    return convert
+
+
+_to_precipitation_type = _optional_enum(PrecipitationType)
+_to_precipitation_analysis_type = _optional_enum(PrecipitationAnalysisType)
+
+
 @dataclass
 class base_obs:
     """Base observation class with a class method for creating instances from lists."""
@@ -71,9 +92,10 @@ class obs_st(base_obs):
     precipitation_analysis_type: PrecipitationAnalysisType
 
     def __post_init__(self):
-        # Transform the raw observation data into the correct instances
-        self.precipitation_type = PrecipitationType(self.precipitation_type)
-        self.precipitation_analysis_type = PrecipitationAnalysisType(
+        # Transform the raw observation data into the correct instances; a null
+        # reading stays None.
+        self.precipitation_type = _to_precipitation_type(self.precipitation_type)
+        self.precipitation_analysis_type = _to_precipitation_analysis_type(
             self.precipitation_analysis_type
         )
 
@@ -92,6 +114,344 @@ class obs_air(base_obs):
     report_interval: int
 
 
+class LazyObs:
+    """A raw observation row whose fields are converted on first access.
+
+    Attribute names and values match the ``obs_class`` dataclass; ``materialize()``
+    returns that dataclass.
+    """
+
+    __slots__ = ("_raw", "_values")
+
+    obs_class: ClassVar[type[base_obs]]
+    _index: ClassVar[dict[str, int]]
+    _converters: ClassVar[dict[str, Callable[[Any], Any]]]
+
+    def __init_subclass__(
+        cls,
+        obs_class: type[base_obs],
+        converters: dict[str, Callable[[Any], Any]] | None = None,
+        **kwargs,
+    ):
+        super().__init_subclass__(**kwargs)
+        cls.obs_class = obs_class
+        cls._index = {f.name: i for i, f in enumerate(fields(obs_class))}
+        cls._converters = converters or {}
+
+    def __init__(self, raw: list[Any]):
+        self._raw = raw
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            index = self._index[name]
+            value = self._raw[index]
+        except (KeyError, IndexError):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        if (converter := self._converters.get(name)) is None:
+            return value
+        if name not in self._values:
+            self._values[name] = converter(value)
+        return self._values[name]
+
+    def materialize(self) -> base_obs:
+        return self.obs_class.from_list(self._raw)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyObs):
+            other = other.materialize()
+        if not isinstance(other, base_obs):
+            return NotImplemented
+        return self.materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._raw!r})"
+
+
+class LazyObsSky(LazyObs, obs_class=obs_sky):
+    """Lazy ``obs_sky`` row."""
+
+    __slots__ = ()
+
+
+class LazyObsSt(
+    LazyObs,
+    obs_class=obs_st,
+    converters={
+        "precipitation_type": _to_precipitation_type,
+        "precipitation_analysis_type": _to_precipitation_analysis_type,
+    },
+):
+    """Lazy ``obs_st`` row."""
+
+    __slots__ = ()
+
+
+class LazyObsAir(LazyObs, obs_class=obs_air):
+    """Lazy ``obs_air`` row."""
+
+    __slots__ = ()
+
+
+def _column_getter(
+    index: int, convert: Callable[[float], Any] | None
+) -> Callable[["CompactObs"], Any]:
+    """Build the property getter reading one field of a ``CompactObs`` row."""
+
+    def get(self: "CompactObs") -> Any:
+        return _from_double(self._array[self._offset + index], convert)
+
+    return get
+
+
+def _from_double(value: float, convert: Callable[[float], Any] | None) -> Any:
+    if value != value:  # NaN marks a null reading
+        return None
+    return value if convert is None else convert(value)
+
+
+def _to_double(value: Any) -> float:
+    if value is None:
+        return float("nan")
+    if isinstance(value, Enum):
+        return float(value.value)
+    return float(value)
+
+
+class CompactObs:
+    """A slotted view of one observation row stored in an ``ObsArray``.
+
+    Accessors return the same values as the ``obs_class`` dataclass (``int`` fields as
+    ``int``, enums as members, null readings as ``None``) and rows compare equal to it.
+    """
+
+    __slots__ = ("_array", "_offset")
+
+    obs_class: ClassVar[type[base_obs]]
+    names: ClassVar[tuple[str, ...]]
+    converters: ClassVar[tuple[Callable[[float], Any] | None, ...]]
+
+    def __init_subclass__(
+        cls,
+        obs_class: type[base_obs],
+        converters: dict[str, Callable[[Any], Any]] | None = None,
+        **kwargs,
+    ):
+        super().__init_subclass__(**kwargs)
+        cls.obs_class = obs_class
+        obs_fields = fields(obs_class)
+        cls.names = tuple(f.name for f in obs_fields)
+        converters = converters or {}
+        cls.converters = tuple(
+            converters.get(field.name, int if field.type is int else None)
+            for field in obs_fields
+        )
+        for index, (field, convert) in enumerate(zip(obs_fields, cls.converters)):
+            setattr(cls, field.name, property(_column_getter(index, convert)))
+
+    def __init__(self, buffer: array, offset: int):
+        self._array = buffer
+        self._offset = offset
+
+    def values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.names)
+
+    def materialize(self) -> base_obs:
+        return self.obs_class(*self.values())
+
+    def __eq__(self, other):
+        if isinstance(other, (CompactObs, LazyObs)):
+            other = other.materialize()
+        if not isinstance(other, base_obs):
+            return NotImplemented
+        return self.materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.values()!r}"
+
+
+class CompactObsSky(
+    CompactObs,
+    obs_class=obs_sky,
+    converters={"precipitation_type": int, "precipitation_analysis_type": int},
+):
+    """Compact ``obs_sky`` row."""
+
+    __slots__ = ()
+
+
+class CompactObsSt(
+    CompactObs,
+    obs_class=obs_st,
+    converters={
+        "precipitation_type": _to_precipitation_type,
+        "precipitation_analysis_type": _to_precipitation_analysis_type,
+    },
+):
+    """Compact ``obs_st`` row."""
+
+    __slots__ = ()
+
+
+class CompactObsAir(CompactObs, obs_class=obs_air):
+    """Compact ``obs_air`` row."""
+
+    __slots__ = ()
+
+
+class ObsArray(Sequence):
+    """Row-major storage of many observation rows of one type in a single ``array('d')``.
+
+    Each row costs 8 bytes per field with no per-row Python objects; indexing returns a
+    ``CompactObs`` view. Null readings are stored as NaN.
+    """
+
+    compact_classes: ClassVar[dict[ObservationType, type[CompactObs]]] = {
+        ObservationType.OBS_SKY: CompactObsSky,
+        ObservationType.OBS_ST: CompactObsSt,
+        ObservationType.OBS_AIR: CompactObsAir,
+    }
+
+    def __init__(
+        self, obs_type: ObservationType, rows: Iterable[Sequence[Any] | Any] = ()
+    ):
+        self.obs_type = ObservationType(obs_type)
+        self.row_class = self.compact_classes[self.obs_type]
+        self.width = len(self.row_class.names)
+        self._array = array("d")
+        self.extend(rows)
+
+    def append(self, row: Sequence[Any] | Any) -> None:
+        """Append a raw list, or any row object exposing the field names."""
+        if isinstance(row, (base_obs, LazyObs, CompactObs)):
+            row = [getattr(row, name) for name in self.row_class.names]
+        if len(row) != self.width:
+            raise ValueError(
+                f"Expected {self.width} values for {self.obs_type.value}, got {len(row)}"
+            )
+        self._array.extend(_to_double(value) for value in row)
+
+    def extend(self, rows: Iterable[Sequence[Any] | Any]) -> None:
+        for row in rows:
+            self.append(row)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the row storage."""
+        return len(self._array) * self._array.itemsize
+
+    def __len__(self) -> int:
+        return len(self._array) // self.width
+
+    @overload
+    def __getitem__(self, index: int) -> CompactObs: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CompactObs]: ...
+
+    def __getitem__(self, index: int | slice) -> CompactObs | list[CompactObs]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("ObsArray index out of range")
+        return self.row_class(self._array, index * self.width)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ObsArray({self.obs_type.value!r}, {len(self)} rows)"
+
+
+class ObsColumns:
+    """Struct-of-arrays view of a batch of observation rows: one ``array('d')`` per field.
+
+    Columns are read as attributes (``columns.wind_avg``) or by name. Enum fields keep
+    their raw numeric codes and null readings are NaN, so every column is a plain
+    float64 buffer suitable for vectorised maths (see ``numpy()``).
+    """
+
+    def __init__(self, obs_type: ObservationType, rows: Iterable[Sequence[Any]] = ()):
+        self.obs_type = ObservationType(obs_type)
+        self.row_class = ObsArray.compact_classes[self.obs_type]
+        self.obs_class = self.row_class.obs_class
+        self.names = tuple(f.name for f in fields(self.obs_class))
+        self.columns: dict[str, array] = {}
+
+        # zip(*rows) transposes the batch in one pass over the rows.
+        transposed = list(zip(*rows, strict=True)) or [()] * len(self.names)
+        if len(transposed) != len(self.names):
+            raise ValueError(
+                f"Expected {len(self.names)} values for {self.obs_type.value}, "
+                f"got {len(transposed)}"
+            )
+        for name, values in zip(self.names, transposed, strict=True):
+            try:
+                column = array("d", values)
+            except TypeError:
+                column = array("d", (_to_double(value) for value in values))
+            self.columns[name] = column
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ObsColumns":
+        """Build from an observation payload (``type`` plus ``obs`` rows)."""
+        return cls(ObservationType(data["type"]), data.get("obs") or [])
+
+    def __getattr__(self, name: str) -> array:
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def __getitem__(self, name: str) -> array:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns[self.names[0]])
+
+    def row(self, index: int) -> base_obs:
+        """Materialise one row as the regular observation dataclass."""
+        return self.obs_class(
+            *(
+                _from_double(self.columns[name][index], convert)
+                for name, convert in zip(self.names, self.row_class.converters)
+            )
+        )
+
+    def numpy(self) -> dict[str, Any]:
+        """Zero-copy float64 NumPy views of every column.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as err:
+            raise ImportError("ObsColumns.numpy() requires numpy") from err
+        return {
+            name: np.frombuffer(column, dtype=np.float64)
+            for name, column in self.columns.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"ObsColumns({self.obs_type.value!r}, {len(self)} rows)"
+
+
 class ObservationFactory:
     """Factory class for creating observation instances from lists."""
 
@@ -118,6 +478,20 @@ class ObservationFactory:
             [obs_class.from_list(obs_item) for obs_item in obs_data],
         )
 
+    @staticmethod
+    def create_compact_observation(
+        obs_type: ObservationType, obs_data: Iterable[list[Any]]
+    ) -> ObsArray:
+        """Pack observation rows into an ``ObsArray`` instead of one dataclass per row."""
+        return ObsArray(obs_type, obs_data)
+
+    @staticmethod
+    def create_columnar_observation(
+        obs_type: ObservationType, obs_data: Iterable[list[Any]]
+    ) -> ObsColumns:
+        """Decode observation rows into one typed array per field in a single pass."""
+        return ObsColumns(obs_type, obs_data)
+
 
 @dataclass
 class WebsocketObservation:
@@ -22,3 +22,11 @@ class LightingStrikeType(str, Enum):
     ALL = "all"
     CLOUD_TO_GROUND = "cg"
     CLOUD_TO_CLOUD = "ic"
+
+
+class ConnectionState(Enum):
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+    RECONNECTING = "reconnecting"
+    CLOSED = "closed"
@@ -1,15 +1,26 @@
 """Websocket Request Messages."""
 
-import json
+import itertools
+import random
 from abc import ABC, abstractmethod
 
+from weatherflow4py.codec import get_codec
 from weatherflow4py.models.ws.types import LightingStrikeType
 
+# The server echoes ``id`` in its ``ack``; a per-process counter with a random base keeps
+# ids unique so concurrent requests can be matched to their acknowledgements.
+_request_ids = itertools.count(random.getrandbits(31))
+
+
+def new_request_id() -> str:
+    """Return a request id that no other request from this process uses."""
+    return str(next(_request_ids))
+
 
 class WebsocketRequest(ABC):
-    def __init__(self, type: str, id: str):
+    def __init__(self, type: str, id: str | None = None):
         self.type = type
-        self.id = id
+        self.id = new_request_id() if id is None else id
 
     @abstractmethod
     def to_dict(self):
@@ -17,12 +28,12 @@ class WebsocketRequest(ABC):
 
     @property
     def json(self) -> str:
-        return json.dumps(self.to_dict())
+        return get_codec().dumps(self.to_dict())
 
 
 class ListenStartMessage(WebsocketRequest):
-    def __init__(self, device_id: str):
-        super().__init__("listen_start", "2098388936")
+    def __init__(self, device_id: str, id: str | None = None):
+        super().__init__("listen_start", id)
         self.device_id = device_id
 
     def to_dict(self):
@@ -30,8 +41,8 @@ class ListenStartMessage(WebsocketRequest):
 
 
 class ListenStopMessage(WebsocketRequest):
-    def __init__(self, device_id: str):
-        super().__init__("listen_stop", "2098388936")
+    def __init__(self, device_id: str, id: str | None = None):
+        super().__init__("listen_stop", id)
         self.device_id = device_id
 
     def to_dict(self):
@@ -46,8 +57,9 @@ class GeoStrikeListenStartMessage(WebsocketRequest):
         lon_min: float,
         lon_max: float,
         strike_type: LightingStrikeType | None = None,
+        id: str | None = None,
     ):
-        super().__init__("geo_strike_listen_start", "whatever")
+        super().__init__("geo_strike_listen_start", id)
         self.lat_min = lat_min
         self.lat_max = lat_max
         self.lon_min = lon_min
@@ -69,8 +81,8 @@ class GeoStrikeListenStartMessage(WebsocketRequest):
 
 
 class RapidWindListenStartMessage(WebsocketRequest):
-    def __init__(self, device_id: str):
-        super().__init__("listen_rapid_start", "2098388542")
+    def __init__(self, device_id: str, id: str | None = None):
+        super().__init__("listen_rapid_start", id)
         self.device_id = device_id
 
     def to_dict(self):
@@ -78,8 +90,8 @@ class RapidWindListenStartMessage(WebsocketRequest):
 
 
 class RapidWindListenStopMessage(WebsocketRequest):
-    def __init__(self, device_id: str):
-        super().__init__("listen_rapid_stop", "2098388587")
+    def __init__(self, device_id: str, id: str | None = None):
+        super().__init__("listen_rapid_stop", id)
         self.device_id = device_id
 
     def to_dict(self):
@@ -7,14 +7,24 @@ Documentation form:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, cast
+import builtins
+from dataclasses import MISSING, dataclass, fields
+from functools import cached_property
+from typing import Any, ClassVar, cast
 
 from dataclasses_json import dataclass_json, Undefined, CatchAll
 
+from weatherflow4py.models.decoder import compile_decoder
 from weatherflow4py.models.rest.device import Summary
 from weatherflow4py.models.rest.forecast import WindDirection
-from weatherflow4py.models.ws.obs import WebsocketObservation
+from weatherflow4py.models.ws.custom_types import ObservationType
+from weatherflow4py.models.ws.obs import (
+    LazyObs,
+    LazyObsAir,
+    LazyObsSky,
+    LazyObsSt,
+    WebsocketObservation,
+)
 
 
 @dataclass_json(undefined=Undefined.INCLUDE)
@@ -154,7 +164,7 @@ class RapidWindWS(BaseResponseWS):
 @dataclass
 class ObservationAirWS(BaseResponseWS, WebsocketObservation):
     device_id: int
-    summary: Summary
+    summary: Summary | None  # None for LAN (UDP) broadcasts
     source: str
     serial_number: str
     hub_sn: str
@@ -165,7 +175,7 @@ class ObservationAirWS(BaseResponseWS, WebsocketObservation):
 @dataclass
 class ObservationSkyWS(BaseResponseWS, WebsocketObservation):
     device_id: int
-    summary: Summary
+    summary: Summary | None  # None for LAN (UDP) broadcasts
     source: str
     serial_number: str
     hub_sn: str
@@ -176,7 +186,7 @@ class ObservationSkyWS(BaseResponseWS, WebsocketObservation):
 @dataclass
 class ObservationTempestWS(BaseResponseWS, WebsocketObservation):
     device_id: int
-    summary: Summary
+    summary: Summary | None  # None for LAN (UDP) broadcasts
     source: str
     serial_number: str
     hub_sn: str
@@ -189,28 +199,156 @@ class ConnectionOpenWS(BaseResponseWS):
     pass
 
 
+class LazyObservationWS:
+    """Mixin for observation frames that keep the parsed message and decode on access.
+
+    Only the required keys are checked up front. ``obs`` rows are ``LazyObs`` views of
+    the raw lists, and ``summary`` / ``unknown_fields`` are built the first time they
+    are read. ``materialize()`` returns the regular model, and instances compare equal
+    to it.
+    """
+
+    # ``type`` is shadowed by the property below while annotations are evaluated.
+    model: ClassVar[builtins.type[BaseResponseWS]]
+    row_class: ClassVar[builtins.type[LazyObs]]
+    _known: ClassVar[frozenset[str]]
+    _required: ClassVar[frozenset[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model_fields = fields(cls.model)
+        cls._known = frozenset(f.name for f in model_fields)
+        cls._required = frozenset(
+            f.name
+            for f in model_fields
+            if f.default is MISSING
+            and f.default_factory is MISSING
+            and f.name != "unknown_fields"
+        )
+
+    def __init__(self, data: dict):
+        if not self._required <= data.keys():
+            raise KeyError(sorted(self._required - data.keys()))
+        self._data = data
+
+    @cached_property
+    def type(self) -> ObservationType:
+        return ObservationType(self._data["type"])
+
+    @property
+    def device_id(self) -> int:
+        return self._data["device_id"]
+
+    @cached_property
+    def obs(self) -> list[LazyObs]:
+        return [self.row_class(row) for row in self._data["obs"]]
+
+    @property
+    def first(self) -> LazyObs:
+        return self.obs[0]
+
+    @cached_property
+    def summary(self) -> Summary | None:
+        if (summary := self._data["summary"]) is None:
+            return None
+        return compile_decoder(Summary)(summary)
+
+    @property
+    def source(self) -> str:
+        return self._data["source"]
+
+    @property
+    def serial_number(self) -> str:
+        return self._data["serial_number"]
+
+    @property
+    def hub_sn(self) -> str:
+        return self._data["hub_sn"]
+
+    @property
+    def firmware_revision(self) -> str:
+        return self._data["firmware_revision"]
+
+    @cached_property
+    def unknown_fields(self) -> dict[str, Any]:
+        return {k: v for k, v in self._data.items() if k not in self._known}
+
+    def materialize(self) -> BaseResponseWS:
+        """Decode the whole frame into the regular model."""
+        return compile_decoder(self.model)(self._data)
+
+    def to_dict(self, encode_json=False) -> dict[str, Any]:
+        return cast(Any, self.materialize()).to_dict(encode_json=encode_json)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyObservationWS):
+            other = other.materialize()
+        if not isinstance(other, BaseResponseWS):
+            return NotImplemented
+        return self.materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class LazyObservationAirWS(LazyObservationWS, ObservationAirWS):
+    model = ObservationAirWS
+    row_class = LazyObsAir
+
+
+class LazyObservationSkyWS(LazyObservationWS, ObservationSkyWS):
+    model = ObservationSkyWS
+    row_class = LazyObsSky
+
+
+class LazyObservationTempestWS(LazyObservationWS, ObservationTempestWS):
+    model = ObservationTempestWS
+    row_class = LazyObsSt
+
+
 class WebsocketResponseBuilder:
-    @staticmethod
-    def build_response(data: dict):
-        type_class_map = {
-            "ack": AcknowledgementWS,
-            "evt_precip": RainStartEventWS,
-            "evt_strike": LightningStrikeEventWS,
-            "rapid_wind": RapidWindWS,
-            "obs_air": ObservationAirWS,
-            "obs_sky": ObservationSkyWS,
-            "obs_st": ObservationTempestWS,
-            "connection_opened": ConnectionOpenWS,
-        }
+    type_class_map: ClassVar[dict[str, type[BaseResponseWS]]] = {
+        "ack": AcknowledgementWS,
+        "evt_precip": RainStartEventWS,
+        "evt_strike": LightningStrikeEventWS,
+        "rapid_wind": RapidWindWS,
+        "obs_air": ObservationAirWS,
+        "obs_sky": ObservationSkyWS,
+        "obs_st": ObservationTempestWS,
+        "connection_opened": ConnectionOpenWS,
+    }
+    lazy_class_map: ClassVar[dict[str, type[LazyObservationWS]]] = {
+        "obs_air": LazyObservationAirWS,
+        "obs_sky": LazyObservationSkyWS,
+        "obs_st": LazyObservationTempestWS,
+    }
 
+    @staticmethod
+    def build_response(data: dict, compiled: bool = False, lazy: bool = False):
+        """Build the response model for a parsed websocket message.
+
+        Args:
+            data (dict): The decoded JSON message.
+            compiled (bool): Decode through a generated per-class decoder
+                (see ``weatherflow4py.models.decoder``) instead of ``from_dict``.
+                Both produce equal models.
+            lazy (bool): Return ``LazyObservation*WS`` for observation frames, which
+                decode fields on first access and compare equal to the full models.
+        """
         response_type = data.get("type")
         if response_type is None:
             raise ValueError(f"Invalid type: {response_type}")
-        response_class = type_class_map.get(response_type)
+        response_class = WebsocketResponseBuilder.type_class_map.get(response_type)
 
         if response_class is None:
             raise ValueError(f"Invalid type: {response_type}")
         try:
+            if lazy and response_type in WebsocketResponseBuilder.lazy_class_map:
+                return WebsocketResponseBuilder.lazy_class_map[response_type](data)
+            if compiled:
+                return compile_decoder(response_class)(data)
             return cast(Any, response_class).from_dict(data)
         except KeyError as exec:
             if data.get("status", {}).get("status_message") == "SUCCESS":
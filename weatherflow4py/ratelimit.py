@@ -0,0 +1,140 @@
+"""Token-bucket rate limiting for the REST API.
+
+WeatherFlow allows about 100 REST requests per minute per user with some burst
+capacity. ``TokenBucket.for_token`` returns one bucket per API token for the whole
+process, so every ``WeatherFlowRestAPI`` instance using the token draws from the same
+budget. Requests that have to wait are granted round-robin across endpoints, so a
+refresh that queues forty forecasts cannot starve an observation request, and within
+one endpoint in arrival order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import ClassVar
+
+
+@dataclass
+class RateLimitStats:
+    """Requests let through and the time they spent waiting for a token, in seconds."""
+
+    requests: int = 0
+    throttled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class TokenBucket:
+    """``rate`` tokens per second up to ``burst``; each request takes one."""
+
+    buckets: ClassVar[dict[str, TokenBucket]] = {}
+
+    def __init__(self, rate: float, burst: int = 10):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.stats = RateLimitStats()
+        self.family_stats: dict[Hashable, RateLimitStats] = {}  # per ``acquire`` key
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: OrderedDict[Hashable, deque[asyncio.Future]] = OrderedDict()
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def for_token(
+        cls, api_token: str, requests_per_minute: float = 100, burst: int = 10
+    ) -> TokenBucket:
+        """The process-wide bucket for ``api_token``, created on first use.
+
+        The first caller's limits apply; later callers share the existing bucket.
+        """
+        if (bucket := cls.buckets.get(api_token)) is None:
+            bucket = cls.buckets[api_token] = cls(requests_per_minute / 60, burst)
+        return bucket
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, key: Hashable = None) -> float:
+        """Take a token, waiting for one if needed; returns the seconds waited.
+
+        Waiting requests with different ``key`` (endpoint) values take turns.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Waiters and timers of a previous (closed) loop can never complete.
+            self._loop = loop
+            self._waiters.clear()
+            self._timer = None
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self._record(key, 0.0)
+            return 0.0
+
+        started = loop.time()
+        future = loop.create_future()
+        self._waiters.setdefault(key, deque()).append(future)
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                self._tokens += 1  # granted just before the cancellation
+                self._grant()
+            elif (queue := self._waiters.get(key)) is not None and future in queue:
+                queue.remove(future)
+                if not queue:
+                    del self._waiters[key]
+            raise
+        waited = loop.time() - started
+        self._record(key, waited)
+        return waited
+
+    def _record(self, key: Hashable, waited: float) -> None:
+        if (family := self.family_stats.get(key)) is None:
+            family = self.family_stats[key] = RateLimitStats()
+        for stats in (self.stats, family):
+            stats.requests += 1
+            if waited > 0:
+                stats.throttled += 1
+                stats.total_wait += waited
+                stats.max_wait = max(stats.max_wait, waited)
+
+    def _schedule(self) -> None:
+        if self._waiters and self._timer is None and self._loop is not None:
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            self._timer = self._loop.call_later(delay, self._grant)
+
+    def _grant(self) -> None:
+        self._timer = None
+        self._refill()
+        while self._tokens >= 1 and self._waiters:
+            key, queue = next(iter(self._waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self._waiters.move_to_end(key)  # next endpoint's turn
+            else:
+                del self._waiters[key]
+            self._tokens -= 1
+            future.set_result(None)
+        self._schedule()
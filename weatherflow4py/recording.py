@@ -0,0 +1,140 @@
+"""Record raw websocket frames to disk and replay them without a network.
+
+A recording starts with an 8-byte magic followed by one record per frame: a
+little-endian float64 receive time (epoch seconds), a uint32 length and the raw frame
+bytes. Files are append-only; ``compress=True`` writes gzip, and since gzip members
+concatenate, a compressed recording can be appended to as well.
+
+``FrameReplayer`` feeds a recording through ``WeatherFlowWebsocketAPI.handle_frame`` —
+the same decode, store and callback path as ``listen()`` — at real time, N times real
+time or as fast as possible.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import struct
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING
+
+from .const import WS_LOGGER
+
+if TYPE_CHECKING:
+    from weatherflow4py.ws import WeatherFlowReceiver
+
+MAGIC = b"WF4PYRC1"
+_RECORD = struct.Struct("<dI")
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class FrameRecorder:
+    """Append frames with their receive time to ``path``."""
+
+    def __init__(self, path: str | os.PathLike, compress: bool = False):
+        self.path = os.fspath(path)
+        self.compress = compress
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file: IO[bytes] = (
+            gzip.open(self.path, "ab") if compress else open(self.path, "ab")
+        )
+        if new:
+            self._file.write(MAGIC)
+        self.frames = 0
+
+    def record(self, frame: bytes | str, received_at: float | None = None) -> None:
+        if isinstance(frame, str):
+            frame = frame.encode()
+        received_at = time.time() if received_at is None else received_at
+        self._file.write(_RECORD.pack(received_at, len(frame)))
+        self._file.write(frame)
+        self.frames += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> FrameRecorder:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_frames(path: str | os.PathLike) -> Iterator[tuple[float, bytes]]:
+    """Yield ``(received_at, frame)`` from a recording, compressed or not.
+
+    Raises:
+        ValueError: If the file is not a recording or ends in the middle of a record.
+    """
+    with open(path, "rb") as raw:
+        compressed = raw.read(2) == _GZIP_MAGIC
+    with gzip.open(path, "rb") if compressed else open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a frame recording")
+        while header := file.read(_RECORD.size):
+            if len(header) < _RECORD.size:
+                raise ValueError("Truncated frame header")
+            received_at, length = _RECORD.unpack(header)
+            frame = file.read(length)
+            if len(frame) < length:
+                raise ValueError("Truncated frame")
+            yield received_at, frame
+
+
+@dataclass
+class ReplayStats:
+    frames: int = 0
+    malformed: int = 0  # frames the codec could not parse; skipped like ``listen()``
+    elapsed: float = 0.0
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.elapsed if self.elapsed else float("inf")
+
+
+class FrameReplayer:
+    """Replay a recording into ``api`` with the original spacing scaled by ``speed``.
+
+    ``speed=1`` reproduces the recorded timing, ``speed=10`` runs ten times faster and
+    ``speed=None`` replays back to back, which measures decode and dispatch throughput.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        api: WeatherFlowReceiver,
+        speed: float | None = 1.0,
+    ):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (or None for maximum speed)")
+        self.path = path
+        self.api = api
+        self.speed = speed
+
+    async def run(self) -> ReplayStats:
+        stats = ReplayStats()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first: float | None = None
+        for received_at, frame in read_frames(self.path):
+            if self.speed is not None:
+                first = received_at if first is None else first
+                delay = started + (received_at - first) / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                data = self.api.codec.loads(frame)
+            except ValueError:
+                WS_LOGGER.warning(f"Malformed recorded frame: {frame!r}")
+                stats.malformed += 1
+                continue
+            await self.api.handle_frame(data)
+            stats.frames += 1
+        stats.elapsed = loop.time() - started
+        return stats
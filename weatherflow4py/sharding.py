@@ -0,0 +1,252 @@
+"""Spread a large device fleet across several websocket connections.
+
+Every connection serialises its devices through one TCP stream and one reader task.
+``ShardedWebsocketClient`` keeps at most ``devices_per_connection`` devices on each
+connection, opening shards as devices are added and folding them back together when
+devices are removed. Each shard is a supervised ``WeatherFlowWebsocketAPI`` with its own
+socket; their frames are merged into one set of callbacks and one ``stream()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import AsyncIterator, Callable, Iterable
+from ssl import SSLContext
+from typing import Any
+
+from weatherflow4py.dispatch import invoke_callback
+from weatherflow4py.models.ws.types import ConnectionState, EventType
+from weatherflow4py.ws import (
+    ReconnectPolicy,
+    SubscriptionResult,
+    WeatherFlowWebsocketAPI,
+)
+
+from .const import WS_LOGGER
+
+
+class _Shard(WeatherFlowWebsocketAPI):
+    """A dedicated connection whose frames are delivered by the owning client."""
+
+    def __init__(self, client: ShardedWebsocketClient, access_token: str, **kwargs):
+        super().__init__(access_token, **kwargs)
+        self.client = client
+        self.connected = asyncio.Event()
+        self.register_connection_state_callback(self._track_state)
+
+    def _track_state(self, state: ConnectionState) -> None:
+        if state is ConnectionState.CONNECTED:
+            self.connected.set()
+        else:
+            self.connected.clear()
+
+    async def _dispatch(self, event_type: str, payload, device_id=None) -> None:
+        await self.client._deliver(event_type, payload)
+
+
+class ShardedWebsocketClient:
+    """Websocket client that shards devices over several connections."""
+
+    def __init__(
+        self,
+        access_token: str,
+        devices_per_connection: int = 100,
+        ssl_context: SSLContext | None = None,
+        reconnect: ReconnectPolicy | None = None,
+        connect_timeout: float = 10.0,
+        **api_kwargs,
+    ):
+        """
+        Args:
+            access_token (str): The WeatherFlow API token.
+            devices_per_connection (int): Most devices subscribed on one connection.
+            ssl_context (SSLContext | None): Passed to every shard's connection.
+            reconnect (ReconnectPolicy | None): Backoff used by every shard.
+            connect_timeout (float): How long ``add_devices`` waits for a new shard.
+            **api_kwargs: Forwarded to each shard's ``WeatherFlowWebsocketAPI``
+                (``compiled_decoders``, ``lazy_observations``, ``codec``).
+        """
+        if devices_per_connection < 1:
+            raise ValueError("devices_per_connection must be at least 1")
+        self.access_token = access_token
+        self.devices_per_connection = devices_per_connection
+        self.ssl_context = ssl_context
+        self.reconnect = reconnect
+        self.connect_timeout = connect_timeout
+        self.api_kwargs = api_kwargs
+        self.shards: list[_Shard] = []
+        self.assignments: dict[Any, _Shard] = {}  # device_id -> shard
+        self.callbacks: dict[str, Callable[[Any], Any]] = {}
+        self._streams: list[asyncio.Queue] = []
+
+    def register_callback(
+        self, message_type: EventType | str, callback: Callable[[Any], Any]
+    ) -> None:
+        """Register one callback for ``message_type`` across all shards."""
+        key = (
+            message_type.value if isinstance(message_type, EventType) else message_type
+        )
+        self.callbacks[key] = callback
+
+    async def stream(self, maxsize: int = 1000) -> AsyncIterator[tuple[str, Any]]:
+        """Yield ``(event_type, message)`` for every frame from every shard.
+
+        A consumer that falls ``maxsize`` messages behind loses the oldest ones.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._streams.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._streams.remove(queue)
+
+    async def _deliver(self, event_type: str, payload: Any) -> None:
+        for queue in self._streams:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait((event_type, payload))
+        if (callback := self.callbacks.get(event_type)) is not None:
+            try:
+                await invoke_callback(callback, payload)
+            except Exception:
+                WS_LOGGER.exception(f"Callback for {event_type} raised")
+
+    def shard_of(self, device_id: Any) -> WeatherFlowWebsocketAPI | None:
+        return self.assignments.get(device_id)
+
+    def _devices(self, shard: _Shard) -> list:
+        return [device for device, owner in self.assignments.items() if owner is shard]
+
+    def _shards_needed(self, devices: int) -> int:
+        return math.ceil(devices / self.devices_per_connection)
+
+    async def _start_shard(self) -> _Shard:
+        shard = _Shard(self, self.access_token, **self.api_kwargs)
+        self.shards.append(shard)
+        await shard.run_supervised(self.ssl_context, self.reconnect)
+        return shard
+
+    async def _subscribe(
+        self, plan: dict[_Shard, list], rapid_wind: bool, timeout: float
+    ) -> SubscriptionResult:
+        async def subscribe(shard: _Shard, devices: list) -> SubscriptionResult:
+            try:
+                await asyncio.wait_for(shard.connected.wait(), self.connect_timeout)
+            except TimeoutError:
+                return SubscriptionResult(
+                    failed=dict.fromkeys(devices, "connection not established")
+                )
+            return await shard.subscribe_many(devices, rapid_wind, timeout)
+
+        shards = [shard for shard, devices in plan.items() if devices]
+        results = await asyncio.gather(
+            *(subscribe(shard, plan[shard]) for shard in shards)
+        )
+        merged = SubscriptionResult()
+        for shard, result in zip(shards, results, strict=True):
+            merged.acknowledged.extend(result.acknowledged)
+            merged.failed.update(result.failed)
+            for device_id in result.failed:
+                if self.assignments.get(device_id) is shard:
+                    del self.assignments[device_id]
+        return merged
+
+    async def add_devices(
+        self, device_ids: Iterable, rapid_wind: bool = True, timeout: float = 5.0
+    ) -> SubscriptionResult:
+        """Subscribe new devices, opening connections as the per-connection limit requires.
+
+        Each device goes to the least loaded shard; all shards subscribe concurrently.
+        Devices that fail to subscribe are not kept.
+        """
+        new = [
+            device
+            for device in dict.fromkeys(device_ids)
+            if device not in self.assignments
+        ]
+        while len(self.shards) < self._shards_needed(len(self.assignments) + len(new)):
+            await self._start_shard()
+
+        plan: dict[_Shard, list] = {shard: [] for shard in self.shards}
+        load = {shard: len(self._devices(shard)) for shard in self.shards}
+        for device_id in new:
+            shard = min(self.shards, key=load.__getitem__)
+            plan[shard].append(device_id)
+            load[shard] += 1
+            self.assignments[device_id] = shard
+        return await self._subscribe(plan, rapid_wind, timeout)
+
+    async def remove_devices(
+        self, device_ids: Iterable, timeout: float = 5.0
+    ) -> SubscriptionResult:
+        """Unsubscribe devices, then close connections that are no longer needed."""
+        plan: dict[_Shard, list] = {}
+        for device_id in dict.fromkeys(device_ids):
+            if (shard := self.assignments.pop(device_id, None)) is not None:
+                plan.setdefault(shard, []).append(device_id)
+
+        results = await asyncio.gather(
+            *(
+                shard.unsubscribe_many(devices, timeout=timeout)
+                for shard, devices in plan.items()
+            )
+        )
+        merged = SubscriptionResult()
+        for result in results:
+            merged.acknowledged.extend(result.acknowledged)
+            merged.failed.update(result.failed)
+        await self.rebalance(timeout)
+        return merged
+
+    async def rebalance(self, timeout: float = 5.0) -> None:
+        """Move devices off surplus shards and close them.
+
+        Runs after ``remove_devices``; the least loaded shards are drained first so the
+        fewest devices have to move.
+        """
+        needed = self._shards_needed(len(self.assignments))
+        surplus = sorted(self.shards, key=lambda shard: len(self._devices(shard)))
+        surplus = surplus[: len(self.shards) - needed]
+        if not surplus:
+            return
+
+        keep = [shard for shard in self.shards if shard not in surplus]
+        load = {shard: len(self._devices(shard)) for shard in keep}
+        plan: dict[_Shard, list] = {shard: [] for shard in keep}
+        rapid: dict[Any, bool] = {}
+        for shard in surplus:
+            devices = self._devices(shard)
+            rapid.update(
+                {device: shard.subscriptions.get(device, True) for device in devices}
+            )
+            await shard.unsubscribe_many(devices, timeout=timeout)
+            self.shards.remove(shard)
+            await shard.close()
+            for device_id in devices:
+                target = min(keep, key=load.__getitem__)
+                plan[target].append(device_id)
+                load[target] += 1
+                self.assignments[device_id] = target
+
+        for rapid_wind in (True, False):
+            subset = {
+                shard: [device for device in devices if rapid[device] is rapid_wind]
+                for shard, devices in plan.items()
+            }
+            result = await self._subscribe(subset, rapid_wind, timeout)
+            for device_id, reason in result.failed.items():
+                WS_LOGGER.warning(
+                    f"Failed to move {device_id} to another shard: {reason}"
+                )
+
+    def stats(self) -> list[int]:
+        """Number of devices on each connection."""
+        return [len(self._devices(shard)) for shard in self.shards]
+
+    async def close(self) -> None:
+        """Unsubscribe every device and close all connections."""
+        shards, self.shards = self.shards, []
+        self.assignments.clear()
+        await asyncio.gather(*(shard.close() for shard in shards))
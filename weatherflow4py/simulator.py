@@ -0,0 +1,340 @@
+"""A local stand-in for ``wss://ws.weatherflow.com`` for load tests and benchmarks.
+
+``WeatherFlowSimulator`` serves the websocket protocol on localhost: it acknowledges
+``listen_start``, ``listen_rapid_start`` and ``geo_strike_listen_start`` (and the
+matching ``*_stop`` requests) and streams synthetic ``obs_st``, ``rapid_wind``,
+``evt_strike`` and ``evt_precip`` frames for its virtual devices at configurable
+per-device intervals. Point a client at it with ``WeatherFlowWebsocketAPI(token,
+uri=simulator.uri)``.
+
+Each stream sends one frame at a time, round-robin over the devices a connection is
+subscribed to, so the load is spread evenly instead of arriving in bursts. With
+``stamp_frames=True`` every frame carries a ``sent_at`` wall-clock time for latency
+measurements; clients keep it in ``unknown_fields``.
+
+Usage:
+    python -m weatherflow4py.simulator [--devices 100] [--port 8765]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+from weatherflow4py.codec import JsonCodec, get_codec
+from weatherflow4py.models.ws.types import EventType
+
+from .const import WS_LOGGER
+
+_SUMMARY = {
+    "pressure_trend": "steady",
+    "strike_count_1h": 0,
+    "strike_count_3h": 0,
+    "precip_total_1h": 0.0,
+    "strike_last_dist": None,
+    "strike_last_epoch": None,
+    "precip_accum_local_yesterday": 0.0,
+    "precip_accum_local_yesterday_final": 0.0,
+    "precip_analysis_type_yesterday": 0,
+    "feels_like": 20.0,
+    "heat_index": 20.0,
+    "wind_chill": 20.0,
+}
+
+
+@dataclass
+class SimulatorStats:
+    connections: int = 0
+    requests: int = 0
+    frames_sent: int = 0
+    frames_by_type: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Session:
+    """Subscriptions of one client connection."""
+
+    listen: list[int] = field(default_factory=list)
+    rapid: list[int] = field(default_factory=list)
+    geo_strike: list[dict[str, Any]] = field(default_factory=list)
+
+
+class WeatherFlowSimulator:
+    """Serve synthetic WeatherFlow websocket traffic for ``devices`` virtual devices.
+
+    Intervals are seconds between frames of one kind for one device; ``None`` disables
+    that kind. ``obs_st``, ``evt_strike`` and ``evt_precip`` go to ``listen_start``
+    subscribers, ``rapid_wind`` to ``listen_rapid_start`` subscribers. Requests for
+    device ids outside the virtual range are acknowledged but produce no traffic.
+    """
+
+    def __init__(
+        self,
+        devices: int = 10,
+        first_device_id: int = 100_000,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        obs_interval: float | None = 60.0,
+        rapid_wind_interval: float | None = 3.0,
+        strike_interval: float | None = None,
+        precip_interval: float | None = None,
+        stamp_frames: bool = False,
+        seed: int | None = None,
+        codec: JsonCodec | None = None,
+    ):
+        if devices < 1:
+            raise ValueError("devices must be at least 1")
+        for name, interval in (
+            ("obs_interval", obs_interval),
+            ("rapid_wind_interval", rapid_wind_interval),
+            ("strike_interval", strike_interval),
+            ("precip_interval", precip_interval),
+        ):
+            if interval is not None and interval <= 0:
+                raise ValueError(f"{name} must be positive (or None to disable)")
+        self.device_ids = list(range(first_device_id, first_device_id + devices))
+        self.host = host
+        self.port = port
+        self.stamp_frames = stamp_frames
+        self.codec = codec or get_codec()
+        self.stats = SimulatorStats()
+        self._known = set(self.device_ids)
+        self._random = random.Random(seed)
+        self._server: Server | None = None
+        # (message type, interval, subscription list, frame builder)
+        self._streams: list[tuple[str, float, str, Callable[[int], dict]]] = [
+            (message_type, interval, subscription, builder)
+            for message_type, interval, subscription, builder in (
+                (EventType.OBSERVATION.value, obs_interval, "listen", self.obs_st),
+                (EventType.RAPID_WIND.value, rapid_wind_interval, "rapid", self.rapid_wind),
+                (EventType.LIGHTNING_STRIKE.value, strike_interval, "listen", self.strike),
+                (EventType.RAIN.value, precip_interval, "listen", self.precip),
+            )
+            if interval is not None
+        ]  # fmt: skip
+
+    @property
+    def uri(self) -> str:
+        """The URI to hand to ``WeatherFlowWebsocketAPI(uri=...)`` once started."""
+        if self._server is None:
+            raise RuntimeError("The simulator is not running")
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://{self.host}:{port}/swd/data"
+
+    async def start(self) -> WeatherFlowSimulator:
+        self._server = await serve(self._handle, self.host, self.port)
+        WS_LOGGER.debug(f"Simulator listening on {self.uri}")
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def __aenter__(self) -> WeatherFlowSimulator:
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    # Frames
+
+    def _frame(self, message_type: str, device_id: int, **fields: Any) -> dict:
+        frame = {
+            "type": message_type,
+            "device_id": device_id,
+            "serial_number": f"ST-{device_id:08d}",
+            "hub_sn": f"HB-{device_id:08d}",
+            **fields,
+        }
+        if self.stamp_frames:
+            frame["sent_at"] = time.time()
+        return frame
+
+    def obs_st(self, device_id: int) -> dict:
+        r = self._random
+        wind_avg = round(r.uniform(0, 12), 2)
+        return self._frame(
+            EventType.OBSERVATION.value,
+            device_id,
+            source="enhanced",
+            firmware_revision="176",
+            summary=_SUMMARY,
+            obs=[
+                [
+                    int(time.time()),
+                    round(wind_avg * 0.6, 2),
+                    wind_avg,
+                    round(wind_avg * 1.5, 2),
+                    r.randrange(360),
+                    3,
+                    round(r.uniform(990, 1030), 2),
+                    round(r.uniform(-10, 35), 1),
+                    r.randrange(20, 100),
+                    r.randrange(0, 100_000),
+                    round(r.uniform(0, 11), 2),
+                    r.randrange(0, 1000),
+                    0.0,
+                    0,
+                    0,
+                    0,
+                    round(r.uniform(2.4, 2.8), 2),
+                    1,
+                    0.0,
+                    0.0,
+                    0.0,
+                    0,
+                ]
+            ],
+        )
+
+    def rapid_wind(self, device_id: int) -> dict:
+        r = self._random
+        return self._frame(
+            EventType.RAPID_WIND.value,
+            device_id,
+            ob=[time.time(), round(r.uniform(0, 15), 2), r.randrange(360)],
+        )
+
+    def strike(self, device_id: int) -> dict:
+        r = self._random
+        return self._frame(
+            EventType.LIGHTNING_STRIKE.value,
+            device_id,
+            evt=[int(time.time()), r.randrange(1, 40), r.randrange(1, 10_000)],
+        )
+
+    def precip(self, device_id: int) -> dict:
+        return self._frame(EventType.RAIN.value, device_id, evt=[int(time.time())])
+
+    # Protocol
+
+    async def _handle(self, connection: ServerConnection) -> None:
+        self.stats.connections += 1
+        session = _Session()
+        await self._send(connection, {"type": "connection_opened"})
+        streams = [
+            asyncio.create_task(
+                self._stream(
+                    connection, getattr(session, subscription), interval, build
+                )
+            )
+            for _, interval, subscription, build in self._streams
+        ]
+        try:
+            async for raw in connection:
+                request = self.codec.loads(raw)
+                self._request(session, request)
+                await self._send(connection, {"type": "ack", "id": request.get("id")})
+        except ConnectionClosed:
+            pass
+        finally:
+            for task in streams:
+                task.cancel()
+            await asyncio.gather(*streams, return_exceptions=True)
+
+    def _request(self, session: _Session, request: dict) -> None:
+        self.stats.requests += 1
+        request_type = request.get("type")
+        device_id = request.get("device_id")
+        if request_type == "geo_strike_listen_start":
+            session.geo_strike.append(request)
+            return
+        if request_type == "geo_strike_listen_stop":
+            session.geo_strike.clear()
+            return
+        subscribed = {
+            "listen_start": session.listen,
+            "listen_stop": session.listen,
+            "listen_rapid_start": session.rapid,
+            "listen_rapid_stop": session.rapid,
+        }.get(request_type)
+        if subscribed is None or device_id not in self._known:
+            return
+        if request_type.endswith("_start") and device_id not in subscribed:
+            subscribed.append(device_id)
+        elif request_type.endswith("_stop") and device_id in subscribed:
+            subscribed.remove(device_id)
+
+    async def _stream(
+        self,
+        connection: ServerConnection,
+        devices: list[int],
+        interval: float,
+        build: Callable[[int], dict],
+    ) -> None:
+        """Send ``build(device)`` for every device in ``devices`` once per ``interval``."""
+        loop = asyncio.get_running_loop()
+        position = 0
+        next_at = loop.time()
+        while True:
+            if not devices:
+                next_at = loop.time() + interval
+            else:
+                position %= len(devices)
+                await self._send(connection, build(devices[position]))
+                position += 1
+                next_at = max(next_at + interval / len(devices), loop.time())
+            await asyncio.sleep(next_at - loop.time())
+
+    async def _send(self, connection: ServerConnection, frame: dict) -> None:
+        await connection.send(self.codec.dumps(frame))
+        self.stats.frames_sent += 1
+        by_type = self.stats.frames_by_type
+        by_type[frame["type"]] = by_type.get(frame["type"], 0) + 1
+
+
+def _devices(ids: Iterable[int]) -> str:
+    ids = list(ids)
+    return f"{ids[0]}..{ids[-1]}" if len(ids) > 1 else str(ids[0])
+
+
+async def _main(args: argparse.Namespace) -> None:
+    simulator = WeatherFlowSimulator(
+        devices=args.devices,
+        host=args.host,
+        port=args.port,
+        obs_interval=args.obs_interval,
+        rapid_wind_interval=args.rapid_wind_interval,
+        strike_interval=args.strike_interval,
+        precip_interval=args.precip_interval,
+        stamp_frames=args.stamp,
+    )
+    await simulator.start()
+    print(f"Serving devices {_devices(simulator.device_ids)} on {simulator.uri}")
+    await simulator.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--obs-interval", type=float, default=60.0)
+    parser.add_argument("--rapid-wind-interval", type=float, default=3.0)
+    parser.add_argument("--strike-interval", type=float, default=None)
+    parser.add_argument("--precip-interval", type=float, default=None)
+    parser.add_argument("--stamp", action="store_true", help="add sent_at to frames")
+    try:
+        asyncio.run(_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
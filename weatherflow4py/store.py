@@ -0,0 +1,96 @@
+"""Latest message per device and message type.
+
+``LatestValueStore`` keeps the newest websocket message for every
+``(device_id, message type)`` pair with O(1) reads and writes. ``snapshot()`` returns an
+immutable view that stays consistent while new frames arrive; it is rebuilt lazily
+after writes, so frequent pollers share one copy between updates.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class StoreEntry:
+    """A stored message and the wall-clock time (epoch seconds) it was received."""
+
+    message: Any
+    received_at: float
+
+
+class LatestValueStore:
+    """Newest message per ``(device_id, type)`` plus per-device last-seen times."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Hashable, str], StoreEntry] = {}
+        self._last_seen: dict[Hashable, float] = {}
+        self._snapshot: MappingProxyType | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[tuple[Hashable, str]]:
+        return iter(self._entries)
+
+    def update(
+        self,
+        device_id: Hashable,
+        message_type: str,
+        message: Any,
+        received_at: float | None = None,
+    ) -> None:
+        received_at = time.time() if received_at is None else received_at
+        self._entries[device_id, message_type] = StoreEntry(message, received_at)
+        self._last_seen[device_id] = received_at
+        self._snapshot = None
+
+    def get(self, device_id: Hashable, message_type: str, default: Any = None) -> Any:
+        """The newest message of ``message_type`` from ``device_id``."""
+        entry = self._entries.get((device_id, message_type))
+        return default if entry is None else entry.message
+
+    def entry(self, device_id: Hashable, message_type: str) -> StoreEntry | None:
+        return self._entries.get((device_id, message_type))
+
+    def devices(self) -> list[Hashable]:
+        return list(self._last_seen)
+
+    def snapshot(self) -> MappingProxyType:
+        """Read-only ``{(device_id, type): StoreEntry}`` as of this call."""
+        if self._snapshot is None:
+            self._snapshot = MappingProxyType(dict(self._entries))
+        return self._snapshot
+
+    def age(
+        self,
+        device_id: Hashable,
+        message_type: str | None = None,
+        now: float | None = None,
+    ) -> float | None:
+        """Seconds since ``device_id`` last sent anything (or a ``message_type``)."""
+        if message_type is None:
+            received_at = self._last_seen.get(device_id)
+        else:
+            entry = self._entries.get((device_id, message_type))
+            received_at = None if entry is None else entry.received_at
+        if received_at is None:
+            return None
+        return (time.time() if now is None else now) - received_at
+
+    def stale(self, max_age: float, now: float | None = None) -> list[Hashable]:
+        """Devices that have not sent anything for more than ``max_age`` seconds."""
+        cutoff = (time.time() if now is None else now) - max_age
+        return [device for device, seen in self._last_seen.items() if seen < cutoff]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._last_seen.clear()
+        self._snapshot = None
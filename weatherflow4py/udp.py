@@ -0,0 +1,179 @@
+"""Receive Tempest hub broadcasts on the local network.
+
+Hubs broadcast every observation and event as a JSON datagram on UDP port 50222, in
+nearly the same shapes as the websocket frames. LAN packets lack the cloud-only parts:
+they have no ``device_id`` and no ``summary``, and observation rows stop before the
+fields the cloud derives. ``WeatherFlowUDPListener`` fills those in and then decodes,
+stores and dispatches packets through ``WeatherFlowReceiver``, the receive side it
+shares with ``WeatherFlowWebsocketAPI``, so the same ``register_*_callback`` methods,
+models, ``store``, ``history`` and ``wind_stats`` work without internet access and with
+millisecond latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import fields
+from ssl import SSLContext
+
+from weatherflow4py.models.ws.custom_types import PrecipitationAnalysisType
+from weatherflow4py.models.ws.obs import obs_air, obs_sky, obs_st
+from weatherflow4py.models.ws.types import ConnectionState
+from weatherflow4py.models.ws.websocket_response import WebsocketResponseBuilder
+from weatherflow4py.ws import WeatherFlowReceiver
+
+from .const import WS_LOGGER
+
+UDP_PORT = 50222
+
+
+def _padding(obs_class: type) -> list:
+    """A full websocket row of fill values: None, and "no analysis" for the enum."""
+    return [
+        PrecipitationAnalysisType.NONE.value
+        if field.name == "precipitation_analysis_type"
+        else None
+        for field in fields(obs_class)
+    ]
+
+
+# LAN observation rows end before the cloud-derived columns; these fill the rest.
+OBS_PADDING = {
+    "obs_st": _padding(obs_st),
+    "obs_sky": _padding(obs_sky),
+    "obs_air": _padding(obs_air),
+}
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, received: Callable[[bytes], None]):
+        self.received = received
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.received(data)
+
+    def error_received(self, exc: Exception) -> None:
+        WS_LOGGER.warning(f"UDP listener error: {exc!r}")
+
+
+class WeatherFlowUDPListener(WeatherFlowReceiver):
+    """Decode LAN broadcasts from Tempest hubs into the websocket models.
+
+    ``serial_numbers`` maps device serial numbers (``ST-00012345``) to the cloud
+    ``device_id``; unmapped devices get the number in their serial. Hubs broadcast
+    everything unasked, so there is nothing to send or subscribe to.
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = UDP_PORT,
+        serial_numbers: Mapping[str, int] | None = None,
+        reuse_port: bool = False,
+        max_queued_datagrams: int = 1000,
+        **api_kwargs,
+    ):
+        """
+        Args:
+            host (str): Address to bind; the default receives broadcasts on all
+                interfaces.
+            port (int): UDP port the hubs broadcast on.
+            serial_numbers (Mapping[str, int] | None): Serial number to ``device_id``.
+            reuse_port (bool): Set ``SO_REUSEPORT`` so other programs (such as a second
+                listener) can bind the same port.
+            max_queued_datagrams (int): Packets buffered while the listener is busy;
+                further packets are dropped and counted in ``dropped``.
+            **api_kwargs: ``WeatherFlowReceiver`` options such as
+                ``compiled_decoders``, ``dispatch_queue_size`` or ``history``.
+        """
+        super().__init__(**api_kwargs)
+        self.host = host
+        self.port = port
+        self.uri = f"udp://{host}:{port}"
+        self.serial_numbers = dict(serial_numbers or {})
+        self.reuse_port = reuse_port
+        self.transport: asyncio.DatagramTransport | None = None
+        self.datagrams: asyncio.Queue[bytes] = asyncio.Queue(max_queued_datagrams)
+        self.ignored = 0  # packets of types without a model, e.g. hub_status
+        self.dropped = 0  # packets that arrived while ``datagrams`` was full
+
+    def device_id_for(self, serial_number: str) -> int:
+        if (device_id := self.serial_numbers.get(serial_number)) is None:
+            digits = re.sub(r"\D", "", serial_number)
+            device_id = self.serial_numbers[serial_number] = int(digits or 0)
+        return device_id
+
+    def normalize(self, data: dict) -> dict:
+        """Reshape a LAN packet in place into the matching websocket frame."""
+        message_type = data.get("type")
+        if "device_id" not in data and "serial_number" in data:
+            data["device_id"] = self.device_id_for(data["serial_number"])
+        if (padding := OBS_PADDING.get(message_type)) is not None:
+            data["obs"] = [row + padding[len(row) :] for row in data.get("obs") or ()]
+            data.setdefault("summary", None)
+            data.setdefault("source", "udp")
+        if "firmware_revision" in data:
+            data["firmware_revision"] = str(data["firmware_revision"])
+        return data
+
+    async def connect(self, ssl_context: SSLContext | None = None):
+        """Bind the UDP port and start handling broadcasts (``ssl_context`` is unused)."""
+        if self.transport is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramProtocol(self._enqueue),
+            local_addr=(self.host, self.port),
+            reuse_port=self.reuse_port or None,
+            allow_broadcast=True,
+        )
+        if self.port == 0:
+            self.port = self.transport.get_extra_info("sockname")[1]
+            self.uri = f"udp://{self.host}:{self.port}"
+        self.listen_task = asyncio.create_task(self.listen(), name="UDPListenerTask")
+        await self._set_state(ConnectionState.CONNECTED)
+
+    def _enqueue(self, datagram: bytes) -> None:
+        try:
+            self.datagrams.put_nowait(datagram)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def listen(self):
+        self.is_listening = True
+        try:
+            while True:
+                datagram = await self.datagrams.get()
+                WS_LOGGER.debug("Received datagram: %s", datagram)
+                if self.recorder is not None:
+                    self.recorder.record(datagram)
+                try:
+                    data = self.codec.loads(datagram)
+                except ValueError:
+                    WS_LOGGER.warning(f"Malformed UDP packet: {datagram!r}")
+                    continue
+                await self.handle_frame(data)
+        finally:
+            self.is_listening = False
+
+    async def handle_frame(self, data: dict) -> None:
+        if data.get("type") not in WebsocketResponseBuilder.type_class_map:
+            self.ignored += 1
+            return
+        await super().handle_frame(self.normalize(data))
+
+    def is_connected(self):
+        return self.transport is not None and not self.transport.is_closing()
+
+    async def close(self, timeout: float = 5.0) -> None:
+        if self.transport is None:
+            return
+        self.transport.close()
+        self.transport = None
+        if self.listen_task is not None and not self.listen_task.done():
+            self.listen_task.cancel()
+            await asyncio.gather(self.listen_task, return_exceptions=True)
+        await self._close_dispatch()
+        await self._set_state(ConnectionState.CLOSED)
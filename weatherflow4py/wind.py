@@ -0,0 +1,162 @@
+"""Streaming rolling-window wind statistics from ``rapid_wind`` samples.
+
+Each ``RollingWindow`` updates in amortised O(1) per sample: running sums give the mean
+speed and the vector components, and two monotonic deques give the gust (maximum) and
+lull (minimum) without rescanning the window. Direction is the speed-weighted vector
+mean, so 350° and 10° average to 0° rather than 180°.
+
+``WindEngine`` keeps a set of windows (2 and 10 minutes by default) per device and calls
+registered callbacks with the updated ``WindStats`` after every sample.
+"""
+
+from __future__ import annotations
+
+import inspect
+import math
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from weatherflow4py.models.ws.types import EventType
+
+from .const import WS_LOGGER
+
+
+@dataclass(frozen=True, slots=True)
+class WindStats:
+    """Statistics over the last ``window`` seconds ending at ``epoch``."""
+
+    window: float
+    epoch: float
+    samples: int
+    average: float
+    gust: float
+    lull: float
+    direction: float | None  # degrees, None when the winds cancel out or are calm
+
+
+class RollingWindow:
+    """Mean, gust, lull and vector-mean direction over a sliding time window."""
+
+    def __init__(self, window: float):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._samples: deque[tuple[float, float, float, float]] = deque()
+        self._max: deque[tuple[float, float]] = deque()  # (epoch, speed), decreasing
+        self._min: deque[tuple[float, float]] = deque()  # (epoch, speed), increasing
+        self._speed_sum = 0.0
+        self._u_sum = 0.0
+        self._v_sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, epoch: float, speed: float, direction: float) -> WindStats:
+        radians = math.radians(direction)
+        u, v = speed * math.sin(radians), speed * math.cos(radians)
+        self._samples.append((epoch, speed, u, v))
+        self._speed_sum += speed
+        self._u_sum += u
+        self._v_sum += v
+
+        while self._max and self._max[-1][1] <= speed:
+            self._max.pop()
+        self._max.append((epoch, speed))
+        while self._min and self._min[-1][1] >= speed:
+            self._min.pop()
+        self._min.append((epoch, speed))
+
+        self._expire(epoch - self.window)
+        return self.stats()
+
+    def _expire(self, cutoff: float) -> None:
+        samples = self._samples
+        while samples and samples[0][0] <= cutoff:
+            _, speed, u, v = samples.popleft()
+            self._speed_sum -= speed
+            self._u_sum -= u
+            self._v_sum -= v
+        while self._max[0][0] <= cutoff:
+            self._max.popleft()
+        while self._min[0][0] <= cutoff:
+            self._min.popleft()
+        if len(samples) == 1:
+            # Re-anchor the running sums so floating-point drift cannot accumulate.
+            _, self._speed_sum, self._u_sum, self._v_sum = samples[0]
+
+    def stats(self) -> WindStats:
+        count = len(self._samples)
+        if not count:
+            raise ValueError("The window is empty")
+        u, v = self._u_sum / count, self._v_sum / count
+        direction = None
+        if math.hypot(u, v) > 1e-9:
+            direction = math.degrees(math.atan2(u, v)) % 360.0
+        return WindStats(
+            window=self.window,
+            epoch=self._samples[-1][0],
+            samples=count,
+            average=self._speed_sum / count,
+            gust=self._max[0][1],
+            lull=self._min[0][1],
+            direction=direction,
+        )
+
+
+class WindEngine:
+    """Rolling wind statistics per device with per-device or fleet-wide callbacks."""
+
+    def __init__(self, windows: Iterable[float] = (120, 600)):
+        self.windows = tuple(windows)
+        if not self.windows:
+            raise ValueError("At least one window is required")
+        self.devices: dict[Hashable, tuple[RollingWindow, ...]] = {}
+        self.callbacks: list[tuple[Hashable | None, Callable[..., Any]]] = []
+
+    def register_callback(
+        self,
+        callback: Callable[[Hashable, dict[float, WindStats]], Any],
+        device_id: Hashable | None = None,
+    ) -> None:
+        """Call ``callback(device_id, {window: WindStats})`` after each sample.
+
+        With ``device_id`` only that device's updates are delivered. Async callbacks
+        are awaited.
+        """
+        self.callbacks.append((device_id, callback))
+
+    def add(
+        self, device_id: Hashable, epoch: float, speed: float, direction: float
+    ) -> dict[float, WindStats]:
+        if (windows := self.devices.get(device_id)) is None:
+            windows = self.devices[device_id] = tuple(
+                RollingWindow(window) for window in self.windows
+            )
+        return {
+            window.window: window.add(epoch, speed, direction) for window in windows
+        }
+
+    def stats(self, device_id: Hashable) -> dict[float, WindStats] | None:
+        if (windows := self.devices.get(device_id)) is None:
+            return None
+        return {window.window: window.stats() for window in windows}
+
+    async def feed(self, data: dict[str, Any]) -> dict[float, WindStats] | None:
+        """Update from a parsed ``rapid_wind`` frame and notify callbacks."""
+        if data.get("type") != EventType.RAPID_WIND.value:
+            return None
+        device_id = data.get("device_id")
+        epoch, speed, direction = data["ob"][:3]
+        if speed is None or direction is None:
+            return None
+        stats = self.add(device_id, epoch, speed, direction)
+        for wanted, callback in self.callbacks:
+            if wanted is None or wanted == device_id:
+                try:
+                    if inspect.isawaitable(result := callback(device_id, stats)):
+                        await result
+                except Exception:
+                    WS_LOGGER.exception("Wind statistics callback raised")
+        return stats
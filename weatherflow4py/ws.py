@@ -1,56 +1,175 @@
-import time
-from collections.abc import Callable
-
 import asyncio
+import random
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
 from ssl import SSLContext
 
 import websockets
 import websockets.asyncio.client
 from websockets.connection import State as WebSocketState
-import json
+from websockets.exceptions import (
+    ConnectionClosed,
+    ConnectionClosedOK,
+    WebSocketException,
+)
 
-from weatherflow4py.models.ws.types import EventType
+from weatherflow4py.codec import JsonCodec, get_codec
+from weatherflow4py.dispatch import (
+    BackpressurePolicy,
+    CallbackDispatcher,
+    DispatchStats,
+    ExecutorCallback,
+    ThrottledCallback,
+    invoke_callback,
+)
+from weatherflow4py.history import DeviceHistory
+from weatherflow4py.hub import WebsocketHub
+from weatherflow4py.models.ws.types import ConnectionState, EventType
 from weatherflow4py.models.ws.websocket_request import (
-    WebsocketRequest,
+    ListenStartMessage,
     ListenStopMessage,
+    RapidWindListenStartMessage,
     RapidWindListenStopMessage,
+    WebsocketRequest,
 )
 from weatherflow4py.models.ws.websocket_response import (
-    WebsocketResponseBuilder,
+    AcknowledgementWS,
     ObservationTempestWS,
     RapidWindWS,
-    AcknowledgementWS,
+    WebsocketResponseBuilder,
 )
+from weatherflow4py.recording import FrameRecorder
+from weatherflow4py.store import LatestValueStore
+from weatherflow4py.wind import WindEngine
 
 from .const import WS_LOGGER
 
 
-class WeatherFlowWebsocketAPI:
-    """Websocket API For Weatherflow Devices."""
+@dataclass
+class SubscriptionResult:
+    """Outcome of ``subscribe_many`` / ``unsubscribe_many``.
 
-    _shared_websocket = None  # Class variable for the WebSocket connection
-    _lock = asyncio.Lock()  # Async lock for websocket initialization
+    A device is acknowledged only when every request sent for it was acknowledged;
+    otherwise ``failed`` maps it to the reason (timeout or send error).
+    """
 
-    def __init__(self, access_token: str, device_ids=None):
-        if device_ids is None:
-            device_ids = []
-        self.device_ids = device_ids
-        self.uri = f"wss://ws.weatherflow.com/swd/data?token={access_token}"
-        self.websocket: websockets.asyncio.client.ClientConnection | None = None
+    acknowledged: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+@dataclass
+class ReconnectPolicy:
+    """Jittered exponential backoff for ``run_supervised``.
+
+    The n-th retry waits ``min(max_delay, initial_delay * factor**n)`` reduced by a
+    random fraction of up to ``jitter``, so a fleet of clients does not reconnect in
+    lockstep. ``max_attempts`` of None retries forever.
+    """
+
+    initial_delay: float = 1.0
+    max_delay: float = 60.0
+    factor: float = 2.0
+    jitter: float = 0.5
+    max_attempts: int | None = None
+
+    def delay(self, attempt: int) -> float:
+        base = min(self.max_delay, self.initial_delay * self.factor**attempt)
+        return base * (1 - self.jitter * random.random())
+
+
+@dataclass
+class ConnectionStats:
+    """Counters maintained by ``run_supervised``.
+
+    ``last_recovery_time`` is the time from noticing a dropped connection to the first
+    data frame received after reconnecting (for the first connection: from start-up).
+    """
+
+    connects: int = 0
+    disconnects: int = 0
+    failed_attempts: int = 0
+    last_recovery_time: float | None = None
+
+
+class WeatherFlowReceiver:
+    """Decode, store and dispatch WeatherFlow frames, however they arrive.
+
+    Subclasses supply the transport and feed each parsed frame to ``handle_frame``;
+    the callbacks, ``store``, ``history``, ``wind_stats`` and dispatch queue live here.
+    """
+
+    def __init__(
+        self,
+        compiled_decoders: bool = False,
+        lazy_observations: bool = False,
+        codec: JsonCodec | None = None,
+        dispatch_queue_size: int | None = None,
+        backpressure: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        history: DeviceHistory | None = None,
+        wind_stats: WindEngine | None = None,
+        recorder: FrameRecorder | None = None,
+    ):
+        self.compiled_decoders = compiled_decoders
+        self.lazy_observations = lazy_observations
+        self.codec = codec or get_codec()
         self.messages = {}
+        self.store = LatestValueStore()
+        self.history = history
+        self.wind_stats = wind_stats
+        self.recorder = recorder
         self.is_listening = False
         self.listen_task = None  # To keep track of the listening task
         self.callbacks = {}
-
-        WS_LOGGER.debug("WebsocketAPI initialized with URI: " + self.uri)
+        self.state = ConnectionState.CLOSED
+        self.state_callbacks: list[Callable[[ConnectionState], None]] = []
+        self.dispatcher: CallbackDispatcher | None = None
+        if dispatch_queue_size is not None:
+            self.dispatcher = CallbackDispatcher(
+                self.callbacks.get, dispatch_queue_size, backpressure
+            )
 
     def register_callback(
-        self, message_type: EventType, callback: Callable[[str], None]
+        self,
+        message_type: EventType,
+        callback: Callable[[str], None],
+        executor: Executor | None = None,
+        min_interval: float | None = None,
     ):
-        """Register a callback for a specific message type"""
-        self.callbacks[message_type.value] = callback
+        """Register a callback for a specific message type
 
-    def register_invalid_data_callback(self, callback: Callable[[str], None]):
+        With ``executor`` a sync callback runs there instead of on the event loop
+        (see ``ExecutorCallback``); messages of one device keep their order.
+        With ``min_interval`` each device's messages are coalesced and the newest is
+        delivered at most once per interval (see ``ThrottledCallback``).
+        """
+        self.callbacks[message_type.value] = self._offload(
+            callback, executor, min_interval
+        )
+
+    @staticmethod
+    def _offload(
+        callback: Callable,
+        executor: Executor | None,
+        min_interval: float | None = None,
+    ) -> Callable:
+        if executor is not None:
+            callback = ExecutorCallback(callback, executor)
+        if min_interval is not None:
+            callback = ThrottledCallback(callback, min_interval)
+        return callback
+
+    def register_invalid_data_callback(
+        self,
+        callback: Callable[[str], None],
+        executor: Executor | None = None,
+        min_interval: float | None = None,
+    ):
         """
         Register a callback for the 'invalid' event.
 
@@ -65,10 +184,21 @@ class WeatherFlowWebsocketAPI:
 
         Args:
             callback (Callable[[str], None]): The callback function to register.
+            executor (Executor | None): Run a sync callback on this executor instead of
+                the event loop.
+            min_interval (float | None): Deliver each device's newest message at most
+                once per this many seconds.
         """
-        self.callbacks[EventType.INVALID.value] = callback
+        self.callbacks[EventType.INVALID.value] = self._offload(
+            callback, executor, min_interval
+        )
 
-    def register_wind_callback(self, callback: Callable[[RapidWindWS], None]):
+    def register_wind_callback(
+        self,
+        callback: Callable[[RapidWindWS], None],
+        executor: Executor | None = None,
+        min_interval: float | None = None,
+    ):
         """
         Register a callback for the 'rapid_wind' event.
 
@@ -83,10 +213,21 @@ class WeatherFlowWebsocketAPI:
 
         Args:
             callback (Callable[[RapidWindWS], None]): The callback function to register.
+            executor (Executor | None): Run a sync callback on this executor instead of
+                the event loop.
+            min_interval (float | None): Deliver each device's newest message at most
+                once per this many seconds.
         """
-        self.callbacks[EventType.RAPID_WIND.value] = callback
+        self.callbacks[EventType.RAPID_WIND.value] = self._offload(
+            callback, executor, min_interval
+        )
 
-    def register_precipitation_callback(self, callback: Callable[[str], None]):
+    def register_precipitation_callback(
+        self,
+        callback: Callable[[str], None],
+        executor: Executor | None = None,
+        min_interval: float | None = None,
+    ):
         """
         Register a callback for the 'rain' event.
 
@@ -101,10 +242,21 @@ class WeatherFlowWebsocketAPI:
 
         Args:
             callback (Callable[[str], None]): The callback function to register.
+            executor (Executor | None): Run a sync callback on this executor instead of
+                the event loop.
+            min_interval (float | None): Deliver each device's newest message at most
+                once per this many seconds.
         """
-        self.callbacks[EventType.RAIN.value] = callback
+        self.callbacks[EventType.RAIN.value] = self._offload(
+            callback, executor, min_interval
+        )
 
-    def register_lightning_callback(self, callback: Callable[[str], None]):
+    def register_lightning_callback(
+        self,
+        callback: Callable[[str], None],
+        executor: Executor | None = None,
+        min_interval: float | None = None,
+    ):
         """
         Register a callback for the 'lightning_strike' event.
 
@@ -119,11 +271,20 @@ class WeatherFlowWebsocketAPI:
 
         Args:
             callback (Callable[[str], None]): The callback function to register.
+            executor (Executor | None): Run a sync callback on this executor instead of
+                the event loop.
+            min_interval (float | None): Deliver each device's newest message at most
+                once per this many seconds.
         """
-        self.callbacks[EventType.LIGHTNING_STRIKE.value] = callback
+        self.callbacks[EventType.LIGHTNING_STRIKE.value] = self._offload(
+            callback, executor, min_interval
+        )
 
     def register_observation_callback(
-        self, callback: Callable[[ObservationTempestWS], None]
+        self,
+        callback: Callable[[ObservationTempestWS], None],
+        executor: Executor | None = None,
+        min_interval: float | None = None,
     ):
         """
         Register a callback for the 'obs_st' event.
@@ -139,56 +300,204 @@ class WeatherFlowWebsocketAPI:
 
         Args:
             callback (Callable[[ObservationTempestWS], None]): The callback function to register.
+            executor (Executor | None): Run a sync callback on this executor instead of
+                the event loop.
+            min_interval (float | None): Deliver each device's newest message at most
+                once per this many seconds.
         """
-        self.callbacks[EventType.OBSERVATION.value] = callback
+        self.callbacks[EventType.OBSERVATION.value] = self._offload(
+            callback, executor, min_interval
+        )
 
     @property
     def last_observation(self) -> ObservationTempestWS | None:
         """Last observation"""
         return self.messages.get("obs_st")
 
-    def last_wind(self) -> RapidWindWS | None:
+    def last_wind(self, device_id=None) -> RapidWindWS | None:
+        """Last rapid wind message, from ``device_id`` when given."""
+        if device_id is not None:
+            return self.store.get(device_id, EventType.RAPID_WIND.value)
         return self.messages.get("rapid_wind")
 
-    def last_observation_time(self) -> float | None:
-        """Seconds since last observation"""
+    def last_observation_for(self, device_id) -> ObservationTempestWS | None:
+        """Last ``obs_st`` observation from ``device_id``."""
+        return self.store.get(device_id, EventType.OBSERVATION.value)
+
+    def last_observation_time(self, device_id=None) -> float | None:
+        """Seconds since last observation (from ``device_id`` when given)"""
         current_epoch = time.time()
-        if obs := self.last_observation:
+        obs = (
+            self.last_observation
+            if device_id is None
+            else self.last_observation_for(device_id)
+        )
+        if obs:
             last_observation_epoch = obs.epoch
             time_difference = current_epoch - last_observation_epoch
             return time_difference
         return None
 
+    def register_connection_state_callback(
+        self, callback: Callable[[ConnectionState], None]
+    ):
+        """Call ``callback`` (sync or async) with the new state on every transition."""
+        self.state_callbacks.append(callback)
+
+    async def _set_state(self, state: ConnectionState) -> None:
+        if state is self.state:
+            return
+        WS_LOGGER.debug(f"WebSocket connection state: {self.state} -> {state}")
+        self.state = state
+        for callback in list(self.state_callbacks):
+            try:
+                await invoke_callback(callback, state)
+            except Exception:
+                WS_LOGGER.exception("Connection state callback raised")
+
+    async def handle_frame(self, data: dict) -> None:
+        """Decode, record and dispatch one parsed frame (called by ``listen`` or a hub)."""
+        try:
+            response = WebsocketResponseBuilder.build_response(
+                data,
+                compiled=self.compiled_decoders,
+                lazy=self.lazy_observations,
+            )
+            if response is None:
+                WS_LOGGER.info(f"Received invalid WS Status Message {data}")
+            self.messages[data["type"]] = response
+            if (device_id := data.get("device_id")) is not None:
+                self.store.update(device_id, data["type"], response)
+                if self.history is not None:
+                    self.history.record(data)
+                if self.wind_stats is not None:
+                    await self.wind_stats.feed(data)
+            self._received(response)
+            await self._dispatch(data["type"], response, device_id)
+        except ValueError:
+            if EventType.INVALID.value in self.callbacks:
+                await self._dispatch(EventType.INVALID.value, data)
+            else:
+                WS_LOGGER.warning(f"Unrecognized WS Message: {data}")
+
+    def _received(self, response) -> None:
+        """Hook called with each decoded frame before it is dispatched."""
+
+    async def _dispatch(self, event_type: str, payload, device_id=None) -> None:
+        """Hand ``payload`` to the callback for ``event_type``, directly or via the queue."""
+        if self.dispatcher is not None:
+            await self.dispatcher.submit(event_type, payload, device_id)
+            return
+        if (callback := self.callbacks.get(event_type)) is None:
+            WS_LOGGER.debug(f"NO CALLBACK for message type: {event_type}")
+            return
+        WS_LOGGER.debug(f"Calling callback for message type: {event_type}")
+        try:
+            await invoke_callback(callback, payload)
+        except Exception:
+            WS_LOGGER.exception(f"Callback for {event_type} raised")
+
+    def dispatch_stats(self) -> dict[str, DispatchStats]:
+        """Queue depth and drop counters per event type (empty without a dispatch queue)."""
+        return self.dispatcher.stats() if self.dispatcher is not None else {}
+
+    async def _close_dispatch(self) -> None:
+        """Drain the dispatch queue and cancel throttled deliveries still pending."""
+        if self.dispatcher is not None:
+            await self.dispatcher.close()
+        for callback in self.callbacks.values():
+            if isinstance(callback, ThrottledCallback):
+                callback.cancel()
+
+
+class WeatherFlowWebsocketAPI(WeatherFlowReceiver):
+    """Websocket API For Weatherflow Devices."""
+
+    def __init__(
+        self,
+        access_token: str,
+        device_ids=None,
+        compiled_decoders: bool = False,
+        lazy_observations: bool = False,
+        codec: JsonCodec | None = None,
+        dispatch_queue_size: int | None = None,
+        backpressure: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        history: DeviceHistory | None = None,
+        wind_stats: WindEngine | None = None,
+        recorder: FrameRecorder | None = None,
+        uri: str | None = None,
+    ):
+        """
+        Args:
+            access_token (str): The WeatherFlow API token.
+            device_ids (list | None): Devices this instance listens to.
+            compiled_decoders (bool): Decode frames with generated per-class decoders
+                instead of dataclasses_json ``from_dict`` (same models, much faster).
+            lazy_observations (bool): Deliver ``obs_*`` frames as ``LazyObservation*WS``
+                objects that only decode the fields a callback actually reads.
+            codec (JsonCodec | None): JSON backend for frames; defaults to ``get_codec()``.
+            dispatch_queue_size (int | None): Deliver callbacks from a bounded queue per
+                event type, so a slow callback no longer stalls socket reads. None
+                (the default) calls callbacks inline from the reader.
+            backpressure (BackpressurePolicy): What a full dispatch queue does with
+                new messages; see ``dispatch_stats()`` for depth and drop counts.
+            history (DeviceHistory | None): Record ``rapid_wind`` and ``obs_st`` samples
+                per device in fixed-size ring buffers.
+            wind_stats (WindEngine | None): Update rolling wind statistics from every
+                ``rapid_wind`` frame.
+            recorder (FrameRecorder | None): Append every raw frame ``listen()``
+                receives to a recording that ``FrameReplayer`` can play back.
+            uri (str | None): Connect to this endpoint instead of ws.weatherflow.com,
+                e.g. a local ``WeatherFlowSimulator``; the token is added as a query
+                parameter.
+        """
+        super().__init__(
+            compiled_decoders=compiled_decoders,
+            lazy_observations=lazy_observations,
+            codec=codec,
+            dispatch_queue_size=dispatch_queue_size,
+            backpressure=backpressure,
+            history=history,
+            wind_stats=wind_stats,
+            recorder=recorder,
+        )
+        if device_ids is None:
+            device_ids = []
+        self.device_ids = device_ids
+        if uri is None:
+            uri = "wss://ws.weatherflow.com/swd/data"
+        self.uri = f"{uri}{'&' if '?' in uri else '?'}token={access_token}"
+        self.websocket: websockets.asyncio.client.ClientConnection | None = None
+        self.pending_acks: dict[str, asyncio.Future[AcknowledgementWS]] = {}
+        self.subscriptions: dict = {}  # device_id -> rapid_wind, replayed on reconnect
+        self.connection_stats = ConnectionStats()
+        self.supervisor_task: asyncio.Task | None = None
+        self.hub: WebsocketHub | None = None
+        self._closing = False
+        self._close_requested = asyncio.Event()
+        self._recovering_since: float | None = None
+
+        WS_LOGGER.debug("WebsocketAPI initialized with URI: " + self.uri)
+
     async def send_message(self, message_type: WebsocketRequest):
-        message = message_type.json
+        message = self.codec.dumps(message_type.to_dict())
         WS_LOGGER.debug(f"Sending message: {message}")
         await self._send(message)
 
     async def send_message_and_wait(
         self, message_type: WebsocketRequest, timeout: float = 5.0
     ) -> AcknowledgementWS | None:
-        message = message_type.json
-        WS_LOGGER.debug(f"Sending message and waiting for ACK: {message}")
-
-        # Create a future to store the ACK response
-        ack_future = asyncio.Future()
-
-        # Register a temporary callback for ACK messages
-        def ack_callback(ack: AcknowledgementWS):
-            if not ack_future.done():
-                ack_future.set_result(ack)
+        """Send a request and wait for the ``ack`` carrying its id.
 
-        # Store the original ACK callback if it exists
-        original_ack_callback = self.callbacks.get(EventType.ACKNOWLEDGEMENT.value)
-
-        # Set our temporary callback
-        self.callbacks[EventType.ACKNOWLEDGEMENT.value] = ack_callback
+        Each request has its own pending future keyed by ``message_type.id``, so any
+        number of calls can be in flight at once (e.g. with ``asyncio.gather``).
+        """
+        message = self.codec.dumps(message_type.to_dict())
+        WS_LOGGER.debug(f"Sending message and waiting for ACK: {message}")
 
+        request_id, ack_future = self._expect_ack(message_type)
         try:
-            # Send the message
             await self._send(message)
-
-            # Wait for the ACK with a timeout
             return await asyncio.wait_for(ack_future, timeout=timeout)
 
         except TimeoutError:
@@ -196,85 +505,218 @@ class WeatherFlowWebsocketAPI:
             return None
 
         finally:
-            # Restore the original callback or remove our temporary one
-            if original_ack_callback:
-                self.callbacks[EventType.ACKNOWLEDGEMENT.value] = original_ack_callback
-            else:
-                self.callbacks.pop(EventType.ACKNOWLEDGEMENT.value, None)
+            self.pending_acks.pop(request_id, None)
+
+    async def send_many_and_wait(
+        self, requests: Iterable[WebsocketRequest], timeout: float = 5.0
+    ) -> list[AcknowledgementWS | BaseException | None]:
+        """Pipeline ``requests`` and wait for their ACKs under one overall timeout.
+
+        All requests are written before any ACK is awaited. Each result is the ACK,
+        None when it did not arrive within ``timeout``, or the exception raised while
+        sending that request.
+        """
+        requests = list(requests)
+        pending: list[tuple[str, asyncio.Future[AcknowledgementWS]]] = []
+        results: list[AcknowledgementWS | BaseException | None] = [None] * len(requests)
+        try:
+            for request in requests:
+                pending.append(self._expect_ack(request))
+            for index, request in enumerate(requests):
+                try:
+                    await self._send(self.codec.dumps(request.to_dict()))
+                except Exception as err:
+                    results[index] = err
+                    pending[index][1].cancel()
+
+            futures = [future for _, future in pending if not future.done()]
+            if futures:
+                await asyncio.wait(futures, timeout=timeout)
+
+            for index, (_, future) in enumerate(pending):
+                if future.done() and not future.cancelled():
+                    results[index] = future.result()
+            return results
+
+        finally:
+            for request_id, _ in pending:
+                self.pending_acks.pop(request_id, None)
+
+    def _expect_ack(
+        self, request: WebsocketRequest
+    ) -> tuple[str, asyncio.Future[AcknowledgementWS]]:
+        request_id = str(request.id)
+        if request_id in self.pending_acks:
+            raise ValueError(f"A request with id {request_id} is already in flight")
+        future = self.pending_acks[request_id] = (
+            asyncio.get_running_loop().create_future()
+        )
+        return request_id, future
+
+    def _resolve_ack(self, ack: AcknowledgementWS) -> None:
+        if (future := self.pending_acks.get(str(ack.id))) is not None:
+            if not future.done():
+                future.set_result(ack)
+        else:
+            WS_LOGGER.debug(f"ACK for unknown request id: {ack.id}")
 
     async def connect(self, ssl_context: SSLContext | None = None):
-        """Establishes a WebSocket connection and starts a background listening task.
+        """Attach to the shared connection for this token, opening it if needed.
+
+        All instances using the same token share one socket and one reader task owned
+        by a ``WebsocketHub``; the hub routes each frame to the instances interested in
+        its ``device_id`` and closes the socket when the last instance closes.
 
         :param ssl_context: Optional SSL context for secure connections
         """
-        async with WeatherFlowWebsocketAPI._lock:
-            if WeatherFlowWebsocketAPI._shared_websocket is None:
+        self.hub = await WebsocketHub.acquire(self.uri, ssl_context)
+        self.hub.attach(self)
+        self.websocket = self.hub.websocket
+        self.listen_task = self.hub.reader_task
+        self.is_listening = True
+
+    async def run_supervised(
+        self,
+        ssl_context: SSLContext | None = None,
+        reconnect: ReconnectPolicy | None = None,
+    ) -> asyncio.Task:
+        """Connect on a dedicated socket and keep it connected until ``close()``.
+
+        Whenever the connection drops it is re-established with ``reconnect`` backoff
+        and every subscription (``subscriptions`` plus ``device_ids``) is replayed in
+        one pipelined batch. Returns the supervisor task.
+        """
+        if self.supervisor_task is None or self.supervisor_task.done():
+            self._closing = False
+            self._close_requested = asyncio.Event()
+            self.supervisor_task = asyncio.create_task(
+                self._supervise(ssl_context, reconnect or ReconnectPolicy()),
+                name="WebSocketSupervisorTask",
+            )
+        return self.supervisor_task
+
+    async def _supervise(
+        self, ssl_context: SSLContext | None, reconnect: ReconnectPolicy
+    ) -> None:
+        attempt = 0
+        self._recovering_since = time.monotonic()
+        await self._set_state(ConnectionState.CONNECTING)
+        while not self._closing:
+            try:
                 if ssl_context is None:
-                    WeatherFlowWebsocketAPI._shared_websocket = (
-                        await websockets.connect(self.uri)
-                    )
+                    self.websocket = await websockets.connect(self.uri)
                 else:
-                    WeatherFlowWebsocketAPI._shared_websocket = (
-                        await websockets.connect(self.uri, ssl=ssl_context)
-                    )
-
-                WS_LOGGER.debug(
-                    f"WebSocket connected at memory address: {id(WeatherFlowWebsocketAPI._shared_websocket)}"
+                    self.websocket = await websockets.connect(self.uri, ssl=ssl_context)
+            except (OSError, TimeoutError, WebSocketException) as err:
+                attempt += 1
+                self.connection_stats.failed_attempts += 1
+                if (
+                    reconnect.max_attempts is not None
+                    and attempt >= reconnect.max_attempts
+                ):
+                    WS_LOGGER.error(f"Giving up connecting after {attempt} attempts")
+                    await self._set_state(ConnectionState.CLOSED)
+                    raise
+                delay = reconnect.delay(attempt - 1)
+                WS_LOGGER.warning(
+                    f"WebSocket connect failed ({err!r}); retry in {delay:.1f}s"
                 )
-
-            self.websocket = WeatherFlowWebsocketAPI._shared_websocket
-
-            # Run the listen method in the background and name the task for easier debugging
+                await self._set_state(ConnectionState.RECONNECTING)
+                # Back off, but wake up at once when close() is called.
+                try:
+                    await asyncio.wait_for(self._close_requested.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            if self._closing:  # close() was called while connecting
+                await self._close_socket()
+                break
+            attempt = 0
+            self.connection_stats.connects += 1
             self.listen_task = asyncio.create_task(
                 self.listen(), name="WebSocketListenTask"
             )
+            await self._set_state(ConnectionState.CONNECTED)
+            await self._replay_subscriptions()
+
+            try:
+                await self.listen_task
+            except ConnectionClosed as err:
+                WS_LOGGER.warning(f"WebSocket connection lost: {err!r}")
+            except asyncio.CancelledError:
+                if not self._closing:
+                    raise
+            except Exception:
+                # Anything else ends this connection only; reconnect as after a drop.
+                WS_LOGGER.exception("WebSocket listener failed; reconnecting")
+                await self._close_socket()
+            if self._closing:
+                break
+            self.connection_stats.disconnects += 1
+            self._recovering_since = time.monotonic()
+            await self._set_state(ConnectionState.DISCONNECTED)
+            await self._set_state(ConnectionState.RECONNECTING)
+
+        await self._set_state(ConnectionState.CLOSED)
+
+    async def _close_socket(self) -> None:
+        """Close the supervised socket after a failure, ignoring errors."""
+        if self.websocket is None:
+            return
+        try:
+            await self.websocket.close()
+        except Exception as e:
+            WS_LOGGER.debug(f"Exception closing failed WebSocket: {e!r}")
+
+    async def _replay_subscriptions(self) -> None:
+        wanted = dict.fromkeys(self.device_ids, False) | self.subscriptions
+        for rapid_wind in (True, False):
+            devices = [
+                device for device, rapid in wanted.items() if rapid is rapid_wind
+            ]
+            if not devices:
+                continue
+            result = await self.subscribe_many(devices, rapid_wind=rapid_wind)
+            for device_id, reason in result.failed.items():
+                WS_LOGGER.warning(f"Failed to resubscribe {device_id}: {reason}")
 
     async def listen(self):
         self.is_listening = True
         assert self.websocket is not None
         try:
-            async for message in self.websocket:
-                WS_LOGGER.debug(f"Received message: {message}")
-                data = json.loads(message)
+            async for message in self._frames():
+                WS_LOGGER.debug("Received message: %s", message)
+                if self.recorder is not None:
+                    self.recorder.record(message)
                 try:
-                    response = WebsocketResponseBuilder.build_response(data)
-                    if response is None:
-                        WS_LOGGER.info(f"Received invalid WS Status Message {data}")
-                    self.messages[data["type"]] = response
-
-                    if data["type"] in self.callbacks:
-                        if asyncio.iscoroutinefunction(self.callbacks[data["type"]]):
-                            WS_LOGGER.debug(
-                                f"Calling ASYNC callback for message type: {data['type']}"
-                            )
-                            # If it is, use 'await' to call it
-                            await self.callbacks[data["type"]](response)
-                        else:
-                            WS_LOGGER.debug(
-                                f"Calling SYNC callback for message type: {data['type']}"
-                            )
-                            # If it's not, call it normally
-                            self.callbacks[data["type"]](response)
-                    else:
-                        WS_LOGGER.debug(f"NO CALLBACK for message type: {data['type']}")
+                    data = self.codec.loads(message)
                 except ValueError:
-                    if EventType.INVALID.value in self.callbacks:
-                        if asyncio.iscoroutinefunction(
-                            self.callbacks[EventType.INVALID.value]
-                        ):
-                            # If it is, use 'await' to call it
-                            await self.callbacks[EventType.INVALID.value](data)
-                        else:
-                            # If it's not, call it normally
-                            self.callbacks[EventType.INVALID.value](data)
-                    else:
-                        WS_LOGGER.warning(f"Unrecognized WS Message: {message}")
-
+                    WS_LOGGER.warning(f"Malformed WebSocket frame: {message!r}")
                     continue
+                await self.handle_frame(data)
 
         finally:
             self.is_listening = False
 
+    def _received(self, response) -> None:
+        if isinstance(response, AcknowledgementWS):
+            self._resolve_ack(response)
+        elif self._recovering_since is not None:
+            self.connection_stats.last_recovery_time = (
+                time.monotonic() - self._recovering_since
+            )
+            self._recovering_since = None
+
+    async def _frames(self):
+        """Yield incoming frames undecoded so the codec parses the raw UTF-8 bytes."""
+        assert self.websocket is not None
+        try:
+            while True:
+                yield await self.websocket.recv(decode=False)
+        except ConnectionClosedOK:
+            return
+
     async def _send(self, message):
         if self.websocket:
             await self.websocket.send(message)
@@ -285,24 +727,101 @@ class WeatherFlowWebsocketAPI:
             self.websocket is not None and self.websocket.state is WebSocketState.OPEN
         )
 
+    async def subscribe_many(
+        self, device_ids: Iterable, rapid_wind: bool = True, timeout: float = 5.0
+    ) -> SubscriptionResult:
+        """Send ``listen_start`` (and ``listen_rapid_start``) for every device at once.
+
+        Acknowledged devices are added to ``device_ids`` so ``close()`` stops them.
+        """
+        result = await self._send_bulk(device_ids, True, rapid_wind, timeout)
+        self.device_ids.extend(
+            device_id
+            for device_id in result.acknowledged
+            if device_id not in self.device_ids
+        )
+        self.subscriptions.update(dict.fromkeys(result.acknowledged, rapid_wind))
+        if self.hub is not None:
+            self.hub.update_routes(self)
+        return result
+
+    async def unsubscribe_many(
+        self,
+        device_ids: Iterable | None = None,
+        rapid_wind: bool = True,
+        timeout: float = 5.0,
+    ) -> SubscriptionResult:
+        """Send ``listen_stop`` (and ``listen_rapid_stop``) for every device at once.
+
+        Defaults to all of ``device_ids``; acknowledged devices are removed from it.
+        """
+        result = await self._send_bulk(
+            list(self.device_ids) if device_ids is None else device_ids,
+            False,
+            rapid_wind,
+            timeout,
+        )
+        self.device_ids[:] = [
+            device_id
+            for device_id in self.device_ids
+            if device_id not in result.acknowledged
+        ]
+        for device_id in result.acknowledged:
+            self.subscriptions.pop(device_id, None)
+        if self.hub is not None:
+            self.hub.update_routes(self)
+        return result
+
+    async def _send_bulk(
+        self, device_ids: Iterable, start: bool, rapid_wind: bool, timeout: float
+    ) -> SubscriptionResult:
+        requests = self._subscription_requests(device_ids, start, rapid_wind)
+        if self.hub is not None:
+            return await self.hub.send_subscriptions(self, requests, start, timeout)
+        return await self._send_requests(requests, timeout)
+
+    @staticmethod
+    def _subscription_requests(
+        device_ids: Iterable, start: bool, rapid_wind: bool
+    ) -> list[tuple[object, WebsocketRequest]]:
+        listen, rapid = (
+            (ListenStartMessage, RapidWindListenStartMessage)
+            if start
+            else (ListenStopMessage, RapidWindListenStopMessage)
+        )
+        requests: list[tuple[object, WebsocketRequest]] = []
+        for device_id in dict.fromkeys(device_ids):
+            requests.append((device_id, listen(device_id=device_id)))
+            if rapid_wind:
+                requests.append((device_id, rapid(device_id=device_id)))
+        return requests
+
+    async def _send_requests(
+        self, requests: list[tuple[object, WebsocketRequest]], timeout: float
+    ) -> SubscriptionResult:
+        acks = await self.send_many_and_wait(
+            (request for _, request in requests), timeout
+        )
+        result = SubscriptionResult()
+        for (device_id, request), ack in zip(requests, acks, strict=True):
+            if isinstance(ack, BaseException):
+                result.failed.setdefault(device_id, f"{request.type}: {ack!r}")
+            elif ack is None:
+                result.failed.setdefault(device_id, f"{request.type}: no ACK")
+        result.acknowledged = [
+            device_id
+            for device_id in dict.fromkeys(device_id for device_id, _ in requests)
+            if device_id not in result.failed
+        ]
+        return result
+
     async def stop_all_listeners(self):
         """
         Stop listening for all devices - waits for acknowledgement
         """
-        stop_tasks = []
-        for device_id in self.device_ids:
-            stop_tasks.extend(
-                [
-                    self.send_message_and_wait(ListenStopMessage(device_id=device_id)),
-                    self.send_message_and_wait(
-                        RapidWindListenStopMessage(device_id=device_id)
-                    ),
-                ]
-            )
-
-        if stop_tasks:
-            for task in stop_tasks:
-                await task
+        result = await self._send_bulk(self.device_ids, False, True, 5.0)
+        for device_id, reason in result.failed.items():
+            WS_LOGGER.warning(f"Failed to stop listening for {device_id}: {reason}")
 
         WS_LOGGER.debug("Stopped listening for all devices 🙉️")
 
@@ -316,7 +835,17 @@ class WeatherFlowWebsocketAPI:
         if not self.is_connected:
             return
 
-        await self.stop_all_listeners()
+        self._closing = True
+        self._close_requested.set()
+        if self.hub is not None or self.is_connected():
+            # Without a live socket (e.g. while reconnecting) no ACK could arrive.
+            await self.stop_all_listeners()
+
+        if self.hub is not None:
+            await self.hub.detach(self)
+            self.hub = None
+            self.websocket = None
+            self.listen_task = None
 
         # Cancel the listen task
         if self.listen_task and not self.listen_task.done():
@@ -330,6 +859,8 @@ class WeatherFlowWebsocketAPI:
             except Exception as e:
                 WS_LOGGER.error(f"Exception during listen task cancellation: {e}")
 
+        await self._close_dispatch()
+
         # Close the WebSocket connection
         if self.websocket:
             WS_LOGGER.debug(
@@ -348,5 +879,16 @@ class WeatherFlowWebsocketAPI:
                     WS_LOGGER.warning("WebSocket connection not closed")
                 self.websocket = None
 
+        if self.supervisor_task is not None and not self.supervisor_task.done():
+            try:
+                # Cancelled by wait_for if it does not stop in time, e.g. while a
+                # connection attempt is still pending.
+                await asyncio.wait_for(self.supervisor_task, timeout=timeout)
+            except TimeoutError:
+                WS_LOGGER.warning("Supervisor did not stop in time; cancelled it")
+            except Exception as e:
+                WS_LOGGER.error(f"Exception while stopping the supervisor: {e!r}")
+
         self.is_listening = False
+        await self._set_state(ConnectionState.CLOSED)
         WS_LOGGER.debug("WebSocket connection closed and resources cleaned up")